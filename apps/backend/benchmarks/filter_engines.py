@@ -0,0 +1,80 @@
+"""
+Row-wise vs columnar backend filtering on the `cmc_listings` fixture scaled up.
+
+Usage (from apps/backend):
+    python -m benchmarks.filter_engines [--rows 1000 10000 100000] [--repeat 5]
+"""
+
+import argparse
+import copy
+import time
+from typing import Any, Dict, List
+
+from src.utils.fixtures import load_fixture
+from src.utils.filtering.columnar import columnar_available
+from src.utils.filtering_engine import compile_filters
+
+FILTER_DESCRIPTORS = [
+    {"key": "name", "type": "string"},
+    {"key": "symbol", "type": "string"},
+    {"key": "cmc_rank", "type": "number"},
+    {"key": "price", "type": "number", "path": "quote.USD.price"},
+    {"key": "market_cap", "type": "number", "path": "quote.USD.market_cap"},
+]
+
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    "price range": {"price": {"gte": 1, "lte": 1000}},
+    "price + market cap": {"price": {"gt": 0.5}, "market_cap": {"gte": 1e9}},
+    "rank eq": {"cmc_rank": {"eq": 1}},
+    "symbol eq": {"symbol": "BTC"},
+    "price range + name contains": {
+        "price": {"gte": 1, "lte": 1000},
+        "name": {"contains": ["bit", "coin"]},
+    },
+}
+
+
+def scaled_items(rows: int) -> List[Dict[str, Any]]:
+    base = load_fixture("cmc_listings")["data"]
+    return [copy.deepcopy(base[i % len(base)]) for i in range(rows)]
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if not columnar_available():
+        raise SystemExit("NumPy is not installed; the columnar engine is unavailable")
+
+    print(
+        f"{'rows':>8}  {'scenario':<30} {'row ms':>9} {'columnar ms':>12} {'speedup':>8}"
+    )
+    for rows in args.rows:
+        items = scaled_items(rows)
+        for name, conditions in SCENARIOS.items():
+            plan = compile_filters(FILTER_DESCRIPTORS, conditions)
+            row = plan.apply(items, engine="row")
+            columnar = plan.apply(items, engine="columnar")
+            assert row == columnar, f"engines disagree on {name!r}"
+
+            row_s = best_of(args.repeat, lambda: plan.apply(items, engine="row"))
+            col_s = best_of(args.repeat, lambda: plan.apply(items, engine="columnar"))
+            print(
+                f"{rows:>8}  {name:<30} {row_s * 1e3:>9.2f} {col_s * 1e3:>12.2f} "
+                f"{row_s / col_s:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
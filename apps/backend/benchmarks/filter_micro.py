@@ -0,0 +1,276 @@
+"""
+Microbenchmarks of the filtering primitives on synthetic data, in ns/item.
+
+Covered:
+- handler/<op>: the two-argument handlers in OPERATORS_HANDLERS
+- bound/<op>: the same operators bound once via OPERATOR_BINDERS
+- match_single/<op>: one condition dict through `match_single`
+- apply_filters/<scenario>: descriptors + conditions through `apply_filters`
+  (row engine, values read at the given nesting depth)
+- extract_fields/<n>: a mapping of n fields at the given nesting depth,
+  via `extract_fields` (compiles per call) and `extract_compiled`
+
+Datasets are generated from a seed with a controlled number of items,
+nesting depth of the filtered / mapped values, string length and number
+of patterns for the string operators, so runs are comparable. `loop`
+is the cost of the bare benchmark loop, for reference.
+
+Usage (from apps/backend):
+    python -m benchmarks.filter_micro [--items 10000] [--depth 1 4]
+        [--string-length 8 64] [--patterns 1 4] [--repeat 5] [--only regex]
+    python -m benchmarks.filter_micro --save results.json
+    python -m benchmarks.filter_micro --compare results.json
+"""
+
+import argparse
+import json
+import random
+import string
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from src.utils.fields_mapping import compile_mapping, extract_compiled, extract_fields
+from src.utils.filtering_engine import (
+    OPERATOR_BINDERS,
+    OPERATORS_HANDLERS,
+    apply_filters,
+    match_single,
+)
+
+NUMERIC_OPS = ["eq", "neq", "gt", "gte", "lt", "lte"]
+STRING_OPS = ["contains", "startswith", "endswith", "regex"]
+MAPPED_FIELDS = [1, 8]
+
+# A benchmark body processes every item once; it is timed as a whole
+Body = Callable[[], Any]
+
+
+def nested_key(depth: int) -> List[str]:
+    """Path steps to a value `depth` levels deep: ["n1", ..., "n<depth-1>"]."""
+    return [f"n{level}" for level in range(1, depth)]
+
+
+def make_items(
+    count: int, depth: int, string_length: int, seed: int
+) -> List[Dict[str, Any]]:
+    """
+    `count` items whose `num`, `text` and `flag` values (plus a few siblings)
+    sit `depth` levels deep; depth 1 puts them at the top level.
+    """
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        leaf: Dict[str, Any] = {
+            "num": rng.uniform(0, 1000),
+            "text": "".join(rng.choices(string.ascii_lowercase, k=string_length)),
+            "flag": i % 2 == 0,
+        }
+        leaf.update({f"extra{n}": n for n in range(max(MAPPED_FIELDS) - 3)})
+        item = leaf
+        for step in reversed(nested_key(depth)):
+            item = {step: item, "sibling": i}
+        items.append(item)
+    return items
+
+
+def make_patterns(texts: List[str], count: int, seed: int) -> List[str]:
+    """`count` 3-letter patterns taken from the data, so some items match."""
+    rng = random.Random(seed)
+    patterns = []
+    for _ in range(count):
+        text = rng.choice(texts)
+        start = rng.randrange(max(1, len(text) - 2))
+        patterns.append(text[start : start + 3])
+    return patterns
+
+
+def leaf_path(depth: int, field: str) -> str:
+    return ".".join([*nested_key(depth), field])
+
+
+def leaf_values(items: List[Dict[str, Any]], depth: int, field: str) -> List[Any]:
+    values = []
+    for item in items:
+        for step in nested_key(depth):
+            item = item[step]
+        values.append(item[field])
+    return values
+
+
+def value_cases(
+    numbers: List[float], texts: List[str], patterns: List[str]
+) -> Iterator[Tuple[str, List[Any], Any]]:
+    """(op, values, operand) for every operator."""
+    for op in NUMERIC_OPS:
+        yield op, numbers, 500.0
+    operand: Any = patterns if len(patterns) > 1 else patterns[0]
+    for op in STRING_OPS:
+        yield op, texts, operand
+
+
+def value_benchmarks(
+    numbers: List[float], texts: List[str], patterns: List[str], numeric: bool
+) -> Iterator[Tuple[str, Body]]:
+    """Per-operator benchmarks; `numeric` adds the loop and numeric operators."""
+    if numeric:
+        yield "loop", lambda: [None for _ in numbers]
+    for op, values, operand in value_cases(numbers, texts, patterns):
+        if op in NUMERIC_OPS and not numeric:
+            continue
+        handler = OPERATORS_HANDLERS[op]
+        test = OPERATOR_BINDERS[op](operand)
+        cond = {op: operand}
+        yield (
+            f"handler/{op}",
+            lambda h=handler, v=values, o=operand: [h(x, o) for x in v],
+        )
+        yield f"bound/{op}", lambda t=test, v=values: [t(x) for x in v]
+        yield (
+            f"match_single/{op}",
+            lambda c=cond, v=values: [match_single(x, c) for x in v],
+        )
+
+
+def item_benchmarks(
+    items: List[Dict[str, Any]], depth: int, patterns: List[str], pattern_free: bool
+) -> Iterator[Tuple[str, Body]]:
+    """Whole-item benchmarks; `pattern_free` adds those that use no patterns."""
+    descriptors = [
+        {"key": "num", "type": "number", "path": leaf_path(depth, "num")},
+        {"key": "text", "type": "string", "path": leaf_path(depth, "text")},
+    ]
+    scenarios = {
+        "range": {"num": {"gte": 100, "lte": 900}},
+        "contains": {"text": {"contains": patterns}},
+        "range+regex": {"num": {"gte": 100}, "text": {"regex": patterns}},
+    }
+    for name, conditions in scenarios.items():
+        if name == "range" and not pattern_free:
+            continue
+        yield (
+            f"apply_filters/{name}",
+            lambda c=conditions: apply_filters(items, descriptors, c, engine="row"),
+        )
+
+    leaf_fields = ["num", "text", "flag"] + [
+        f"extra{n}" for n in range(max(MAPPED_FIELDS) - 3)
+    ]
+    if not pattern_free:
+        return
+    for count in MAPPED_FIELDS:
+        mapping = {f: leaf_path(depth, f) for f in leaf_fields[:count]}
+        compiled = compile_mapping(mapping)
+        yield (
+            f"extract_fields/{count}",
+            lambda m=mapping: [extract_fields(item, m) for item in items],
+        )
+        yield (
+            f"extract_compiled/{count}",
+            lambda c=compiled: [extract_compiled(item, c) for item in items],
+        )
+
+
+def ns_per_item(body: Body, items: int, repeat: int) -> float:
+    """Best of `repeat` runs, divided by the number of items."""
+    body()  # warm caches (compiled expressions, regexes)
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        body()
+        best = min(best, time.perf_counter_ns() - started)
+    return best / items
+
+
+def run(args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    """
+    Results keyed by "<benchmark> depth=.. strlen=.. patterns=..".
+    Each benchmark only runs over the dimensions it depends on, at the
+    first value of the others: operators do not read through the item
+    (first --depth), numeric ones ignore strings (first --string-length,
+    --patterns), and range filters / field extraction ignore patterns.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+
+    def record(name: str, body: Body, depth: int, length: int, count: int) -> None:
+        if args.only and args.only not in name:
+            return
+        key = f"{name} depth={depth} strlen={length} patterns={count}"
+        results[key] = {
+            "benchmark": name,
+            "depth": depth,
+            "string_length": length,
+            "patterns": count,
+            "ns_per_item": round(ns_per_item(body, args.items, args.repeat), 1),
+        }
+
+    for depth in args.depth:
+        for length in args.string_length:
+            items = make_items(args.items, depth, length, args.seed)
+            texts = leaf_values(items, depth, "text")
+            numbers = leaf_values(items, depth, "num")
+            for count in args.patterns:
+                patterns = make_patterns(texts, count, args.seed)
+                first_count = count == args.patterns[0]
+                if depth == args.depth[0]:
+                    numeric = first_count and length == args.string_length[0]
+                    for name, body in value_benchmarks(
+                        numbers, texts, patterns, numeric
+                    ):
+                        record(name, body, depth, length, count)
+                for name, body in item_benchmarks(items, depth, patterns, first_count):
+                    record(name, body, depth, length, count)
+    return results
+
+
+def print_report(
+    results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]]
+) -> None:
+    header = (
+        f"{'benchmark':<26} {'depth':>5} {'strlen':>6} {'patterns':>8} {'ns/item':>10}"
+    )
+    print(header + (f" {'baseline':>10} {'change':>8}" if baseline else ""))
+    for key, result in results.items():
+        line = (
+            f"{result['benchmark']:<26} {result['depth']:>5} "
+            f"{result['string_length']:>6} {result['patterns']:>8} "
+            f"{result['ns_per_item']:>10.1f}"
+        )
+        base = baseline.get(key)
+        if base:
+            change = result["ns_per_item"] / base["ns_per_item"] - 1
+            line += f" {base['ns_per_item']:>10.1f} {change:>+8.1%}"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--depth", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--string-length", type=int, nargs="+", default=[8, 64])
+    parser.add_argument("--patterns", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", help="run benchmarks whose name contains this")
+    parser.add_argument("--save", type=Path, help="write results as JSON")
+    parser.add_argument(
+        "--compare", type=Path, help="JSON from an earlier --save to compare to"
+    )
+    args = parser.parse_args()
+    if min(args.depth) < 1 or min(args.string_length) < 3 or min(args.patterns) < 1:
+        parser.error("--depth and --patterns must be >= 1, --string-length >= 3")
+
+    results = run(args)
+    baseline = json.loads(args.compare.read_text()) if args.compare else {}
+    print(f"{args.items} items, best of {args.repeat}")
+    print_report(results, baseline)
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"results saved to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Cold import time and memory of the backend application module.
+
+Each run imports the module in a fresh interpreter (what every worker
+pays at startup) and reports wall time and peak RSS. With --check the
+script exits non-zero when the median import time exceeds the budget,
+or when importing loaded any fixture (fixtures must stay lazy).
+
+Usage (from apps/backend, with the app's environment / .env available):
+    python -m benchmarks.import_time [--module src.main] [--runs 5]
+    python -m benchmarks.import_time --check [--budget-ms 1500]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Median cold import time allowed by --check
+BUDGET_MS = 1500.0
+
+PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+__import__({module!r})
+elapsed_ms = (time.perf_counter() - started) * 1000
+from src.utils.fixtures import load_fixture
+print(json.dumps({{
+    "import_ms": elapsed_ms,
+    "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "fixtures_loaded": load_fixture.cache_info().currsize,
+}}))
+"""
+
+
+def measure(module: str) -> dict:
+    """
+    Import `module` in a fresh interpreter.
+
+    Returns:
+        {"import_ms": ..., "max_rss_kib": ..., "fixtures_loaded": ...}
+
+    Raises:
+        RuntimeError: if the import failed, with the child's stderr
+    """
+    try:
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Importing {module} failed:\n{e.stderr}") from e
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="src.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(args.runs)]
+    import_ms = statistics.median(run["import_ms"] for run in runs)
+    rss_mib = statistics.median(run["max_rss_kib"] for run in runs) / 1024
+    fixtures_loaded = max(run["fixtures_loaded"] for run in runs)
+
+    print(f"module: {args.module} ({args.runs} cold runs, median)")
+    print(f"import time: {import_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"peak RSS:    {rss_mib:.1f} MiB")
+    print(f"fixtures loaded at import: {fixtures_loaded}")
+
+    if args.check:
+        failures = []
+        if import_ms > args.budget_ms:
+            failures.append(f"import time {import_ms:.1f} ms > {args.budget_ms} ms")
+        if fixtures_loaded:
+            failures.append("fixtures were loaded at import time")
+        if failures:
+            print("FAIL: " + "; ".join(failures))
+            sys.exit(1)
+        print("OK")
+
+
+if __name__ == "__main__":
+    main()
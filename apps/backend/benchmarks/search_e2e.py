@@ -0,0 +1,294 @@
+"""
+End-to-end /search/{source_id} benchmark: the FastAPI app on a scratch SQLite
+database, driven in-process over ASGI, with an in-process stub upstream that
+serves the `cmc_listings` fixture scaled to 100 / 10k / 100k rows.
+
+For every (rows, filter scenario) pair it reports throughput (req/s),
+latency percentiles under concurrency, the median per-stage breakdown
+from the responses' Server-Timing header (fetch, filter, map, decorate,
+serialize) and peak traced memory of a single request.
+Results can be saved as a baseline and later checked against it.
+
+Usage (from apps/backend):
+    python -m benchmarks.search_e2e [--rows 100 10000 100000] [--concurrency 8]
+        [--requests 40] [--limit 100] [--include-raw]
+    python -m benchmarks.search_e2e --save-baseline
+    python -m benchmarks.search_e2e --check [--tolerance 0.25]
+
+Baselines are machine specific. benchmarks/baselines/search_e2e.json is a
+reference recorded on a development machine (default options); record a new
+one with --save-baseline on the machine that runs --check.
+"""
+
+import os
+import tempfile
+
+# The app reads its settings at import time: point it at a scratch SQLite file
+_DB_PATH = os.path.join(tempfile.gettempdir(), "openlense_search_e2e.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_PATH}"
+os.environ["DB_TYPE"] = "sqlite"
+os.environ["DEBUG"] = "false"
+os.environ.setdefault("CMC_API_KEY", "benchmark")
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import httpx
+
+from src.db.database import init_db
+from src.main import app
+from src.utils.fixtures import load_fixture
+from src.utils.http import set_http_client
+from src.utils.serialization import dumps
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "search_e2e.json"
+STUB_HOST = "http://stub-upstream"
+
+SOURCE_TEMPLATE: Dict[str, Any] = {
+    "method": "GET",
+    "mapping": {"name": "name", "price": "quote.USD.price"},
+    "backend_filters": [
+        {"key": "name", "type": "string"},
+        {"key": "symbol", "type": "string"},
+        {"key": "cmc_rank", "type": "number"},
+        {"key": "num_market_pairs", "type": "number"},
+    ],
+}
+
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    "no filters": {},
+    "rank range": {"cmc_rank": {"gte": 10, "lte": 5_000}},
+    "name contains": {"name": {"contains": ["bit", "coin"]}},
+    "mixed": {
+        "cmc_rank": {"lte": 50_000},
+        "num_market_pairs": {"gt": 100},
+        "symbol": {"neq": "BTC"},
+    },
+}
+
+
+def scaled_payload(rows: int) -> bytes:
+    """A `cmc_listings`-shaped body with `rows` records (distinct ids/names/ranks)."""
+    base = load_fixture("cmc_listings")["data"]
+    data = []
+    for i in range(rows):
+        item = base[i % len(base)]
+        data.append(dict(item, id=i + 1, name=f"{item['name']} {i}", cmc_rank=i + 1))
+    return dumps({"status": {"error_code": 0, "total_count": rows}, "data": data})
+
+
+def stub_upstream(sizes: List[int]) -> httpx.MockTransport:
+    """Serves GET /listings/<rows> from pre-encoded bodies."""
+    bodies = {rows: scaled_payload(rows) for rows in sizes}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        rows = int(request.url.path.rsplit("/", 1)[-1])
+        return httpx.Response(
+            200,
+            content=bodies[rows],
+            headers={"content-type": "application/json"},
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def parse_server_timing(header: str) -> Dict[str, float]:
+    """{"fetch": 12.4, ...} from `fetch;dur=12.4;desc="...", filter;dur=0.8, ...`."""
+    stages: Dict[str, float] = {}
+    for metric in header.split(","):
+        name, *params = (part.strip() for part in metric.split(";"))
+        for param in params:
+            if param.startswith("dur="):
+                stages[name] = float(param[4:])
+    return stages
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    index = min(len(sorted_values) - 1, round(pct / 100 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    url: str,
+    body: Dict[str, Any],
+    concurrency: int,
+    requests: int,
+) -> Tuple[float, List[float], List[Dict[str, float]]]:
+    """
+    Send `requests` searches from `concurrency` workers.
+
+    Returns:
+        (elapsed s, latencies ms, Server-Timing stages ms of each response)
+    """
+    remaining = iter(range(requests))
+    latencies: List[float] = []
+    stages: List[Dict[str, float]] = []
+
+    async def worker() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            resp = await client.post(url, json=body)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if resp.status_code != 200:
+                raise RuntimeError(f"{url}: HTTP {resp.status_code} {resp.text[:200]}")
+            if "server-timing" in resp.headers:
+                stages.append(parse_server_timing(resp.headers["server-timing"]))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, latencies, stages
+
+
+def median_stages(samples: List[Dict[str, float]]) -> Dict[str, float]:
+    """Median of each stage over the responses (empty when timing is off)."""
+    names = list(samples[0]) if samples else []
+    return {
+        name: round(statistics.median(s.get(name, 0.0) for s in samples), 3)
+        for name in names
+    }
+
+
+async def peak_memory_mib(
+    client: httpx.AsyncClient, url: str, body: Dict[str, Any]
+) -> float:
+    tracemalloc.start()
+    try:
+        await client.post(url, json=body)
+        return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    finally:
+        tracemalloc.stop()
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    if os.path.exists(_DB_PATH):
+        os.remove(_DB_PATH)
+    await init_db()
+    set_http_client(httpx.AsyncClient(transport=stub_upstream(args.rows)))
+
+    results: Dict[str, Dict[str, Any]] = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        for rows in args.rows:
+            source = dict(
+                SOURCE_TEMPLATE,
+                name=f"stub {rows}",
+                endpoint=f"{STUB_HOST}/listings/{rows}",
+            )
+            resp = await client.post("/sources/", json=source)
+            resp.raise_for_status()
+            source_id = resp.json()["id"]
+            url = f"/search/{source_id}"
+
+            for scenario, default_filters in SCENARIOS.items():
+                body: Dict[str, Any] = {
+                    "filters": {"default_filters": default_filters},
+                    "include_raw": args.include_raw,
+                }
+                if args.limit:
+                    body["limit"] = args.limit
+
+                await drive(client, url, body, 1, min(3, args.requests))  # warm up
+                elapsed, latencies, stages = await drive(
+                    client, url, body, args.concurrency, args.requests
+                )
+                latencies.sort()
+                results[f"{rows}/{scenario}"] = {
+                    "rows": rows,
+                    "scenario": scenario,
+                    "req_per_s": round(len(latencies) / elapsed, 2),
+                    "p50_ms": round(percentile(latencies, 50), 3),
+                    "p95_ms": round(percentile(latencies, 95), 3),
+                    "p99_ms": round(percentile(latencies, 99), 3),
+                    "mean_ms": round(statistics.fmean(latencies), 3),
+                    "stages_ms": median_stages(stages),
+                    "peak_mib": round(await peak_memory_mib(client, url, body), 2),
+                }
+    return results
+
+
+def print_report(results: Dict[str, Dict[str, Any]]) -> None:
+    print(
+        f"{'rows':>7} {'scenario':<14} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'p99 ms':>9} {'peak MiB':>9}  median stage ms (Server-Timing)"
+    )
+    for result in results.values():
+        stages = " ".join(
+            f"{name}={ms:.2f}" for name, ms in result["stages_ms"].items()
+        )
+        print(
+            f"{result['rows']:>7} {result['scenario']:<14} {result['req_per_s']:>8.1f} "
+            f"{result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} {result['p99_ms']:>9.2f} "
+            f"{result['peak_mib']:>9.1f}  {stages}"
+        )
+
+
+def check(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float,
+) -> List[str]:
+    """Regressions beyond `tolerance` in throughput or p95 latency."""
+    failures = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if result["req_per_s"] < base["req_per_s"] * (1 - tolerance):
+            failures.append(
+                f"{key}: {result['req_per_s']} req/s < baseline {base['req_per_s']}"
+            )
+        if result["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            failures.append(
+                f"{key}: p95 {result['p95_ms']} ms > baseline {base['p95_ms']}"
+            )
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument(
+        "--limit", type=int, default=100, help="results per search (0: all)"
+    )
+    parser.add_argument("--include-raw", action="store_true")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print_report(results)
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"baseline saved to {args.baseline}")
+
+    if args.check:
+        if not args.baseline.exists():
+            print(f"no baseline at {args.baseline}; run with --save-baseline first")
+            sys.exit(2)
+        failures = check(results, json.loads(args.baseline.read_text()), args.tolerance)
+        if failures:
+            print("REGRESSIONS:\n  " + "\n  ".join(failures))
+            sys.exit(1)
+        print(f"OK: within {args.tolerance:.0%} of baseline")
+
+
+if __name__ == "__main__":
+    main()
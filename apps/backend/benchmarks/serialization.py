@@ -0,0 +1,95 @@
+"""
+/search response serialization: pydantic SearchResponse path vs FastJSONResponse.
+
+The pydantic path mirrors what search_source used to do: build
+SearchResponse(results=...) in the route, then let the response_model
+validate/dump it again before JSONResponse encodes it.
+
+Usage (from apps/backend):
+    python -m benchmarks.serialization [--rows 100 1000 10000] [--raw-scale 1 10]
+"""
+
+import argparse
+import copy
+import time
+from typing import Any, Dict, List
+
+from fastapi.responses import JSONResponse
+
+from src.models.search import SearchResponse
+from src.utils.fixtures import load_fixture
+from src.utils.serialization import FastJSONResponse, orjson, unified_results
+
+
+def build_results(rows: int, raw_scale: int) -> List[Dict[str, Any]]:
+    base = load_fixture("cmc_listings")["data"]
+    results = []
+    for i in range(rows):
+        raw = copy.deepcopy(base[i % len(base)])
+        # Grow the raw payload the way long CMC tag lists / quote trees do
+        raw["tags"] = raw.get("tags", []) * raw_scale
+        raw["quote"] = {
+            f"{currency}{n}": quote
+            for n in range(raw_scale)
+            for currency, quote in raw.get("quote", {}).items()
+        }
+        results.append(
+            {
+                "id": str(raw["id"]),
+                "name": raw["name"],
+                "url": "#",
+                "price": 1.5,
+                "raw": raw,
+            }
+        )
+    return results
+
+
+def pydantic_path(results: List[Dict[str, Any]]) -> bytes:
+    response = SearchResponse(results=results)
+    content = SearchResponse.model_validate(response.model_dump()).model_dump(
+        mode="json"
+    )
+    return JSONResponse(content).body
+
+
+def fast_path(results: List[Dict[str, Any]]) -> bytes:
+    return FastJSONResponse(unified_results(results)).body
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--raw-scale", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    encoder = "orjson" if orjson is not None else "json (orjson not installed)"
+    print(f"fast path encoder: {encoder}")
+    print(
+        f"{'rows':>8} {'raw x':>6} {'body KiB':>9} {'pydantic ms':>12} "
+        f"{'fast ms':>9} {'speedup':>8}"
+    )
+    for rows in args.rows:
+        for raw_scale in args.raw_scale:
+            results = build_results(rows, raw_scale)
+            size_kib = len(fast_path(results)) / 1024
+            slow_s = best_of(args.repeat, lambda: pydantic_path(results))
+            fast_s = best_of(args.repeat, lambda: fast_path(results))
+            print(
+                f"{rows:>8} {raw_scale:>6} {size_kib:>9.0f} {slow_s * 1e3:>12.2f} "
+                f"{fast_s * 1e3:>9.2f} {slow_s / fast_s:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -7,7 +8,38 @@ class Settings(BaseSettings):
     cmc_api_key: str
     db_type: str
     debug: bool = True
-    
+    # Fraction of searches (0.0-1.0) whose backend filtering is traced and logged
+    filter_trace_sample_rate: float = 0.0
+    # Shared outbound HTTP client (connection pool to upstream APIs)
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_timeout: float = 10.0
+    http2: bool = False
+    # Upstream transport: "passthrough" (network), "record" (network + save
+    # responses as fixtures) or "replay" (recorded fixtures only, no network)
+    upstream_transport: Literal["passthrough", "record", "replay"] = "passthrough"
+    upstream_fixtures_dir: str = "fixtures/upstream"
+    # Replay mode fault injection
+    upstream_replay_latency_ms: float = 0.0
+    upstream_replay_jitter_ms: float = 0.0
+    upstream_replay_error_rate: float = 0.0
+    upstream_replay_error_status: int = 503
+    upstream_replay_seed: Optional[int] = None
+    # Upstream responses kept in memory (TTLs are configured per source)
+    upstream_cache_max_entries: int = 256
+    # Seconds a cached source config is trusted before its version is re-checked
+    source_cache_revalidate_seconds: float = 5.0
+    # Parse large upstream bodies incrementally (needs ijson) for sources without
+    # a response cache, so memory is bounded by item size rather than payload size
+    upstream_stream_parse: bool = False
+    upstream_stream_min_bytes: int = 1_048_576
+    # Per-source time budget of multi-source searches (slower sources are reported as timed out)
+    fanout_source_timeout_seconds: float = 10.0
+    # Per-stage search timings: Server-Timing response header and the
+    # histograms served at GET /search/metrics
+    search_timing: bool = True
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -1,4 +1,4 @@
-from src.types import QueryParamDescriptor, FilterDescriptor
+from src.types import QueryParamDescriptor, FilterDescriptor, PaginationDescriptor
 from sqlmodel import SQLModel, Field
 from sqlalchemy import Column, DateTime, func, JSON
 from datetime import datetime
@@ -19,8 +19,23 @@ class Source(SQLModel, table=True):
     backend_filters: Optional[List[FilterDescriptor]] = Field(
         default_factory=list, sa_column=Column(JSON)
     )
+    # JMESPath to the records in a response body; None unwraps list/"data"/object
+    records_path: Optional[str] = Field(default=None)
+    # Serve this bundled fixture (src/fixtures/<name>.json) instead of calling
+    # the endpoint ("replay" upstream); None calls the live endpoint
+    replay_fixture: Optional[str] = Field(default=None)
+    # How to walk the upstream's pages; None fetches a single page
+    pagination: Optional[PaginationDescriptor] = Field(
+        default=None, sa_column=Column(JSON)
+    )
     is_active: bool = Field(default=True)
     auth_required: bool = Field(default=False)
+    # Upstream response caching (seconds); None/0 disables the cache
+    cache_ttl_seconds: Optional[int] = Field(default=None)
+    # How long an expired response may still be served while it is refreshed
+    cache_stale_seconds: Optional[int] = Field(default=None)
+    # Bumped on every update so cached configs can be revalidated cheaply
+    version: int = Field(default=1)
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     created_at: datetime = Field(
         sa_column=Column(
@@ -1,15 +1,28 @@
 from fastapi import FastAPI
+from src.core.logging import setup_logging
 from src.db.database import init_db
+from src.utils.http import close_http_client, get_http_client
+from src.routers.search import router as search_router
 from src.routers.sources import router as sources_router
 
+# INFO records of the services (e.g. debug filter traces) need a handler
+setup_logging()
+
 app = FastAPI(title="OpenLense Backend")
 app.include_router(sources_router)
+app.include_router(search_router)
 
 
 @app.on_event("startup")
 async def on_startup():
-    init_db()
+    await init_db()
     print("Database initialized")
+    get_http_client()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await close_http_client()
 
 
 @app.get("/health", tags=["Health"])
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Literal, Optional
+from uuid import UUID
 from src.db.schemas import ORMBaseModel
 
 
@@ -54,6 +55,20 @@ class FiltersPayload(BaseModel):
     )
 
 
+class SortSpec(BaseModel):
+    """
+    Server-side ordering of search results.
+
+    Attributes:
+        field: A mapped field (e.g. "price") or a JMESPath path into the raw
+            upstream item (e.g. "quote.USD.market_cap")
+        order: "asc" or "desc"; items without a value always come last
+    """
+
+    field: str = Field(..., min_length=1, examples=["quote.USD.market_cap"])
+    order: Literal["asc", "desc"] = "asc"
+
+
 class SearchRequest(BaseModel):
     """
     Search request payload for querying external data sources.
@@ -83,6 +98,74 @@ class SearchRequest(BaseModel):
         default_factory=FiltersPayload,
         description="Filter configuration with backend and API filters",
     )
+    debug: bool = Field(
+        False,
+        description="Trace backend filtering for this request (per-condition pass/fail counts and timings are logged)",
+    )
+    fields: Optional[List[Literal["id", "name", "url", "price"]]] = Field(
+        None,
+        description="Unified fields to return for each item (id is always included). All fields when omitted.",
+        examples=[["name", "price"]],
+    )
+    include_raw: bool = Field(
+        True,
+        description="Attach the original upstream object as `raw` to each item",
+    )
+    sort: Optional[SortSpec] = Field(
+        None,
+        description="Order results by a mapped field or raw path before paging",
+        examples=[{"field": "quote.USD.market_cap", "order": "desc"}],
+    )
+    limit: Optional[int] = Field(
+        None, ge=1, description="Maximum number of results to return"
+    )
+    offset: int = Field(0, ge=0, description="Number of results to skip")
+    cursor: Optional[str] = Field(
+        None,
+        description="`next_cursor` of a previous response; takes precedence over offset",
+    )
+
+
+class MultiSearchRequest(BaseModel):
+    """
+    Search request run against several sources at once.
+
+    Filters, projection and sort have the same meaning as in SearchRequest and
+    are applied to every source; `limit` is applied per source and to the
+    merged list.
+    """
+
+    filters: FiltersPayload = Field(
+        default_factory=FiltersPayload,
+        description="Filter configuration with backend and API filters, sent to every source",
+    )
+    source_ids: Optional[List[UUID]] = Field(
+        None, description="Sources to query. All active sources when omitted."
+    )
+    debug: bool = Field(False, description="Trace backend filtering for each source")
+    fields: Optional[List[Literal["id", "name", "url", "price"]]] = Field(
+        None,
+        description="Unified fields to return for each item (id is always included). All fields when omitted.",
+    )
+    include_raw: bool = Field(
+        True,
+        description="Attach the original upstream object as `raw` to each item",
+    )
+    sort: Optional[SortSpec] = Field(
+        None,
+        description="Order each source's results, and rank the merged list, by this field",
+    )
+    limit: Optional[int] = Field(
+        None, ge=1, description="Maximum number of results per source and merged"
+    )
+    timeout_seconds: Optional[float] = Field(
+        None,
+        gt=0,
+        description="Per-source time budget; server default when omitted",
+    )
+    merge: bool = Field(
+        False, description="Also return all sources' results as one ranked list"
+    )
 
 
 """
@@ -111,14 +194,17 @@ class UnifiedSearchItem(BaseModel):
         name: Display name of the item
         url: Link to the item's detail page or resource
         price: Numeric price value if applicable
-        raw: Original raw data from the source API for reference
+        raw: Original raw data from the source API for reference (omitted when
+            the request sets include_raw to false)
     """
 
     id: str = Field(..., description="Unique identifier for the item")
     name: Optional[str] = Field(None, description="Display name of the item")
     url: Optional[str] = Field(None, description="URL to the item's page or resource")
     price: Optional[float] = Field(None, description="Price value if applicable")
-    raw: Dict[str, Any] = Field(..., description="Original raw data from source API")
+    raw: Optional[Dict[str, Any]] = Field(
+        None, description="Original raw data from source API"
+    )
 
 
 """
@@ -138,3 +224,45 @@ class SearchResponse(ORMBaseModel):
     results: List[UnifiedSearchItem] = Field(
         ..., description="List of unified search results from the queried source"
     )
+    total: Optional[int] = Field(
+        None, description="Number of items matching the filters, before paging"
+    )
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page when more results are available"
+    )
+
+
+class SourceSearchResult(BaseModel):
+    """
+    Outcome of one source within a multi-source search.
+
+    A failed or timed out source carries its `status` and `error` and no
+    results; the other sources are unaffected.
+    """
+
+    source_id: UUID = Field(..., description="Queried source")
+    name: Optional[str] = Field(None, description="Source name")
+    status: Literal["ok", "timeout", "error"] = Field(
+        ..., description="Whether the source answered in time"
+    )
+    error: Optional[str] = Field(None, description="Failure description")
+    elapsed_ms: float = Field(..., description="Time spent on this source")
+    total: Optional[int] = Field(
+        None, description="Number of items matching the filters at this source"
+    )
+    results: List[UnifiedSearchItem] = Field(
+        default_factory=list, description="Unified results from this source"
+    )
+
+
+class MultiSearchResponse(BaseModel):
+    """
+    Per-source results of a multi-source search, plus the optional merged list.
+    """
+
+    sources: List[SourceSearchResult] = Field(
+        ..., description="One entry per queried source"
+    )
+    merged: Optional[List[UnifiedSearchItem]] = Field(
+        None, description="Results of all sources combined (when merge is true)"
+    )
@@ -1,9 +1,10 @@
 from datetime import datetime
 from typing import Annotated, Optional, Dict, Any, Literal, List
 from uuid import UUID
-from pydantic import BaseModel, StringConstraints
+from pydantic import BaseModel, Field, StringConstraints
 from src.db.schemas import ORMBaseModel
-from src.types import QueryParamDescriptor, FilterDescriptor
+from src.types import QueryParamDescriptor, FilterDescriptor, PaginationDescriptor
+from src.utils.fixtures import FIXTURE_NAME_PATTERN
 
 
 """
@@ -29,9 +30,16 @@ class SourceBase(BaseModel):
     api_filters: Optional[List[QueryParamDescriptor]] = None
     backend_filters: Optional[List[FilterDescriptor]] = None
     mapping: Dict[str, Any]
+    records_path: Optional[Annotated[str, StringConstraints(max_length=255)]] = None
+    replay_fixture: Optional[
+        Annotated[str, StringConstraints(pattern=FIXTURE_NAME_PATTERN, max_length=100)]
+    ] = None
+    pagination: Optional[PaginationDescriptor] = None
     # description: Optional[Annotated[str, StringConstraints(max_length=500)]] = None
     is_active: bool = True
     auth_required: bool = False
+    cache_ttl_seconds: Optional[Annotated[int, Field(ge=0)]] = None
+    cache_stale_seconds: Optional[Annotated[int, Field(ge=0)]] = None
 
 
 """
@@ -62,9 +70,16 @@ class SourceUpdate(BaseModel):
     api_filters: Optional[List[QueryParamDescriptor]] = None
     backend_filters: Optional[List[FilterDescriptor]] = None
     mapping: Optional[Dict[str, Any]] = None
+    records_path: Optional[Annotated[str, StringConstraints(max_length=255)]] = None
+    replay_fixture: Optional[
+        Annotated[str, StringConstraints(pattern=FIXTURE_NAME_PATTERN, max_length=100)]
+    ] = None
+    pagination: Optional[PaginationDescriptor] = None
     description: Optional[Annotated[str, StringConstraints(max_length=500)]] = None
     is_active: Optional[bool] = None
     auth_required: Optional[bool] = None
+    cache_ttl_seconds: Optional[Annotated[int, Field(ge=0)]] = None
+    cache_stale_seconds: Optional[Annotated[int, Field(ge=0)]] = None
 
 
 """
@@ -81,10 +96,16 @@ class SourceResponse(ORMBaseModel):
     api_filters: Optional[List[QueryParamDescriptor]] = None
     backend_filters: Optional[List[FilterDescriptor]] = None
     mapping: Dict[str, Any]
+    records_path: Optional[Annotated[str, StringConstraints(max_length=255)]] = None
+    replay_fixture: Optional[str] = None
+    pagination: Optional[PaginationDescriptor] = None
     description: Optional[Annotated[str, StringConstraints(max_length=500)]] = None
     created_at: datetime
     updated_at: datetime
     is_active: bool = True
     auth_required: bool = False
+    cache_ttl_seconds: Optional[int] = None
+    cache_stale_seconds: Optional[int] = None
+    version: int = 1
     updated_at: Optional[datetime] = None
     created_at: Optional[datetime] = None
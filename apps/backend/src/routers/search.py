@@ -1,13 +1,44 @@
-from fastapi import APIRouter, status, Depends, HTTPException
-from typing import Annotated
-from src.models.search import SearchRequest, SearchResponse
+from fastapi import APIRouter, status, Depends, HTTPException, Header, Query
+from fastapi.responses import StreamingResponse
+from typing import Annotated, Any, Dict, Iterator, Optional, Tuple
+from src.core.config import settings
+from src.models.search import (
+    MultiSearchRequest,
+    MultiSearchResponse,
+    SearchRequest,
+    SearchResponse,
+)
+from src.services.multi_search import merge_results, search_sources
 from src.services.sources import SourceService
-from src.services.search import SearchService
+from src.utils.paging import decode_cursor, encode_cursor
+from src.utils.timing import search_metrics
+from src.utils.serialization import (
+    FastJSONResponse,
+    dumps,
+    output_fields,
+    to_unified_dict,
+    unified_results,
+)
 from uuid import UUID
+import time
 import traceback
 
 router = APIRouter(prefix="/search", tags=["Search"])
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _ndjson_lines(
+    results: Iterator[Dict[str, Any]], fields: Tuple[str, ...]
+) -> Iterator[bytes]:
+    """One UnifiedSearchItem JSON document per line."""
+    try:
+        for item in results:
+            yield dumps(to_unified_dict(item, fields)) + b"\n"
+    except Exception:
+        # Headers are already sent; log and end the stream early
+        print(traceback.format_exc())
+
 
 @router.post(
     "/{source_id}",
@@ -41,6 +72,17 @@ router = APIRouter(prefix="/search", tags=["Search"])
     
     **Response:**
     Returns unified items with standard fields (id, name, url, price) plus raw data from the source.
+
+    **Streaming:**
+    Send `Accept: application/x-ndjson` or `?stream=true` to receive one item per line
+    as soon as it is filtered and mapped, instead of a single `{"results": [...]}` document.
+
+    **Timings:**
+    The `Server-Timing` header reports the duration of each stage (fetch, filter,
+    map, decorate, serialize) with item counts, upstream bytes and attempts.
+    Streamed responses only report the fetch, as the header is sent before mapping,
+    and leave the header out when a paginated or streamed upstream was not read to
+    the end, as the fetch would only cover part of it.
     """,
     summary="Search Items from Source",
     responses={
@@ -59,7 +101,10 @@ router = APIRouter(prefix="/search", tags=["Search"])
                             }
                         ]
                     }
-                }
+                },
+                NDJSON_MEDIA_TYPE: {
+                    "example": '{"id": "1", "name": "Bitcoin", "url": "#", "price": 45000.5, "raw": {}}\n'
+                },
             },
         },
         400: {"description": "Invalid source ID"},
@@ -70,21 +115,69 @@ async def search_source(
     source_id: UUID,
     payload: SearchRequest,
     sourceService: Annotated[SourceService, Depends(SourceService)],
+    stream: Annotated[
+        bool, Query(description="Stream results as NDJSON, one item per line")
+    ] = False,
+    accept: Annotated[Optional[str], Header()] = None,
     # searchService=Depends(SearchService),
 ):
     try:
-        source = await sourceService.get_source_by_id(source_id)
+        searchService = await sourceService.get_search_service(source_id)
 
-        if source is None:
+        if searchService is None:
             raise HTTPException(status_code=400, detail="Invalid source ID")
 
-        searchService = SearchService(source.model_dump())
         default_filters = (
             payload.filters.default_filters if payload and payload.filters else {}
         )
         api_filters = payload.filters.api_filters if payload and payload.filters else {}
-        results = await searchService.fetch_and_process(default_filters, api_filters)
-        return SearchResponse(results=results)
+        fields = output_fields(payload.fields, payload.include_raw)
+        try:
+            offset = decode_cursor(payload.cursor) if payload.cursor else payload.offset
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        streaming = stream or bool(accept and NDJSON_MEDIA_TYPE in accept)
+
+        results = await searchService.iter_results(
+            default_filters,
+            api_filters,
+            debug=payload.debug,
+            stream=streaming,
+            fields=payload.fields,
+            include_raw=payload.include_raw,
+            sort=payload.sort,
+            limit=payload.limit,
+            offset=offset,
+        )
+
+        timings = results.timings
+        if streaming:
+            return StreamingResponse(
+                _ndjson_lines(iter(results), fields),
+                media_type=NDJSON_MEDIA_TYPE,
+                headers=(
+                    {"Server-Timing": timings.server_timing(("fetch",))}
+                    if timings is not None and timings.upstream_complete
+                    else None
+                ),
+            )
+
+        # Items are built by SearchService, so they are serialized directly
+        # instead of being validated into SearchResponse and re-encoded
+        content = unified_results(results, fields)
+        content["total"] = results.total
+        content["next_cursor"] = (
+            encode_cursor(results.next_offset)
+            if results.next_offset is not None
+            else None
+        )
+        if timings is None:
+            return FastJSONResponse(content)
+        started = time.perf_counter_ns()
+        response = FastJSONResponse(content)
+        timings.add_time("serialize", time.perf_counter_ns() - started)
+        response.headers["Server-Timing"] = timings.server_timing()
+        return response
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -92,3 +185,88 @@ async def search_source(
         print(f"Error during search: {e}")
         # Catch any other unexpected exceptions
         raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post(
+    "",
+    response_model=MultiSearchResponse,
+    status_code=status.HTTP_200_OK,
+    description="""
+    Search all active sources (or the given `source_ids`) at once.
+
+    Sources are queried concurrently, each within its own time budget
+    (`timeout_seconds`, server default otherwise), so the response arrives as
+    soon as the slowest source answers or times out. A source that fails or
+    times out is reported with `status` "error"/"timeout" and does not fail
+    the request.
+
+    Filters, `fields`, `include_raw`, `sort` and `limit` behave as in
+    `POST /search/{source_id}` and apply to every source. With `merge: true`
+    the response also contains `merged`: all sources' results in one list,
+    ranked by `sort` when given.
+    """,
+    summary="Search Items Across Sources",
+    responses={500: {"description": "Internal server error during search"}},
+)
+async def search_all_sources(
+    payload: MultiSearchRequest,
+    sourceService: Annotated[SourceService, Depends(SourceService)],
+):
+    try:
+        services = await sourceService.get_active_search_services(payload.source_ids)
+        outcomes = await search_sources(
+            services,
+            payload.filters.default_filters,
+            payload.filters.api_filters,
+            timeout=payload.timeout_seconds or settings.fanout_source_timeout_seconds,
+            debug=payload.debug,
+            fields=payload.fields,
+            sort=payload.sort,
+            limit=payload.limit,
+        )
+
+        fields = output_fields(payload.fields, payload.include_raw)
+        content: Dict[str, Any] = {
+            "sources": [
+                {
+                    "source_id": outcome.source_id,
+                    "name": outcome.name,
+                    "status": outcome.status,
+                    "error": outcome.error,
+                    "elapsed_ms": round(outcome.elapsed_ms, 3),
+                    "total": outcome.total,
+                    "results": [
+                        to_unified_dict(item, fields) for item in outcome.results
+                    ],
+                }
+                for outcome in outcomes
+            ],
+            "merged": None,
+        }
+        if payload.merge:
+            content["merged"] = [
+                to_unified_dict(item, fields)
+                for item in merge_results(outcomes, payload.sort, payload.limit)
+            ]
+        return FastJSONResponse(content)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        print(traceback.format_exc())
+        print(f"Error during multi-source search: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get(
+    "/metrics",
+    status_code=status.HTTP_200_OK,
+    description="""
+    Per-source histograms of search stage durations (fetch, filter, map, decorate)
+    since the process started, with totals of records, matches, results, upstream
+    bytes and attempts. Buckets are cumulative counts keyed by their upper bound in ms.
+    Empty when `SEARCH_TIMING` is off.
+    """,
+    summary="Search Stage Timings",
+)
+async def search_timing_metrics():
+    return FastJSONResponse(search_metrics.snapshot())
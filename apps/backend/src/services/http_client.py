@@ -1,22 +1,176 @@
-from typing import Dict, Any
-from src.utils.http import request_with_retry
+import json
+import logging
+from typing import Dict, Any, AsyncIterator, Callable, List, Optional, Tuple
+import httpx
+from src.core.config import settings
+from src.services.request_builder import BuiltRequest
+from src.utils.http import request_with_retry, stream_with_retry
+from src.utils.json_stream import (
+    TOP_LEVEL_ITEMS,
+    iter_json_items,
+    json_stream_available,
+    peek_array,
+)
+from src.utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+class UpstreamIncomplete(Exception):
+    """
+    The upstream records could not be read to the end (a page request failed,
+    the page limit was reached or a streamed body broke off). Records
+    produced before it are valid.
+    """
+
+
+class UpstreamFailure:
+    """
+    Returned by `HttpClient` in place of the payload of a failed request, so a
+    failure is never confused with an upstream body (which may well contain
+    an "error" key of its own).
+    """
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: str):
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f"UpstreamFailure({self.error!r})"
 
 
 class HttpClient:
-    async def fetch(self, req: Dict[str, Any]) -> Dict[str, Any]:
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """
+        client: AsyncClient to send requests with. Defaults to the shared,
+            application-lifetime pooled client from `src.utils.http`.
+        """
+        self.client = client
+        self._flights = SingleFlight()
+
+    async def fetch(self, req: BuiltRequest, timeout: Optional[float] = None) -> Any:
+        """
+        Fetch and parse `req`. Concurrent identical requests share one upstream
+        call and the same parsed payload, which callers must not mutate.
+        `timeout` (seconds) defaults to the client's `settings.http_timeout`.
+
+        Returns:
+            The parsed JSON body, or an `UpstreamFailure` if the request failed
+            or the response was not JSON
+        """
+        return await self._flights.do(
+            req.cache_key(), lambda: self._fetch(req, timeout)
+        )
+
+    async def fetch_with_next_link(
+        self, req: BuiltRequest, timeout: Optional[float] = None
+    ) -> Tuple[Any, Optional[str]]:
+        """
+        Like `fetch`, also returning the rel="next" URL of the response's Link
+        header (None when absent or when the request failed).
+        The payload is an `UpstreamFailure` if the request failed.
+        """
+        return await self._flights.do(
+            "link:" + req.cache_key(),
+            lambda: self._fetch(req, timeout, with_next_link=True),
+        )
+
+    async def _fetch(
+        self,
+        req: BuiltRequest,
+        timeout: Optional[float],
+        with_next_link: bool = False,
+    ) -> Any:
+        payload, next_link = await self._fetch_payload(req, timeout)
+        return (payload, next_link) if with_next_link else payload
+
+    async def _fetch_payload(
+        self, req: BuiltRequest, timeout: Optional[float]
+    ) -> Tuple[Any, Optional[str]]:
         try:
             resp = await request_with_retry(
-                method=req["method"],
-                url=req["url"],
-                params=req.get("params"),
-                headers=req.get("headers"),
-                data=req.get("data"),
-                timeout=req.get("timeout", 10),
+                method=req.method,
+                url=req.url,
+                params=req.params,
+                headers=req.headers,
+                data=req.data,
+                timeout=timeout,
+                client=self.client,
             )
+            next_link = resp.links.get("next", {}).get("url")
             content_type = resp.headers.get("content-type", "")
             if content_type.startswith("application/json"):
-                return resp.json()
+                return resp.json(), next_link
             else:
-                return {"error": "Non-JSON response", "content": await resp.text()}
+                return UpstreamFailure("Non-JSON response"), None
+        except Exception as e:
+            return UpstreamFailure(str(e)), None
+
+    async def stream_records(
+        self,
+        req: BuiltRequest,
+        records: Callable[[Any], List[Dict[str, Any]]],
+        prefix: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Send `req` and yield batches of records while the body is downloading.
+
+        Bodies of at least `settings.upstream_stream_min_bytes` (or of unknown
+        length) are parsed incrementally when ijson is installed and the
+        records are the items of an array: the one at `prefix`, or the body
+        itself when there is no prefix. Others (an object at `prefix`, a top
+        level object) are read in full and passed to `records`, yielding a
+        single batch. Streamed requests are neither coalesced nor
+        cached, and stopping the iteration early closes the connection without
+        reading the rest.
+
+        A request that fails before any records were yielded is logged and
+        yields nothing, like a failed `fetch`.
+
+        Args:
+            records: Extracts the record list from a fully parsed body
+            prefix: ijson prefix of the records (see `iter_json_items`)
+
+        Raises:
+            UpstreamIncomplete: if the body broke off after records were yielded
+        """
+        yielded = False
+        try:
+            async with stream_with_retry(
+                method=req.method,
+                url=req.url,
+                params=req.params,
+                headers=req.headers,
+                data=req.data,
+                timeout=timeout,
+                client=self.client,
+            ) as resp:
+                content_type = resp.headers.get("content-type", "")
+                if not content_type.startswith("application/json"):
+                    logger.warning("Non-JSON upstream response from %s", req.url)
+                    return
+                length = resp.headers.get("content-length")
+                small = length is not None and int(length) < (
+                    settings.upstream_stream_min_bytes
+                )
+                if small or not json_stream_available():
+                    await resp.aread()
+                    yield records(resp.json())
+                    return
+                prefix = prefix or TOP_LEVEL_ITEMS
+                is_array, chunks = await peek_array(resp.aiter_bytes(), prefix)
+                if not is_array:
+                    body = b"".join([chunk async for chunk in chunks])
+                    yield records(json.loads(body))
+                    return
+                async for batch in iter_json_items(chunks, prefix):
+                    yielded = True
+                    yield batch
         except Exception as e:
-            return {"error": str(e)}
+            if yielded:
+                raise UpstreamIncomplete(
+                    f"Streamed response from {req.url} broke off: {e}"
+                ) from e
+            logger.warning("Streaming upstream request to %s failed: %s", req.url, e)
@@ -0,0 +1,155 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence
+from src.models.search import SortSpec
+from src.services.search import SearchService
+from src.utils.expressions import compile_getter
+from src.utils.paging import sort_window, window
+from src.utils.serialization import UNIFIED_ITEM_FIELDS
+
+logger = logging.getLogger(__name__)
+
+
+class SourceOutcome:
+    """
+    Result of searching one source as part of a fan-out search.
+
+    Attributes:
+        status: "ok", "timeout" or "error"
+        results: Mapped items (empty unless status is "ok")
+        total: Number of items matching the filters at that source
+        error: Short description of the failure, if any
+        elapsed_ms: Wall time spent on this source
+    """
+
+    def __init__(
+        self,
+        service: SearchService,
+        status: str,
+        results: Optional[List[Dict[str, Any]]] = None,
+        total: Optional[int] = None,
+        error: Optional[str] = None,
+        elapsed_ms: float = 0.0,
+    ):
+        self.source_id = service.plan.source_id
+        self.name = service.plan.name
+        self.status = status
+        self.results = results or []
+        self.total = total
+        self.error = error
+        self.elapsed_ms = elapsed_ms
+
+
+async def _search_one(
+    service: SearchService,
+    timeout: float,
+    default_filters: Dict[str, Any],
+    api_filters: Dict[str, Any],
+    debug: bool,
+    fields: Optional[Sequence[str]],
+    sort: Optional[SortSpec],
+    limit: Optional[int],
+) -> SourceOutcome:
+    """Search a single source within `timeout`, turning failures into an outcome."""
+    started = time.perf_counter()
+    try:
+        async with asyncio.timeout(timeout):
+            results = await service.iter_results(
+                default_filters,
+                api_filters,
+                debug,
+                fields=fields,
+                sort=sort,
+                limit=limit,
+            )
+            items = list(results)
+        status, error, total = "ok", None, results.total
+    except TimeoutError:
+        items, total = [], None
+        status, error = "timeout", f"No response within {timeout:g}s"
+    except Exception as e:
+        logger.exception("Fan-out search failed for source %s", service.plan.source_id)
+        items, total = [], None
+        status, error = "error", type(e).__name__
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return SourceOutcome(service, status, items, total, error, elapsed_ms)
+
+
+async def search_sources(
+    services: List[SearchService],
+    default_filters: Dict[str, Any],
+    api_filters: Dict[str, Any],
+    timeout: float,
+    debug: bool = False,
+    fields: Optional[Sequence[str]] = None,
+    sort: Optional[SortSpec] = None,
+    limit: Optional[int] = None,
+) -> List[SourceOutcome]:
+    """
+    Search all given sources concurrently.
+
+    Every source gets its own `timeout`, so the call takes as long as the
+    slowest source (capped by the timeout) rather than the sum. A source
+    that fails or times out is reported in its outcome and never fails the
+    whole search.
+
+    Args:
+        services: SearchServices to query, in the order outcomes are returned
+        timeout: Per-source time budget in seconds
+        sort, limit: Applied per source, so each source returns its own top-k
+
+    Returns:
+        One SourceOutcome per service, in input order
+    """
+    if sort is not None and fields is not None:
+        # Keep the sort field on mapped items so merge_results can rank them
+        if sort.field in UNIFIED_ITEM_FIELDS and sort.field not in fields:
+            fields = [*fields, sort.field]
+    return await asyncio.gather(
+        *(
+            _search_one(
+                service,
+                timeout,
+                default_filters,
+                api_filters,
+                debug,
+                fields,
+                sort,
+                limit,
+            )
+            for service in services
+        )
+    )
+
+
+def merge_results(
+    outcomes: List[SourceOutcome],
+    sort: Optional[SortSpec] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Combine per-source results into one list.
+
+    With `sort`, items are ranked across sources by the sort field: a unified
+    field (name, price, ...) is read from the mapped item, any other path from
+    its `raw` object. Without it, results keep source order. `limit` caps the
+    merged list.
+    """
+    items = [item for outcome in outcomes for item in outcome.results]
+    if sort is None:
+        return list(window(items, limit, 0))
+
+    if sort.field in UNIFIED_ITEM_FIELDS:
+        field = sort.field
+
+        def sort_value(item: Dict[str, Any]) -> Any:
+            return item.get(field)
+
+    else:
+        raw_getter = compile_getter(sort.field)
+
+        def sort_value(item: Dict[str, Any]) -> Any:
+            return raw_getter(item.get("raw"))
+
+    return sort_window(items, sort_value, descending=sort.order == "desc", limit=limit)
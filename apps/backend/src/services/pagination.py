@@ -0,0 +1,192 @@
+"""
+Walking paginated upstream APIs.
+
+`iter_pages` yields the records of one page at a time, in page order, so
+the caller can filter each page as soon as it arrives and stop iterating
+once it has enough results; pages still in flight are then cancelled.
+When the pages cannot all be read, the iteration ends with UpstreamIncomplete.
+"""
+
+import asyncio
+import math
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+import httpx
+from src.services.http_client import UpstreamIncomplete
+from src.services.request_builder import BuiltRequest
+from src.types import PaginationDescriptor
+from src.utils.expressions import compile_getter
+
+# Fetches one page: (parsed payload, rel="next" URL from the Link header)
+PageFetch = Callable[[BuiltRequest], Awaitable[Tuple[Any, Optional[str]]]]
+# Extracts the records of one page from its payload
+PageRecords = Callable[[Any], List[Dict[str, Any]]]
+
+
+def page_request(
+    base: BuiltRequest, pagination: PaginationDescriptor, index: int
+) -> BuiltRequest:
+    """
+    Request for the `index`-th (0-based) page of an offset or page paginated
+    API. Pagination params override user supplied ones of the same name.
+    """
+    params = dict(base.params)
+    if pagination.limit_param:
+        params[pagination.limit_param] = pagination.page_size
+    if pagination.type == "offset":
+        params[pagination.offset_param] = (
+            pagination.start + index * pagination.page_size
+        )
+    elif pagination.type == "page":
+        params[pagination.page_param] = pagination.start + index
+    return base.model_copy(update={"params": params})
+
+
+def _page_count(total: Any, page_size: int) -> Optional[int]:
+    try:
+        return math.ceil(int(total) / page_size)
+    except (TypeError, ValueError):
+        return None
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+def _discard(task: asyncio.Task) -> None:
+    """
+    Cancel a page request whose result is no longer needed. Its error, if it
+    already failed (or fails while cancelling), is retrieved so asyncio does
+    not log "Task exception was never retrieved".
+    """
+    task.cancel()
+    task.add_done_callback(_retrieve_exception)
+
+
+async def _iter_numbered_pages(
+    pagination: PaginationDescriptor,
+    base: BuiltRequest,
+    fetch_page: PageFetch,
+    records: PageRecords,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Offset/page pagination: page n's request does not depend on page n-1, so
+    up to `parallelism` pages are requested ahead of the one being yielded.
+    Stops after a short page or at the count from `total_path`; reaching
+    `max_pages` first raises UpstreamIncomplete.
+    """
+    total_of = compile_getter(pagination.total_path) if pagination.total_path else None
+    last = pagination.max_pages - 1
+    # Whether `last` is the real last page (from total_path) or just max_pages
+    counted = False
+    pending: Dict[int, asyncio.Task] = {}
+    next_index = 0
+    index = 0
+    try:
+        while index <= last:
+            while next_index <= last and len(pending) < pagination.parallelism:
+                pending[next_index] = asyncio.create_task(
+                    fetch_page(page_request(base, pagination, next_index))
+                )
+                next_index += 1
+
+            payload, _ = await pending.pop(index)
+            items = records(payload)
+            if total_of is not None and index == 0:
+                pages = _page_count(total_of(payload), pagination.page_size)
+                if pages is not None and pages - 1 <= last:
+                    last = pages - 1
+                    counted = True
+                    for extra in [i for i in pending if i > last]:
+                        _discard(pending.pop(extra))
+
+            yield items
+            if len(items) < pagination.page_size:
+                return
+            index += 1
+    finally:
+        for task in pending.values():
+            _discard(task)
+    if not counted:
+        raise UpstreamIncomplete(f"Stopped at max_pages={pagination.max_pages}")
+
+
+async def _iter_linked_pages(
+    pagination: PaginationDescriptor,
+    base: BuiltRequest,
+    fetch_page: PageFetch,
+    records: PageRecords,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Cursor/link pagination: each request needs the previous response, so
+    pages are fetched one after another. Raises UpstreamIncomplete when
+    there still is a next page after `max_pages`.
+    """
+    cursor_of = compile_getter(pagination.cursor_path)
+    req = page_request(base, pagination, 0)
+    for _ in range(pagination.max_pages):
+        payload, next_link = await fetch_page(req)
+        items = records(payload)
+        yield items
+        if not items:
+            return
+
+        if pagination.type == "cursor":
+            cursor = cursor_of(payload)
+            if cursor is None or cursor == "":
+                return
+            req = req.model_copy(
+                update={"params": {**req.params, pagination.cursor_param: cursor}}
+            )
+        else:
+            if not next_link:
+                return
+            # The next link carries the full query string; split it into params
+            # since httpx replaces a URL's query with the request params
+            url = httpx.URL(next_link)
+            req = req.model_copy(
+                update={
+                    "url": str(url.copy_with(query=None)),
+                    "params": dict(url.params),
+                }
+            )
+    raise UpstreamIncomplete(f"Stopped at max_pages={pagination.max_pages}")
+
+
+def iter_pages(
+    pagination: PaginationDescriptor,
+    base: BuiltRequest,
+    fetch_page: PageFetch,
+    records: PageRecords,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Records of each upstream page, in page order.
+
+    Args:
+        pagination: The source's pagination descriptor
+        base: Request of the first page without pagination params
+        fetch_page: Sends one page request; raises UpstreamIncomplete (or any
+            other error) for a failed page, which ends the iteration with it
+        records: Extracts the list of records from a page payload; an empty
+            list ends the iteration
+
+    Raises:
+        UpstreamIncomplete: when `max_pages` is reached before the last page
+
+    Closing the iterator early (`aclose()`, or leaving an `async for` that
+    owns it) cancels the page requests still in flight. A request that
+    another search is also waiting for (see HttpClient.fetch_with_next_link)
+    keeps running until that search no longer needs it.
+    """
+    if pagination.type in ("offset", "page"):
+        return _iter_numbered_pages(pagination, base, fetch_page, records)
+    return _iter_linked_pages(pagination, base, fetch_page, records)
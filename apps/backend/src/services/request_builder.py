@@ -1,5 +1,7 @@
+import hashlib
+import json
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pydantic import BaseModel
 from src.db.sources import Source
 
@@ -16,17 +18,27 @@ class BuiltRequest(BaseModel):
     headers: Dict[str, str]
     data: Optional[Any] = None
 
+    def cache_key(self) -> str:
+        """
+        Stable identity of the upstream call: method, url, params, body and a
+        hash of the headers (so credentials never appear in the key itself).
+        """
+        headers_hash = hashlib.sha256(
+            json.dumps(self.headers, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        payload = json.dumps(
+            [self.method.upper(), self.url, self.params, self.data, headers_hash],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
 
-def build_request_from_source(
-    source: Dict[str, Any], user_filters: Dict[str, Any]
-) -> BuiltRequest:
+
+def resolve_headers(source: Dict[str, Any]) -> Dict[str, str]:
     """
-    Build an HTTP request from a source dict and user filters.
+    Default + custom headers of a source with placeholders like "{{CMC_API_KEY}}"
+    replaced by their secrets. Depends only on the source, never on the request.
     """
-    source_dict = source
-    url = source_dict["endpoint"]
-    method = source_dict["method"]
-
     # Start with default headers
     headers: Dict[str, str] = {
         "Accepts": "application/json",
@@ -34,7 +46,7 @@ def build_request_from_source(
     }
 
     # Merge in any custom headers from source config
-    custom_headers = source_dict.get("headers")
+    custom_headers = source.get("headers")
     if custom_headers:
         headers.update(custom_headers)
 
@@ -49,25 +61,48 @@ def build_request_from_source(
             if token_name == "CMC_API_KEY":
                 headers[header_name] = os.getenv("CMC_API_KEY", "")
 
-    # Build params from user_filters mapped to API params
+    return headers
+
+
+def api_param_table(api_filters: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    """
+    (filter key, API query param) pairs for every api_filter that maps to a param.
+    """
+    return [
+        (filter_descriptor["key"], filter_descriptor["api_param"])
+        for filter_descriptor in api_filters or []
+        if filter_descriptor.get("api_param")
+    ]
+
+
+def bind_params(
+    param_table: List[Tuple[str, str]], user_filters: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build query params from user_filters mapped to API params."""
     params: Dict[str, Any] = {}
-    api_filters = source_dict.get("api_filters", [])
-    for filter_descriptor in api_filters:
-        filter_key = filter_descriptor["key"]
-        if user_filters and filter_key in user_filters:
+    if not user_filters:
+        return params
+    for filter_key, api_param in param_table:
+        if filter_key in user_filters:
             filter_value = user_filters[filter_key]
-            if not isinstance(filter_value, dict) and filter_descriptor.get(
-                "api_param"
-            ):
-                params[filter_descriptor["api_param"]] = filter_value
+            if not isinstance(filter_value, dict):
+                params[api_param] = filter_value
+    return params
 
-    # Extensibility: support request body for POST/PUT if needed
-    body = source_dict.get("body")
 
+def build_request_from_source(
+    source: Dict[str, Any], user_filters: Dict[str, Any]
+) -> BuiltRequest:
+    """
+    Build an HTTP request from a source dict and user filters.
+    """
     return BuiltRequest(
-        url=url,
-        method=method,
-        params=params,
-        headers=headers,
-        data=body,
+        url=source["endpoint"],
+        method=source["method"],
+        params=bind_params(
+            api_param_table(source.get("api_filters", [])), user_filters
+        ),
+        headers=resolve_headers(source),
+        # Extensibility: support request body for POST/PUT if needed
+        data=source.get("body"),
     )
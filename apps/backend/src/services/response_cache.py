@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    __slots__ = ("value", "stored_at", "refreshing")
+
+    def __init__(self, value: Any, stored_at: float):
+        self.value = value
+        self.stored_at = stored_at
+        self.refreshing = False
+
+
+class ResponseCache:
+    """
+    In-process cache of upstream payloads with TTL and stale-while-revalidate.
+
+    - fresh (age < ttl): served from memory
+    - stale (age < ttl + stale): served from memory, refreshed in the background
+    - otherwise: fetched, stored if `cacheable` accepts it, returned
+
+    Cached payloads are shared between requests and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Optional[float],
+        stale: Optional[float] = None,
+        cacheable: Callable[[Any], bool] = lambda value: True,
+    ) -> Any:
+        """
+        Args:
+            key: Identity of the upstream call (see BuiltRequest.cache_key)
+            fetch: Performs the upstream call
+            ttl: Seconds a payload stays fresh; falsy disables caching
+            stale: Extra seconds an expired payload may be served while refreshing
+            cacheable: Decides whether a fetched payload is stored (e.g. not errors)
+        """
+        if not ttl:
+            return await fetch()
+
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = now - entry.stored_at
+            if age < ttl:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if age < ttl + (stale or 0):
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                if not entry.refreshing:
+                    entry.refreshing = True
+                    task = asyncio.create_task(
+                        self._refresh(key, entry, fetch, cacheable)
+                    )
+                    self._refresh_tasks.add(task)
+                    task.add_done_callback(self._refresh_tasks.discard)
+                return entry.value
+
+        self.misses += 1
+        value = await fetch()
+        if cacheable(value):
+            self._store(key, value)
+        return value
+
+    async def _refresh(
+        self,
+        key: str,
+        entry: _Entry,
+        fetch: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool],
+    ) -> None:
+        try:
+            value = await fetch()
+            if cacheable(value):
+                self._store(key, value)
+        except Exception:
+            logger.exception("Background refresh of cached upstream response failed")
+        finally:
+            entry.refreshing = False
+
+    def _store(self, key: str, value: Any) -> None:
+        self._entries[key] = _Entry(value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one entry, or everything when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+        }
+
+
+response_cache = ResponseCache(max_entries=settings.upstream_cache_max_entries)
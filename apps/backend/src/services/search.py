@@ -1,46 +1,183 @@
-from typing import Dict, Any, List
-from src.services.request_builder import build_request_from_source
-from src.services.http_client import HttpClient
-from src.utils.fields_mapping import extract_fields
-from src.utils.filtering_engine import apply_filters
-from src.utils.data import mock_response
+import logging
+import random
+import time
+from typing import (
+    Dict,
+    Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from src.core.config import settings
+from src.models.search import SortSpec
+from src.services.http_client import HttpClient, UpstreamFailure, UpstreamIncomplete
+from src.services.pagination import iter_pages
+from src.services.request_builder import BuiltRequest
+from src.services.response_cache import response_cache
+from src.services.search_plan import SearchPlan
+from src.utils.fields_mapping import CompiledMapping, extract_compiled
+from src.utils.filtering_engine import FilterPlan, FilterTrace
+from src.utils.fixtures import load_fixture
+from src.utils.paging import sort_window, window
+from src.utils.timing import SearchTimings, current_timings, search_metrics
+
+logger = logging.getLogger(__name__)
 
 http_client = HttpClient()
 
+# End of a page in `SearchService._timed_results`
+_END = object()
+
+
+def _is_cacheable(raw: Any) -> bool:
+    # Failed requests are never cached
+    return not isinstance(raw, UpstreamFailure)
+
+
+class SearchResults:
+    """
+    Lazily mapped results of one search page.
+
+    Attributes:
+        total: Number of items matching the filters (None when filtering is
+            still streaming, or paging stopped early, so the count is not known)
+        next_offset: Offset of the next page, or None on the last page/unknown
+        timings: Stage timings of the search (None when `settings.search_timing`
+            is off); map/decorate are complete once the items are consumed
+    """
+
+    def __init__(
+        self,
+        items: Iterator[Dict[str, Any]],
+        total: Optional[int] = None,
+        next_offset: Optional[int] = None,
+        timings: Optional[SearchTimings] = None,
+    ):
+        self.items = items
+        self.total = total
+        self.next_offset = next_offset
+        self.timings = timings
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.items)
+
 
 class SearchService:
-    def __init__(self, source_record: Dict[str, Any]):
+    def __init__(self, plan: SearchPlan):
+        """
+        plan: precompiled SearchPlan of the source (shared across requests)
+        """
+        self.plan = plan
+
+    @classmethod
+    def from_source(cls, source_record: Dict[str, Any]) -> "SearchService":
         """
         source_record: dict-like object (from DB or Source model) with keys:
            endpoint, method, params, headers, mapping, filters
         """
-        self.source = source_record
-        self.mapping = source_record.get("mapping") or {}
-        self.filter_descriptors = source_record.get("backend_filters") or []
+        return cls(SearchPlan(source_record))
 
     async def fetch_raw(self, api_filters: Dict[str, Any]) -> List[Dict[str, Any]]:
-        req = build_request_from_source(source=self.source, user_filters=api_filters)
-        raw = await http_client.fetch(req)
-
-        # Handle common API response patterns:
-        # 1. Direct list response
-        # 2. Data wrapped in 'data' field
-        # 3. Single object response
-        # 4. Empty response
-        return mock_response.get("data")
-        if isinstance(raw, list):
-            return raw
-        elif isinstance(raw, dict):
-            if "data" in raw and raw["data"] is not None:
-                data = raw["data"]
-                return data if isinstance(data, list) else [data]
-            elif raw:  # Non-empty dict
-                return [raw]
-
-        return []  # Fallback for null/empty responses
+        if self.plan.replay_fixture is not None:
+            # Replay upstream: the same canned payload for every request
+            return self._records(load_fixture(self.plan.replay_fixture))
+
+        req = self.plan.build_request(api_filters)
+        raw = await response_cache.get_or_fetch(
+            req.cache_key(),
+            lambda: http_client.fetch(req),
+            ttl=self.plan.cache_ttl_seconds,
+            stale=self.plan.cache_stale_seconds,
+            cacheable=_is_cacheable,
+        )
+
+        return self._records(raw)
+
+    def _records(self, raw: Any) -> List[Dict[str, Any]]:
+        """Records of an upstream payload; none for a failed request."""
+        if not _is_cacheable(raw):
+            logger.warning("Upstream request failed: %s", raw.error)
+            return []
+        return self.plan.records(raw)
+
+    async def _fetch_page(self, req: BuiltRequest) -> Tuple[Any, Optional[str]]:
+        """
+        One upstream page and its Link rel="next" URL, through the response cache.
+
+        Raises:
+            UpstreamIncomplete: if the page request failed
+        """
+        page = await response_cache.get_or_fetch(
+            "page:" + req.cache_key(),
+            lambda: http_client.fetch_with_next_link(req),
+            ttl=self.plan.cache_ttl_seconds,
+            stale=self.plan.cache_stale_seconds,
+            cacheable=lambda page: _is_cacheable(page[0]),
+        )
+        if not _is_cacheable(page[0]):
+            raise UpstreamIncomplete(f"Page request failed: {page[0].error}")
+        return page
+
+    async def _filter_batches(
+        self,
+        batches: AsyncIterator[List[Dict[str, Any]]],
+        filter_plan: FilterPlan,
+        trace: Optional[FilterTrace],
+        needed: Optional[int],
+        timings: Optional[SearchTimings] = None,
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Filter upstream records batch by batch (pages, or chunks of a streamed
+        body) as they arrive.
+
+        Args:
+            needed: Stop reading once this many items matched (None reads all)
+            timings: Gets the records read and the time spent filtering them
+
+        Returns:
+            (matching items in upstream order, whether the upstream was read to
+            the end); a failed page or the page limit also make it incomplete
+        """
+        matches: List[Dict[str, Any]] = []
+        try:
+            async for items in batches:
+                if timings is None:
+                    matches.extend(filter_plan.apply(items, trace))
+                else:
+                    started = time.perf_counter_ns()
+                    matches.extend(filter_plan.apply(items, trace))
+                    timings.add_time("filter", time.perf_counter_ns() - started)
+                    timings.count("records", len(items))
+                if needed is not None and len(matches) >= needed:
+                    return matches, False
+        except UpstreamIncomplete as e:
+            logger.warning(
+                "Upstream records of source %s incomplete: %s", self.plan.source_id, e
+            )
+            return matches, False
+        finally:
+            await batches.aclose()
+        return matches, True
+
+    @staticmethod
+    def _sample_trace() -> bool:
+        rate = settings.filter_trace_sample_rate
+        return rate > 0 and random.random() < rate
 
     async def fetch_and_process(
-        self, default_filters: Dict[str, Any], api_filters: Dict[str, Any]
+        self,
+        default_filters: Dict[str, Any],
+        api_filters: Dict[str, Any],
+        debug: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        include_raw: bool = True,
+        sort: Optional[SortSpec] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> List[Dict[str, Any]]:
         """
         Fetch data from external API and apply backend filtering.
@@ -48,27 +185,216 @@ class SearchService:
         Args:
             default_filters: Backend filters to apply after fetching (supports complex operations)
             api_filters: Filters to pass to external API as query parameters
+            debug: Trace backend filtering and log the per-condition summary.
+                Searches are also traced at `settings.filter_trace_sample_rate`.
+            fields: Mapped fields to produce; mapping expressions of other fields
+                are never evaluated. All mapped fields when None.
+            include_raw: Attach the upstream object as `raw`
+            sort: Order by a mapped field or raw path (top-k heap when limited)
+            limit: Maximum number of items to return
+            offset: Number of (ordered) items to skip
 
         Returns:
             List of mapped and filtered items with unified structure
         """
-        # Step 1: Fetch raw data from external API with api_filters as query params
-        raw_items = await self.fetch_raw(api_filters)
-        # Step 2: Apply backend filtering using default_filters on raw response data
-        # This allows complex operations (gt, lt, contains) that the external API may not support
-        filtered_raw = apply_filters(
-            raw_items,
-            self.filter_descriptors,  # Backend filter configuration from source
-            default_filters or {},  # User's backend filter conditions
+        return list(
+            await self.iter_results(
+                default_filters,
+                api_filters,
+                debug,
+                fields=fields,
+                include_raw=include_raw,
+                sort=sort,
+                limit=limit,
+                offset=offset,
+            )
         )
 
-        # Step 3: Map filtered items to unified structure using source mapping config
-        mapped = [extract_fields(item, self.mapping) for item in filtered_raw]
+    async def iter_results(
+        self,
+        default_filters: Dict[str, Any],
+        api_filters: Dict[str, Any],
+        debug: bool = False,
+        stream: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        include_raw: bool = True,
+        sort: Optional[SortSpec] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> SearchResults:
+        """
+        Same pipeline as `fetch_and_process`, returning the mapped items lazily.
 
-        # Step 4: Attach raw data for reference and ensure required fields exist
-        for i, item in enumerate(mapped):
-            item["raw"] = filtered_raw[i]
-            item["url"] = "#"  # TODO: Remove hardcoded values
-            item["id"] = "id"  # TODO: Remove hardcoded values
+        Args:
+            stream: Filter item by item as the iterator is consumed instead of
+                filtering the whole payload up front (first item is produced
+                without waiting for the rest). Sorted and traced searches
+                always filter up front.
+
+        Returns:
+            SearchResults iterating over mapped and filtered items of the page;
+            the upstream fetch has already completed when this returns, so fetch
+            errors surface before iteration.
+        """
+        trace = FilterTrace() if debug or self._sample_trace() else None
+        timings = SearchTimings(self.plan.source_id) if settings.search_timing else None
+        clock = time.perf_counter_ns
+        started = clock()
+        filter_plan = self.plan.compile_filters(default_filters or {})
+        truncated = False
+        batched = self.plan.pagination is not None or self.plan.stream_upstream
+        batched = batched and self.plan.replay_fixture is None
+        # The HTTP helpers add upstream attempts and bytes to the current timings
+        token = current_timings.set(timings)
+        try:
+            if batched:
+                # Steps 1-2 per upstream page (or streamed chunk): each batch is
+                # filtered as it arrives, and reading stops early once an unsorted
+                # window is filled
+                req = self.plan.build_request(api_filters)
+                if self.plan.pagination is not None:
+                    batches = iter_pages(
+                        self.plan.pagination, req, self._fetch_page, self._records
+                    )
+                else:
+                    batches = http_client.stream_records(
+                        req, self._records, self.plan.stream_prefix
+                    )
+                needed = offset + limit if limit is not None and sort is None else None
+                filtered_raw, complete = await self._filter_batches(
+                    batches, filter_plan, trace, needed, timings
+                )
+                truncated = not complete
+                total = None if truncated else len(filtered_raw)
+                if timings is not None:
+                    timings.upstream_complete = complete
+                filter_started = clock()
+                if timings is not None:
+                    # Time not spent filtering batches went to fetching them
+                    timings.add_time(
+                        "fetch",
+                        filter_started - started - timings.durations_ns["filter"],
+                    )
+            else:
+                # Step 1: Fetch raw data from external API with api_filters as query params
+                raw_items = await self.fetch_raw(api_filters)
+                filter_started = clock()
+                if timings is not None:
+                    timings.add_time("fetch", filter_started - started)
+                    timings.count("records", len(raw_items))
+                # Step 2: Apply backend filtering using default_filters on raw response data
+                # This allows complex operations (gt, lt, contains) that the external API may not support
+                if stream and trace is None and sort is None:
+                    filtered_raw = filter_plan.iter_matches(raw_items)
+                    total = None
+                else:
+                    filtered_raw = filter_plan.apply(raw_items, trace)
+                    total = len(filtered_raw)
+        finally:
+            current_timings.reset(token)
+        if trace is not None:
+            logger.info(
+                "Filter trace for source %s: %s", self.plan.source_id, trace.summary()
+            )
 
-        return mapped
+        # Order and page on raw items, so only the returned page gets mapped
+        if sort is not None:
+            page = sort_window(
+                filtered_raw,
+                self.plan.sort_getter(sort.field),
+                descending=sort.order == "desc",
+                limit=limit,
+                offset=offset,
+            )
+        else:
+            page = window(filtered_raw, limit, offset)
+        next_offset = None
+        if limit is not None:
+            if truncated or (total is not None and offset + limit < total):
+                next_offset = offset + limit
+
+        # Steps 3-4 run per item as the caller consumes the results
+        mapping = self.plan.mapping_for(fields)
+        if timings is None:
+            return SearchResults(
+                (self._to_result(item, mapping, include_raw) for item in page),
+                total=total,
+                next_offset=next_offset,
+            )
+
+        timings.add_time("filter", clock() - filter_started)
+        matched = len(filtered_raw) if isinstance(filtered_raw, list) else None
+        if matched is not None:
+            timings.count("matched", matched)
+        return SearchResults(
+            self._timed_results(
+                page, mapping, include_raw, timings, count_matched=matched is None
+            ),
+            total=total,
+            next_offset=next_offset,
+            timings=timings,
+        )
+
+    def _timed_results(
+        self,
+        page: Iterable[Dict[str, Any]],
+        mapping: CompiledMapping,
+        include_raw: bool,
+        timings: SearchTimings,
+        count_matched: bool,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        `_to_result` over `page`, timing each item's steps: pulling it from the
+        page (lazy filtering), mapping and decorating. The search is added to
+        `search_metrics` once the results are consumed or closed.
+
+        Args:
+            count_matched: Count the pulled items as matched (lazily filtered
+                results, whose number of matches is otherwise unknown)
+        """
+        clock = time.perf_counter_ns
+        items = iter(page)
+        filter_ns = map_ns = decorate_ns = 0
+        results = 0
+        try:
+            while True:
+                started = clock()
+                raw_item = next(items, _END)
+                pulled = clock()
+                filter_ns += pulled - started
+                if raw_item is _END:
+                    return
+                item = extract_compiled(raw_item, mapping)
+                mapped = clock()
+                self._decorate(item, raw_item, include_raw)
+                decorate_ns += clock() - mapped
+                map_ns += mapped - pulled
+                results += 1
+                yield item
+        finally:
+            timings.add_time("filter", filter_ns)
+            timings.add_time("map", map_ns)
+            timings.add_time("decorate", decorate_ns)
+            timings.count("results", results)
+            if count_matched:
+                timings.count("matched", results)
+            search_metrics.observe(timings)
+
+    @classmethod
+    def _to_result(
+        cls, raw_item: Dict[str, Any], mapping: CompiledMapping, include_raw: bool
+    ) -> Dict[str, Any]:
+        # Step 3: Map filtered item to unified structure using source mapping config
+        item = extract_compiled(raw_item, mapping)
+        cls._decorate(item, raw_item, include_raw)
+        return item
+
+    @staticmethod
+    def _decorate(
+        item: Dict[str, Any], raw_item: Dict[str, Any], include_raw: bool
+    ) -> None:
+        # Step 4: Attach raw data for reference and ensure required fields exist
+        if include_raw:
+            item["raw"] = raw_item
+        item["url"] = "#"  # TODO: Remove hardcoded values
+        item["id"] = "id"  # TODO: Remove hardcoded values
@@ -0,0 +1,104 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from src.core.config import settings
+from src.services.request_builder import (
+    BuiltRequest,
+    api_param_table,
+    bind_params,
+    resolve_headers,
+)
+from src.types import PaginationDescriptor
+from src.utils.expressions import compile_getter
+from src.utils.fields_mapping import CompiledMapping, compile_mapping
+from src.utils.filtering_engine import (
+    FilterIndex,
+    FilterPlan,
+    compile_indexed_filters,
+    index_filter_descriptors,
+)
+from src.utils.records import RecordsExtractor, compile_records, records_prefix
+
+
+class SearchPlan:
+    """
+    Everything about searching one source version that does not depend on the
+    request: endpoint, static headers (secrets resolved), the api_param lookup
+    table, the records extractor, compiled mapping extractors and the indexed
+    backend filters.
+
+    Built once per source version (see SourceService.get_search_service); the
+    per-request work is binding the user's api/backend filters. Plans are never
+    mutated after construction, so one instance serves concurrent requests.
+    """
+
+    def __init__(self, source: Dict[str, Any]):
+        """
+        source: dict-like object (from DB or Source model) with keys:
+           id, name, version, endpoint, method, headers, api_filters, backend_filters,
+           mapping, pagination, records_path, replay_fixture
+        """
+        self.source_id: Optional[str] = (
+            str(source["id"]) if source.get("id") is not None else None
+        )
+        self.name: Optional[str] = source.get("name")
+        self.version: int = source.get("version") or 1
+        self.url: str = source["endpoint"]
+        self.method: str = source["method"]
+        self.headers: Dict[str, str] = resolve_headers(source)
+        self.body: Any = source.get("body")
+        self.param_table: List[Tuple[str, str]] = api_param_table(
+            source.get("api_filters") or []
+        )
+        self.mapping: CompiledMapping = compile_mapping(source.get("mapping") or {})
+        self.filter_index: FilterIndex = index_filter_descriptors(
+            source.get("backend_filters") or []
+        )
+        pagination = source.get("pagination")
+        self.pagination: Optional[PaginationDescriptor] = (
+            PaginationDescriptor.model_validate(pagination) if pagination else None
+        )
+        self.cache_ttl_seconds: Optional[int] = source.get("cache_ttl_seconds")
+        self.cache_stale_seconds: Optional[int] = source.get("cache_stale_seconds")
+        self.replay_fixture: Optional[str] = source.get("replay_fixture")
+        records_path: Optional[str] = source.get("records_path")
+        self.records: RecordsExtractor = compile_records(records_path)
+        # ijson prefix of the records when streaming (None: detect from the body)
+        self.stream_prefix: Optional[str] = (
+            records_prefix(records_path) if records_path else None
+        )
+        # Cached responses have to be materialized anyway, so only uncached,
+        # single-page sources parse their body incrementally, and only when
+        # their records_path can be followed by the streaming parser
+        self.stream_upstream: bool = (
+            self.replay_fixture is None
+            and settings.upstream_stream_parse
+            and not self.cache_ttl_seconds
+            and self.pagination is None
+            and (not records_path or self.stream_prefix is not None)
+        )
+
+    def build_request(self, api_filters: Dict[str, Any]) -> BuiltRequest:
+        return BuiltRequest(
+            url=self.url,
+            method=self.method,
+            params=bind_params(self.param_table, api_filters),
+            headers=dict(self.headers),
+            data=self.body,
+        )
+
+    def mapping_for(self, fields: Optional[Sequence[str]]) -> CompiledMapping:
+        """Compiled extractors for the requested output fields only (all when None)."""
+        if fields is None:
+            return self.mapping
+        return [entry for entry in self.mapping if entry[0] in fields]
+
+    def sort_getter(self, field: str) -> Callable[[Any], Any]:
+        """Value getter for ordering: a mapped field name, else a raw JMESPath path."""
+        for target_field, getter in self.mapping:
+            if target_field == field:
+                return getter
+        return compile_getter(field)
+
+    def compile_filters(self, default_filters: Dict[str, Any]) -> FilterPlan:
+        return compile_indexed_filters(
+            self.filter_index, default_filters, stats_key=self.source_id
+        )
@@ -0,0 +1,52 @@
+import time
+from typing import Any, Dict, Optional
+from uuid import UUID
+from src.core.config import settings
+
+
+class CachedSource:
+    __slots__ = ("version", "value", "checked_at")
+
+    def __init__(self, version: int, value: Any, checked_at: float):
+        self.version = version
+        self.value = value
+        self.checked_at = checked_at
+
+
+class SourceConfigCache:
+    """
+    In-process cache of per-source search configuration, keyed by source id.
+
+    Entries are dropped by this worker on create/update. Other workers notice
+    an update through the source `version` column: once an entry is older
+    than `revalidate_after` seconds the caller re-reads only the version and
+    either keeps the entry (`touch`) or rebuilds it.
+    """
+
+    def __init__(self, revalidate_after: float):
+        self.revalidate_after = revalidate_after
+        self._entries: Dict[UUID, CachedSource] = {}
+
+    def get(self, source_id: UUID) -> Optional[CachedSource]:
+        return self._entries.get(source_id)
+
+    def needs_revalidation(self, entry: CachedSource) -> bool:
+        return time.monotonic() - entry.checked_at >= self.revalidate_after
+
+    def touch(self, entry: CachedSource) -> None:
+        entry.checked_at = time.monotonic()
+
+    def put(self, source_id: UUID, version: int, value: Any) -> None:
+        self._entries[source_id] = CachedSource(version, value, time.monotonic())
+
+    def invalidate(self, source_id: Optional[UUID] = None) -> None:
+        """Drop one source, or every source when no id is given."""
+        if source_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(source_id, None)
+
+
+source_cache = SourceConfigCache(
+    revalidate_after=settings.source_cache_revalidate_seconds
+)
@@ -4,6 +4,8 @@ from uuid import UUID
 from src.db.database import SessionDep
 from src.models.sources import SourceCreate, SourceResponse, SourceUpdate
 from src.db.sources import Source
+from src.services.search import SearchService
+from src.services.source_cache import source_cache
 
 
 class SourceService:
@@ -23,10 +25,16 @@ class SourceService:
                 backend_filters=r.backend_filters or [],
                 api_filters=r.api_filters or [],
                 mapping=r.mapping or {},
+                records_path=r.records_path,
+                replay_fixture=r.replay_fixture,
+                pagination=r.pagination,
                 created_at=r.created_at,
                 updated_at=r.updated_at,
                 is_active=r.is_active,
                 auth_required=r.auth_required,
+                cache_ttl_seconds=r.cache_ttl_seconds,
+                cache_stale_seconds=r.cache_stale_seconds,
+                version=r.version,
             )
             for r in rows
         ]
@@ -45,17 +53,78 @@ class SourceService:
             backend_filters=source.backend_filters or [],
             api_filters=source.api_filters or [],
             mapping=source.mapping or {},
+            records_path=source.records_path,
+            replay_fixture=source.replay_fixture,
+            pagination=source.pagination,
             created_at=source.created_at,
             updated_at=source.updated_at,
             is_active=source.is_active,
             auth_required=source.auth_required,
+            cache_ttl_seconds=source.cache_ttl_seconds,
+            cache_stale_seconds=source.cache_stale_seconds,
+            version=source.version,
         )
 
+    async def get_search_service(self, source_id: UUID) -> Optional[SearchService]:
+        """
+        Get a ready-to-use SearchService for a source, served from the in-process
+        source cache. The database is only hit on a miss, or for a version-only
+        check once the cached entry is due for revalidation.
+
+        Returns:
+            SearchService bound to the source's SearchPlan, or None if the source doesn't exist
+        """
+        cached = source_cache.get(source_id)
+        if cached is not None:
+            if not source_cache.needs_revalidation(cached):
+                return cached.value
+            version = await self.session.scalar(
+                select(Source.version).where(Source.id == source_id)
+            )
+            if version == cached.version:
+                source_cache.touch(cached)
+                return cached.value
+
+        source = await self.get_source_by_id(source_id)
+        if source is None:
+            source_cache.invalidate(source_id)
+            return None
+        service = SearchService.from_source(source.model_dump())
+        source_cache.put(source_id, source.version, service)
+        return service
+
+    async def get_active_search_services(
+        self, source_ids: Optional[List[UUID]] = None
+    ) -> List[SearchService]:
+        """
+        SearchServices for every active source (optionally limited to `source_ids`).
+
+        One query lists the active sources with their versions; cached services
+        whose version still matches are reused, the rest are rebuilt.
+        """
+        query = select(Source.id, Source.version).where(Source.is_active)
+        if source_ids:
+            query = query.where(Source.id.in_(source_ids))
+        rows = (await self.session.execute(query.order_by(Source.created_at))).all()
+
+        services = []
+        for source_id, version in rows:
+            cached = source_cache.get(source_id)
+            if cached is not None and cached.version == version:
+                source_cache.touch(cached)
+                services.append(cached.value)
+                continue
+            service = await self.get_search_service(source_id)
+            if service is not None:
+                services.append(service)
+        return services
+
     async def create_source(self, payload: SourceCreate) -> SourceResponse:
         new_source = Source(**payload.model_dump())
         self.session.add(new_source)
         await self.session.commit()
         await self.session.refresh(new_source)
+        source_cache.invalidate(new_source.id)
         print(f"Data is: {new_source}")
         return SourceResponse(
             id=new_source.id,
@@ -66,9 +135,15 @@ class SourceService:
             backend_filters=new_source.backend_filters or [],
             api_filters=new_source.api_filters or [],
             mapping=new_source.mapping or {},
+            records_path=new_source.records_path,
+            replay_fixture=new_source.replay_fixture,
+            pagination=new_source.pagination,
             created_at=new_source.created_at,
             is_active=new_source.is_active,
             auth_required=new_source.auth_required,
+            cache_ttl_seconds=new_source.cache_ttl_seconds,
+            cache_stale_seconds=new_source.cache_stale_seconds,
+            version=new_source.version,
         )
 
     async def update_source(
@@ -94,11 +169,13 @@ class SourceService:
         update_data = payload.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(source, field, value)
+        source.version = (source.version or 1) + 1
 
         # Commit changes
         self.session.add(source)
         await self.session.commit()
         await self.session.refresh(source)
+        source_cache.invalidate(source_id)
 
         # Return updated source
         return SourceResponse(
@@ -109,8 +186,14 @@ class SourceService:
             backend_filters=source.backend_filters or [],
             api_filters=source.api_filters or [],
             mapping=source.mapping or {},
+            records_path=source.records_path,
+            replay_fixture=source.replay_fixture,
+            pagination=source.pagination,
             created_at=source.created_at,
             updated_at=source.updated_at,
             is_active=source.is_active,
             auth_required=source.auth_required,
+            cache_ttl_seconds=source.cache_ttl_seconds,
+            cache_stale_seconds=source.cache_stale_seconds,
+            version=source.version,
         )
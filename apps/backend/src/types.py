@@ -1,5 +1,5 @@
 from typing import Optional, List, Literal
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 # ---- QueryParamDescriptor ----
@@ -23,3 +23,34 @@ class FilterDescriptor(BaseModel):
     label: Optional[str] = None
     filterable: bool = True
     options: Optional[List[str]] = None
+
+
+# ---- PaginationDescriptor ----
+class PaginationDescriptor(BaseModel):
+    """
+    How to walk an upstream API's pages.
+
+    - "offset": `offset_param` = start + n * page_size (e.g. CMC `start`, 1-based)
+    - "page": `page_param` = start + n
+    - "cursor": `cursor_param` = value at `cursor_path` in the previous response
+    - "link": follow the `rel="next"` URL of the Link response header
+
+    Offset and page pagination fetch up to `parallelism` pages concurrently;
+    cursor and link pagination are sequential by nature.
+    """
+
+    type: Literal["offset", "page", "cursor", "link"]
+    page_size: int = Field(100, ge=1)
+    # Query param carrying page_size (None when the API has a fixed page size)
+    limit_param: Optional[str] = "limit"
+    offset_param: str = "offset"
+    page_param: str = "page"
+    cursor_param: str = "cursor"
+    # JMESPath to the next cursor in a response body (cursor pagination)
+    cursor_path: str = "next_cursor"
+    # JMESPath to the total item count, lets offset/page stop without probing
+    total_path: Optional[str] = None
+    # First offset / page number
+    start: int = 0
+    max_pages: int = Field(10, ge=1)
+    parallelism: int = Field(4, ge=1)
@@ -1,4364 +0,0 @@
-mock_response = {
-    "data": [
-        {
-            "id": 1,
-            "name": "Bitcoin",
-            "symbol": "BTC",
-            "slug": "bitcoin",
-            "num_market_pairs": 12414,
-            "date_added": "2010-07-13T00: 00: 00.000Z",
-            "tags": [
-                "mineable",
-                "pow",
-                "sha-256",
-                "store-of-value",
-                "state-channel",
-                "coinbase-ventures-portfolio",
-                "three-arrows-capital-portfolio",
-                "polychain-capital-portfolio",
-                "binance-labs-portfolio",
-                "blockchain-capital-portfolio",
-                "boostvc-portfolio",
-                "cms-holdings-portfolio",
-                "dcg-portfolio",
-                "dragonfly-capital-portfolio",
-                "electric-capital-portfolio",
-                "fabric-ventures-portfolio",
-                "framework-ventures-portfolio",
-                "galaxy-digital-portfolio",
-                "huobi-capital-portfolio",
-                "alameda-research-portfolio",
-                "a16z-portfolio",
-                "1confirmation-portfolio",
-                "winklevoss-capital-portfolio",
-                "usv-portfolio",
-                "placeholder-ventures-portfolio",
-                "pantera-capital-portfolio",
-                "multicoin-capital-portfolio",
-                "paradigm-portfolio",
-                "bitcoin-ecosystem",
-                "layer-1",
-                "ftx-bankruptcy-estate",
-                "2017-2018-alt-season",
-                "us-strategic-crypto-reserve",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 21000000,
-            "circulating_supply": 19931834,
-            "total_supply": 19931834,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 1,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 123400.92897265778,
-                    "volume_24h": 67953141603.66287,
-                    "volume_change_24h": -12.5695,
-                    "percent_change_1h": -0.45097409,
-                    "percent_change_24h": 1.53591018,
-                    "percent_change_7d": 5.06658477,
-                    "percent_change_30d": 9.96235748,
-                    "percent_change_60d": 5.72817114,
-                    "percent_change_90d": 8.53860904,
-                    "market_cap": 2459606831728.8057,
-                    "market_cap_dominance": 58.1893,
-                    "fully_diluted_market_cap": 2591419508425.81,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 1027,
-            "name": "Ethereum",
-            "symbol": "ETH",
-            "slug": "ethereum",
-            "num_market_pairs": 10875,
-            "date_added": "2015-08-07T00: 00: 00.000Z",
-            "tags": [
-                "pos",
-                "smart-contracts",
-                "ethereum-ecosystem",
-                "coinbase-ventures-portfolio",
-                "three-arrows-capital-portfolio",
-                "polychain-capital-portfolio",
-                "binance-labs-portfolio",
-                "blockchain-capital-portfolio",
-                "boostvc-portfolio",
-                "cms-holdings-portfolio",
-                "dcg-portfolio",
-                "dragonfly-capital-portfolio",
-                "electric-capital-portfolio",
-                "fabric-ventures-portfolio",
-                "framework-ventures-portfolio",
-                "hashkey-capital-portfolio",
-                "kenetic-capital-portfolio",
-                "huobi-capital-portfolio",
-                "alameda-research-portfolio",
-                "a16z-portfolio",
-                "1confirmation-portfolio",
-                "winklevoss-capital-portfolio",
-                "usv-portfolio",
-                "placeholder-ventures-portfolio",
-                "pantera-capital-portfolio",
-                "multicoin-capital-portfolio",
-                "paradigm-portfolio",
-                "ethereum-pow-ecosystem",
-                "layer-1",
-                "ftx-bankruptcy-estate",
-                "sora-ecosystem",
-                "rsk-rbtc-ecosystem",
-                "world-liberty-financial-portfolio",
-                "us-strategic-crypto-reserve",
-                "binance-ecosystem",
-                "binance-listing",
-                "sophon-ecosystem",
-            ],
-            "max_supply": None,
-            "circulating_supply": 120703250.5285526,
-            "total_supply": 120703250.5285526,
-            "infinite_supply": True,
-            "platform": None,
-            "cmc_rank": 2,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 4511.69774238652,
-                    "volume_24h": 44482574491.94632,
-                    "volume_change_24h": -17.6122,
-                    "percent_change_1h": -0.48398198,
-                    "percent_change_24h": 0.54987903,
-                    "percent_change_7d": 4.52710072,
-                    "percent_change_30d": 4.51647237,
-                    "percent_change_60d": 6.16157818,
-                    "percent_change_90d": 59.91972469,
-                    "market_cap": 544576582908.3853,
-                    "market_cap_dominance": 12.8836,
-                    "fully_diluted_market_cap": 544576582908.39,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 1839,
-            "name": "BNB",
-            "symbol": "BNB",
-            "slug": "bnb",
-            "num_market_pairs": 2793,
-            "date_added": "2017-07-25T00: 00: 00.000Z",
-            "tags": [
-                "marketplace",
-                "centralized-exchange",
-                "payments",
-                "smart-contracts",
-                "alameda-research-portfolio",
-                "multicoin-capital-portfolio",
-                "bnb-chain-ecosystem",
-                "layer-1",
-                "alleged-sec-securities",
-                "celsius-bankruptcy-estate",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 139183569.79,
-            "total_supply": 139183569.79,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 3,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 1316.0586812543006,
-                    "volume_24h": 8639312888.107973,
-                    "volume_change_24h": -15.2899,
-                    "percent_change_1h": 0.11099911,
-                    "percent_change_24h": 2.22741849,
-                    "percent_change_7d": 28.90104788,
-                    "percent_change_30d": 49.67376105,
-                    "percent_change_60d": 62.89168692,
-                    "percent_change_90d": 93.87630901,
-                    "market_cap": 183173745310.0933,
-                    "market_cap_dominance": 4.3335,
-                    "fully_diluted_market_cap": 183173745310.09,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 825,
-            "name": "Tether USDt",
-            "symbol": "USDT",
-            "slug": "tether",
-            "num_market_pairs": 151238,
-            "date_added": "2015-02-25T00: 00: 00.000Z",
-            "tags": [
-                "stablecoin",
-                "asset-backed-stablecoin",
-                "usd-stablecoin",
-                "ethereum-pow-ecosystem",
-                "fiat-stablecoin",
-                "tron20-ecosystem",
-                "rsk-rbtc-ecosystem",
-                "venom-ecosystem",
-                "world-liberty-financial-portfolio",
-                "binance-ecosystem",
-                "binance-listing",
-                "peaq-ecosystem",
-                "apertum-ecosystem",
-                "etherlink-ecosystem",
-                "duckchain-ecosystem",
-                "onus-ecosystem",
-                "sophon-ecosystem",
-                "zedxion-smart-chain-ecosystem",
-                "xlayer-ecosystem",
-            ],
-            "max_supply": None,
-            "circulating_supply": 177914235131.0418,
-            "total_supply": 181026669414.14813,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0xdac17f958d2ee523a2206206994597c13d831ec7",
-            },
-            "infinite_supply": True,
-            "cmc_rank": 4,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 1.0004371508494505,
-                    "volume_24h": 170426439361.55426,
-                    "volume_change_24h": -11.4971,
-                    "percent_change_1h": 0.01236115,
-                    "percent_change_24h": 0.00348642,
-                    "percent_change_7d": 0.00461277,
-                    "percent_change_30d": 0.0395836,
-                    "percent_change_60d": 0.02735603,
-                    "percent_change_90d": -0.00241857,
-                    "market_cap": 177992010490.0587,
-                    "market_cap_dominance": 4.2109,
-                    "fully_diluted_market_cap": 181105805376.46,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 52,
-            "name": "XRP",
-            "symbol": "XRP",
-            "slug": "xrp",
-            "num_market_pairs": 1717,
-            "date_added": "2013-08-04T00: 00: 00.000Z",
-            "tags": [
-                "medium-of-exchange",
-                "enterprise-solutions",
-                "xrp-ecosystem",
-                "arrington-xrp-capital-portfolio",
-                "galaxy-digital-portfolio",
-                "a16z-portfolio",
-                "pantera-capital-portfolio",
-                "ftx-bankruptcy-estate",
-                "2017-2018-alt-season",
-                "klaytn-ecosystem",
-                "made-in-america",
-                "us-strategic-crypto-reserve",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 100000000000,
-            "circulating_supply": 59871700035,
-            "total_supply": 99985791876,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 5,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 2.9062924216519654,
-                    "volume_24h": 5166235889.559277,
-                    "volume_change_24h": -30.4264,
-                    "percent_change_1h": -0.295429,
-                    "percent_change_24h": 1.28602214,
-                    "percent_change_7d": -1.10930769,
-                    "percent_change_30d": -2.46426283,
-                    "percent_change_60d": -11.61410525,
-                    "percent_change_90d": 16.33930968,
-                    "market_cap": 174004668083.14023,
-                    "market_cap_dominance": 4.1166,
-                    "fully_diluted_market_cap": 290629242165.2,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 5426,
-            "name": "Solana",
-            "symbol": "SOL",
-            "slug": "solana",
-            "num_market_pairs": 1014,
-            "date_added": "2020-04-10T00: 00: 00.000Z",
-            "tags": [
-                "pos",
-                "platform",
-                "solana-ecosystem",
-                "cms-holdings-portfolio",
-                "kenetic-capital-portfolio",
-                "alameda-research-portfolio",
-                "multicoin-capital-portfolio",
-                "okx-ventures-portfolio",
-                "layer-1",
-                "ftx-bankruptcy-estate",
-                "alleged-sec-securities",
-                "cmc-crypto-awards-2024",
-                "made-in-america",
-                "us-strategic-crypto-reserve",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 546208192.8017838,
-            "total_supply": 611446125.5923842,
-            "infinite_supply": True,
-            "platform": None,
-            "cmc_rank": 6,
-            "self_reported_circulating_supply": 525236893.3,
-            "self_reported_market_cap": 119932379797.64346,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 228.33959557586064,
-                    "volume_24h": 7269786633.851954,
-                    "volume_change_24h": -22.5101,
-                    "percent_change_1h": 0.5909397,
-                    "percent_change_24h": 2.67873821,
-                    "percent_change_7d": 4.07637096,
-                    "percent_change_30d": 5.42576308,
-                    "percent_change_60d": 25.21054334,
-                    "percent_change_90d": 43.03306282,
-                    "market_cap": 124720957844.58102,
-                    "market_cap_dominance": 2.9506,
-                    "fully_diluted_market_cap": 139617361034.19,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 3408,
-            "name": "USDC",
-            "symbol": "USDC",
-            "slug": "usd-coin",
-            "num_market_pairs": 32650,
-            "date_added": "2018-10-08T00: 00: 00.000Z",
-            "tags": [
-                "medium-of-exchange",
-                "stablecoin",
-                "asset-backed-stablecoin",
-                "coinbase-ventures-portfolio",
-                "usd-stablecoin",
-                "xdc-ecosystem",
-                "ethereum-pow-ecosystem",
-                "fiat-stablecoin",
-                "tron20-ecosystem",
-                "venom-ecosystem",
-                "made-in-america",
-                "world-liberty-financial-portfolio",
-                "sonic-ecosystem",
-                "binance-ecosystem",
-                "binance-listing",
-                "hyperevm-ecosystem",
-                "etherlink-ecosystem",
-                "unichain-ecosystem",
-                "vector-smart-chain-ecosystem",
-                "sophon-ecosystem",
-                "xlayer-ecosystem",
-            ],
-            "max_supply": None,
-            "circulating_supply": 75623345835.98653,
-            "total_supply": 75623345835.98653,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 7,
-            "self_reported_circulating_supply": 60901219650.23,
-            "self_reported_market_cap": 60893100068.91378,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.999866676211694,
-                    "volume_24h": 19678484109.459465,
-                    "volume_change_24h": -14.3661,
-                    "percent_change_1h": 0.00627641,
-                    "percent_change_24h": 0.01464286,
-                    "percent_change_7d": 0.0091287,
-                    "percent_change_30d": 0.01715199,
-                    "percent_change_60d": -0.00333684,
-                    "percent_change_90d": 0.0008734,
-                    "market_cap": 75613263445.0353,
-                    "market_cap_dominance": 1.7889,
-                    "fully_diluted_market_cap": 75613263445.04,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 74,
-            "name": "Dogecoin",
-            "symbol": "DOGE",
-            "slug": "dogecoin",
-            "num_market_pairs": 1317,
-            "date_added": "2013-12-15T00: 00: 00.000Z",
-            "tags": [
-                "mineable",
-                "pow",
-                "scrypt",
-                "medium-of-exchange",
-                "memes",
-                "payments",
-                "doggone-doggerel",
-                "osmosis-ecosystem",
-                "ftx-bankruptcy-estate",
-                "animal-memes",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 151267986383.70526,
-            "total_supply": 151267986383.70526,
-            "infinite_supply": True,
-            "platform": None,
-            "cmc_rank": 8,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.25832525918634774,
-                    "volume_24h": 3321948941.5257087,
-                    "volume_change_24h": -22.3807,
-                    "percent_change_1h": -0.57008731,
-                    "percent_change_24h": 3.57709711,
-                    "percent_change_7d": 4.82728065,
-                    "percent_change_30d": 8.30740858,
-                    "percent_change_60d": 5.24541255,
-                    "percent_change_90d": 38.49813014,
-                    "market_cap": 39076341789.16758,
-                    "market_cap_dominance": 0.9245,
-                    "fully_diluted_market_cap": 39076341789.17,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 1958,
-            "name": "TRON",
-            "symbol": "TRX",
-            "slug": "tron",
-            "num_market_pairs": 1238,
-            "date_added": "2017-09-13T00: 00: 00.000Z",
-            "tags": [
-                "media",
-                "payments",
-                "tron-ecosystem",
-                "layer-1",
-                "dwf-labs-portfolio",
-                "alleged-sec-securities",
-                "2017-2018-alt-season",
-                "tron20-ecosystem",
-                "world-liberty-financial-portfolio",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 94668076010.6295,
-            "total_supply": 94668079791.2698,
-            "infinite_supply": True,
-            "platform": None,
-            "cmc_rank": 9,
-            "self_reported_circulating_supply": 94667886298.43,
-            "self_reported_market_cap": 32196091755.204334,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.34009517920057636,
-                    "volume_24h": 865777912.0309224,
-                    "volume_change_24h": -2.1262,
-                    "percent_change_1h": 0.20171633,
-                    "percent_change_24h": 0.57198206,
-                    "percent_change_7d": -0.44915439,
-                    "percent_change_30d": 2.44022514,
-                    "percent_change_60d": 1.07998766,
-                    "percent_change_90d": 16.70759407,
-                    "market_cap": 32196156275.408825,
-                    "market_cap_dominance": 0.7617,
-                    "fully_diluted_market_cap": 32196157561.19,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 2010,
-            "name": "Cardano",
-            "symbol": "ADA",
-            "slug": "cardano",
-            "num_market_pairs": 1594,
-            "date_added": "2017-10-01T00: 00: 00.000Z",
-            "tags": [
-                "dpos",
-                "pos",
-                "platform",
-                "research",
-                "smart-contracts",
-                "staking",
-                "cardano-ecosystem",
-                "cardano",
-                "layer-1",
-                "alleged-sec-securities",
-                "2017-2018-alt-season",
-                "made-in-america",
-                "us-strategic-crypto-reserve",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 45000000000,
-            "circulating_supply": 35827299997.723114,
-            "total_supply": 44994581886.50792,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 10,
-            "self_reported_circulating_supply": 37997904336,
-            "self_reported_market_cap": 31883150832.047432,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.8390765593312123,
-                    "volume_24h": 1315073119.9761965,
-                    "volume_change_24h": -16.296,
-                    "percent_change_1h": -0.24545577,
-                    "percent_change_24h": 1.38014391,
-                    "percent_change_7d": -0.56066775,
-                    "percent_change_30d": -3.2440195,
-                    "percent_change_60d": 2.56957289,
-                    "percent_change_90d": 28.16159734,
-                    "market_cap": 30061847612.21666,
-                    "market_cap_dominance": 0.7112,
-                    "fully_diluted_market_cap": 37758445169.9,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 32196,
-            "name": "Hyperliquid",
-            "symbol": "HYPE",
-            "slug": "hyperliquid",
-            "num_market_pairs": 166,
-            "date_added": "2024-07-15T10: 14: 50.000Z",
-            "tags": [
-                "decentralized-exchange-dex-token",
-                "defi",
-                "derivatives",
-                "layer-1",
-                "hyperliquid-ecosystem",
-                "binance-ecosystem",
-                "binance-listing",
-                "perp-dex-coins",
-            ],
-            "max_supply": 1000000000,
-            "circulating_supply": 336685219,
-            "total_supply": 999584316,
-            "platform": {
-                "id": 32196,
-                "name": "Hyperliquid",
-                "symbol": "HYPE",
-                "slug": "hyperliquid",
-                "token_address": "0x0d01dc56dcaaca66ad901c959b4011ec",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 11,
-            "self_reported_circulating_supply": 333931719,
-            "self_reported_market_cap": 15572303196.995392,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 46.63319568332289,
-                    "volume_24h": 436410468.8965869,
-                    "volume_change_24h": -35.7852,
-                    "percent_change_1h": 0.32856675,
-                    "percent_change_24h": 3.96356049,
-                    "percent_change_7d": -0.82955374,
-                    "percent_change_30d": -7.62450918,
-                    "percent_change_60d": 6.35491541,
-                    "percent_change_90d": 8.43402731,
-                    "market_cap": 15700707701.309422,
-                    "market_cap_dominance": 0.3714,
-                    "fully_diluted_market_cap": 46633195683.32,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 1975,
-            "name": "Chainlink",
-            "symbol": "LINK",
-            "slug": "chainlink",
-            "num_market_pairs": 2112,
-            "date_added": "2017-09-20T00: 00: 00.000Z",
-            "tags": [
-                "platform",
-                "cosmos-ecosystem",
-                "defi",
-                "interoperability",
-                "oracles",
-                "smart-contracts",
-                "ethereum-ecosystem",
-                "polkadot",
-                "tokenized-stock",
-                "polkadot-ecosystem",
-                "avalanche-ecosystem",
-                "solana-ecosystem",
-                "framework-ventures-portfolio",
-                "polygon-ecosystem",
-                "fantom-ecosystem",
-                "cardano-ecosystem",
-                "web3",
-                "near-protocol-ecosystem",
-                "arbitrum-ecosystem",
-                "defi-2",
-                "cross-chain",
-                "cronos-ecosystem",
-                "cardano",
-                "injective-ecosystem",
-                "bnb-chain-ecosystem",
-                "oasis-ecosystem",
-                "metisdao-ecosystem",
-                "aptos-ecosystem",
-                "sui-ecosystem",
-                "optimism-ecosystem",
-                "bitcoin-ecosystem",
-                "real-world-assets-protocols",
-                "zksync-era-ecosystem",
-                "base-ecosystem",
-                "linea-ecosystem",
-                "sei-ecosystem",
-                "blast-ecosystem",
-                "move-vm",
-                "hyperliquid-ecosystem",
-                "gnosis-chain-ecosystem",
-                "core-ecosystem",
-                "x-layer-ecosystem",
-                "made-in-america",
-                "world-liberty-financial-portfolio",
-                "corn-ecosystem",
-                "sonic-ecosystem",
-                "binance-ecosystem",
-                "binance-listing",
-                "tokenized-assets",
-                "xstocks-ecosystem",
-                "hyperevm-ecosystem",
-                "bera-chain-ecosystem",
-                "unichain-ecosystem",
-                "wlfi-ecosystem",
-                "plasma-ecosystem",
-            ],
-            "max_supply": 1000000000,
-            "circulating_supply": 678099970.4525867,
-            "total_supply": 1000000000,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x514910771af9ca656af840dff83e8264ecf986ca",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 12,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 22.46431003893085,
-                    "volume_24h": 843405580.0147332,
-                    "volume_change_24h": -38.0349,
-                    "percent_change_1h": 0.09059134,
-                    "percent_change_24h": 2.51070211,
-                    "percent_change_7d": -0.48006412,
-                    "percent_change_30d": -2.60754344,
-                    "percent_change_60d": 5.57970381,
-                    "percent_change_90d": 53.23171314,
-                    "market_cap": 15233047973.636755,
-                    "market_cap_dominance": 0.3604,
-                    "fully_diluted_market_cap": 22464310038.93,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 29470,
-            "name": "Ethena USDe",
-            "symbol": "USDe",
-            "slug": "ethena-usde",
-            "num_market_pairs": 226,
-            "date_added": "2024-02-20T11: 05: 01.000Z",
-            "tags": [
-                "stablecoin",
-                "asset-backed-stablecoin",
-                "binance-labs-portfolio",
-                "dragonfly-capital-portfolio",
-                "usd-stablecoin",
-                "eigenlayer-ecosystem",
-                "binance-ecosystem",
-                "binance-listing",
-                "xlayer-ecosystem",
-                "plasma-ecosystem",
-            ],
-            "max_supply": None,
-            "circulating_supply": 14822125664.021248,
-            "total_supply": 14822125664.021248,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x4c9edd5852cd905f086c759e8383e09bff1e68b3",
-            },
-            "infinite_supply": True,
-            "cmc_rank": 13,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 1.0003420925907482,
-                    "volume_24h": 354589360.59996164,
-                    "volume_change_24h": -8.0641,
-                    "percent_change_1h": 0.00099563,
-                    "percent_change_24h": 0.04591998,
-                    "percent_change_7d": -0.07987211,
-                    "percent_change_30d": -0.03754069,
-                    "percent_change_60d": -0.06359615,
-                    "percent_change_90d": -0.07102614,
-                    "market_cap": 14827196203.390049,
-                    "market_cap_dominance": 0.3508,
-                    "fully_diluted_market_cap": 14827196203.39,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 20947,
-            "name": "Sui",
-            "symbol": "SUI",
-            "slug": "sui",
-            "num_market_pairs": 787,
-            "date_added": "2022-07-12T08: 03: 11.000Z",
-            "tags": [
-                "binance-launchpool",
-                "coinbase-ventures-portfolio",
-                "binance-labs-portfolio",
-                "electric-capital-portfolio",
-                "a16z-portfolio",
-                "sui-ecosystem",
-                "layer-1",
-                "move-vm",
-                "cmc-crypto-yearbook-2024-2025",
-                "made-in-america",
-                "world-liberty-financial-portfolio",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 10000000000,
-            "circulating_supply": 3625742933.075554,
-            "total_supply": 10000000000,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 14,
-            "self_reported_circulating_supply": 3625742933.08,
-            "self_reported_market_cap": 12825636411.981684,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 3.5373816204577273,
-                    "volume_24h": 1013016601.2942326,
-                    "volume_change_24h": -14.9658,
-                    "percent_change_1h": -0.51223462,
-                    "percent_change_24h": 2.27612827,
-                    "percent_change_7d": 1.02497621,
-                    "percent_change_30d": 2.13734812,
-                    "percent_change_60d": -10.87908392,
-                    "percent_change_90d": 3.21985586,
-                    "market_cap": 12825636411.965956,
-                    "market_cap_dominance": 0.3034,
-                    "fully_diluted_market_cap": 35373816204.58,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 512,
-            "name": "Stellar",
-            "symbol": "XLM",
-            "slug": "stellar",
-            "num_market_pairs": 758,
-            "date_added": "2014-08-05T00: 00: 00.000Z",
-            "tags": [
-                "medium-of-exchange",
-                "enterprise-solutions",
-                "decentralized-exchange-dex-token",
-                "defi",
-                "smart-contracts",
-                "hashkey-capital-portfolio",
-                "real-world-assets-protocols",
-                "2017-2018-alt-season",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 50001806812,
-            "circulating_supply": 31978547082.784893,
-            "total_supply": 50001786884.69562,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 15,
-            "self_reported_circulating_supply": 31531408660,
-            "self_reported_market_cap": 12276133892.76386,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.3893303348777143,
-                    "volume_24h": 316319784.8156648,
-                    "volume_change_24h": -8.3636,
-                    "percent_change_1h": -0.2604893,
-                    "percent_change_24h": 0.87077838,
-                    "percent_change_7d": -0.72138316,
-                    "percent_change_30d": 3.5723519,
-                    "percent_change_60d": -14.11263807,
-                    "percent_change_90d": 29.56517778,
-                    "market_cap": 12450218444.643396,
-                    "market_cap_dominance": 0.2945,
-                    "fully_diluted_market_cap": 19467220190.61,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 5805,
-            "name": "Avalanche",
-            "symbol": "AVAX",
-            "slug": "avalanche",
-            "num_market_pairs": 980,
-            "date_added": "2020-07-13T00: 00: 00.000Z",
-            "tags": [
-                "smart-contracts",
-                "three-arrows-capital-portfolio",
-                "polychain-capital-portfolio",
-                "avalanche-ecosystem",
-                "cms-holdings-portfolio",
-                "dragonfly-capital-portfolio",
-                "real-world-assets-protocols",
-                "layer-1",
-                "made-in-america",
-                "world-liberty-financial-portfolio",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 715748719,
-            "circulating_supply": 422275285.48916084,
-            "total_supply": 457277985.48916084,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 16,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 10: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 29.21849528998767,
-                    "volume_24h": 822120426.2686027,
-                    "volume_change_24h": -19.7193,
-                    "percent_change_1h": 0.77509858,
-                    "percent_change_24h": 2.73859739,
-                    "percent_change_7d": -4.61622369,
-                    "percent_change_30d": 14.60567169,
-                    "percent_change_60d": 19.22425032,
-                    "percent_change_90d": 47.06088478,
-                    "market_cap": 12338248440.143244,
-                    "market_cap_dominance": 0.2919,
-                    "fully_diluted_market_cap": 20913100574.92,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 10: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 1831,
-            "name": "Bitcoin Cash",
-            "symbol": "BCH",
-            "slug": "bitcoin-cash",
-            "num_market_pairs": 1068,
-            "date_added": "2017-07-23T00: 00: 00.000Z",
-            "tags": [
-                "mineable",
-                "pow",
-                "sha-256",
-                "marketplace",
-                "medium-of-exchange",
-                "store-of-value",
-                "enterprise-solutions",
-                "payments",
-                "layer-1",
-                "2017-2018-alt-season",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 21000000,
-            "circulating_supply": 19936287.5,
-            "total_supply": 19936287.5,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 17,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 586.6991108722741,
-                    "volume_24h": 294462873.93372,
-                    "volume_change_24h": -23.2558,
-                    "percent_change_1h": 0.11470728,
-                    "percent_change_24h": 1.7421915,
-                    "percent_change_7d": 0.46375565,
-                    "percent_change_30d": -0.35240241,
-                    "percent_change_60d": 2.43007024,
-                    "percent_change_90d": 15.02241534,
-                    "market_cap": 11696602150.344032,
-                    "market_cap_dominance": 0.2767,
-                    "fully_diluted_market_cap": 12320681328.32,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 4642,
-            "name": "Hedera",
-            "symbol": "HBAR",
-            "slug": "hedera",
-            "num_market_pairs": 383,
-            "date_added": "2019-09-17T00: 00: 00.000Z",
-            "tags": [
-                "dag",
-                "marketplace",
-                "enterprise-solutions",
-                "payments",
-                "dcg-portfolio",
-                "hedera-hashgraph-ecosystem",
-                "real-world-assets-protocols",
-                "layer-1",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 50000000000,
-            "circulating_supply": 42401692971.07867,
-            "total_supply": 50000000000,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 18,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.22024895598763433,
-                    "volume_24h": 271052117.5052188,
-                    "volume_change_24h": -18.7091,
-                    "percent_change_1h": -0.31150453,
-                    "percent_change_24h": 1.2422779,
-                    "percent_change_7d": -1.25993297,
-                    "percent_change_30d": -2.75399014,
-                    "percent_change_60d": -17.4324565,
-                    "percent_change_90d": 21.6009721,
-                    "market_cap": 9338928608.988289,
-                    "market_cap_dominance": 0.2209,
-                    "fully_diluted_market_cap": 11012447799.38,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 2,
-            "name": "Litecoin",
-            "symbol": "LTC",
-            "slug": "litecoin",
-            "num_market_pairs": 1433,
-            "date_added": "2013-04-28T00: 00: 00.000Z",
-            "tags": [
-                "mineable",
-                "pow",
-                "scrypt",
-                "medium-of-exchange",
-                "layer-1",
-                "2017-2018-alt-season",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 84000000,
-            "circulating_supply": 76385214.48347135,
-            "total_supply": 84000000,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 19,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 118.6264724555107,
-                    "volume_24h": 636753386.6041504,
-                    "volume_change_24h": -21.9426,
-                    "percent_change_1h": -0.41959354,
-                    "percent_change_24h": 2.49251495,
-                    "percent_change_7d": 6.51398053,
-                    "percent_change_30d": 5.08820448,
-                    "percent_change_60d": -3.01202229,
-                    "percent_change_90d": 27.83946715,
-                    "market_cap": 9061308541.931791,
-                    "market_cap_dominance": 0.2144,
-                    "fully_diluted_market_cap": 9964623686.26,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 3957,
-            "name": "UNUS SED LEO",
-            "symbol": "LEO",
-            "slug": "unus-sed-leo",
-            "num_market_pairs": 62,
-            "date_added": "2019-05-21T00: 00: 00.000Z",
-            "tags": [
-                "marketplace",
-                "centralized-exchange",
-                "discount-token",
-                "payments",
-                "ethereum-ecosystem",
-                "kenetic-capital-portfolio",
-                "alameda-research-portfolio",
-            ],
-            "max_supply": None,
-            "circulating_supply": 922494497.9,
-            "total_supply": 985239504,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x2af5d2ad76741191d15dfe7bf6ac92d4bd912ca3",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 20,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 9.658216686151034,
-                    "volume_24h": 682261.71762524,
-                    "volume_change_24h": -13.0221,
-                    "percent_change_1h": 0.09831535,
-                    "percent_change_24h": 0.35538119,
-                    "percent_change_7d": 1.09024589,
-                    "percent_change_30d": 1.26476037,
-                    "percent_change_60d": 7.23618671,
-                    "percent_change_90d": 6.238139,
-                    "market_cap": 8909651752.5003,
-                    "market_cap_dominance": 0.2108,
-                    "fully_diluted_market_cap": 9515656617.39,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 27075,
-            "name": "Mantle",
-            "symbol": "MNT",
-            "slug": "mantle",
-            "num_market_pairs": 193,
-            "date_added": "2023-07-17T11: 00: 31.000Z",
-            "tags": ["ethereum-ecosystem", "layer-2", "dwf-labs-portfolio"],
-            "max_supply": 6219316795,
-            "circulating_supply": 3252944055.7368407,
-            "total_supply": 6219316794.89,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x3c3a81e81dc49a522a592e7622a7e711c06bf354",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 21,
-            "self_reported_circulating_supply": 3252944055.74,
-            "self_reported_market_cap": 8671829163.934446,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 2.665840240514596,
-                    "volume_24h": 689081057.3863634,
-                    "volume_change_24h": 39.3583,
-                    "percent_change_1h": -0.4549917,
-                    "percent_change_24h": 16.46140367,
-                    "percent_change_7d": 40.75077703,
-                    "percent_change_30d": 125.68401875,
-                    "percent_change_60d": 152.95741922,
-                    "percent_change_90d": 344.68198622,
-                    "market_cap": 8671829163.926025,
-                    "market_cap_dominance": 0.2052,
-                    "fully_diluted_market_cap": 16579704980.62,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 5994,
-            "name": "Shiba Inu",
-            "symbol": "SHIB",
-            "slug": "shiba-inu",
-            "num_market_pairs": 1004,
-            "date_added": "2020-08-01T00: 00: 00.000Z",
-            "tags": [
-                "memes",
-                "ethereum-ecosystem",
-                "doggone-doggerel",
-                "bnb-chain-ecosystem",
-                "base-ecosystem",
-                "animal-memes",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 589552695333683,
-            "circulating_supply": 589245765482851.1,
-            "total_supply": 589500897439091,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x95ad61b0a150d79219dcf64e1e6cc01f0b64c4ce",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 22,
-            "self_reported_circulating_supply": 589551575078137,
-            "self_reported_market_cap": 7293773663.737682,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 1.2371731281984943e-05,
-                    "volume_24h": 181695801.3019643,
-                    "volume_change_24h": -29.5413,
-                    "percent_change_1h": -0.34836339,
-                    "percent_change_24h": 1.21081805,
-                    "percent_change_7d": 0.33124099,
-                    "percent_change_30d": -4.21799349,
-                    "percent_change_60d": -10.70984789,
-                    "percent_change_90d": -3.8041101,
-                    "market_cap": 7289990269.601353,
-                    "market_cap_dominance": 0.1725,
-                    "fully_diluted_market_cap": 7293787523.24,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 11419,
-            "name": "Toncoin",
-            "symbol": "TON",
-            "slug": "toncoin",
-            "num_market_pairs": 801,
-            "date_added": "2021-08-26T13: 40: 22.000Z",
-            "tags": [
-                "pos",
-                "layer-1",
-                "ftx-bankruptcy-estate",
-                "dwf-labs-portfolio",
-                "toncoin-ecosystem",
-                "cmc-crypto-yearbook-2024-2025",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 2518765568.6418953,
-            "total_supply": 5142589408.578469,
-            "infinite_supply": True,
-            "platform": None,
-            "cmc_rank": 23,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 2.768819086331209,
-                    "volume_24h": 148745560.19072068,
-                    "volume_change_24h": -16.9339,
-                    "percent_change_1h": 0.06908145,
-                    "percent_change_24h": -0.21592167,
-                    "percent_change_7d": -0.33072392,
-                    "percent_change_30d": -10.69051903,
-                    "percent_change_60d": -19.14772065,
-                    "percent_change_90d": -4.49450482,
-                    "market_cap": 6974006180.44956,
-                    "market_cap_dominance": 0.165,
-                    "fully_diluted_market_cap": 14238899707.64,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 3635,
-            "name": "Cronos",
-            "symbol": "CRO",
-            "slug": "cronos",
-            "num_market_pairs": 326,
-            "date_added": "2018-12-14T00: 00: 00.000Z",
-            "tags": [
-                "medium-of-exchange",
-                "centralized-exchange",
-                "mobile",
-                "payments",
-                "layer-1",
-            ],
-            "max_supply": 100000000000,
-            "circulating_supply": 34861871551.83745,
-            "total_supply": 98061872172.42912,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 24,
-            "self_reported_circulating_supply": 97393210558,
-            "self_reported_market_cap": 19405499609.933056,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.19924899794094592,
-                    "volume_24h": 52537956.54569742,
-                    "volume_change_24h": 4.2288,
-                    "percent_change_1h": -0.75825576,
-                    "percent_change_24h": 1.53229777,
-                    "percent_change_7d": -0.77103786,
-                    "percent_change_30d": -21.22675327,
-                    "percent_change_60d": 26.8098144,
-                    "percent_change_90d": 107.72535661,
-                    "market_cap": 6946192973.049581,
-                    "market_cap_dominance": 0.1643,
-                    "fully_diluted_market_cap": 19924899794.09,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 6636,
-            "name": "Polkadot",
-            "symbol": "DOT",
-            "slug": "polkadot-new",
-            "num_market_pairs": 968,
-            "date_added": "2020-08-19T00: 00: 00.000Z",
-            "tags": [
-                "defi",
-                "ethereum-ecosystem",
-                "substrate",
-                "polkadot",
-                "polkadot-ecosystem",
-                "three-arrows-capital-portfolio",
-                "polychain-capital-portfolio",
-                "heco-ecosystem",
-                "arrington-xrp-capital-portfolio",
-                "blockchain-capital-portfolio",
-                "boostvc-portfolio",
-                "cms-holdings-portfolio",
-                "coinfund-portfolio",
-                "fabric-ventures-portfolio",
-                "fenbushi-capital-portfolio",
-                "hashkey-capital-portfolio",
-                "kenetic-capital-portfolio",
-                "1confirmation-portfolio",
-                "placeholder-ventures-portfolio",
-                "pantera-capital-portfolio",
-                "exnetwork-capital-portfolio",
-                "web3",
-                "arbitrum-ecosystem",
-                "spartan-group",
-                "optimism-ecosystem",
-                "osmosis-ecosystem",
-                "base-ecosystem",
-                "gnosis-chain-ecosystem",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 1625050050.3478446,
-            "total_supply": 1625050050.3478446,
-            "infinite_supply": True,
-            "platform": None,
-            "cmc_rank": 25,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 4.2166040599981205,
-                    "volume_24h": 283519319.41400063,
-                    "volume_change_24h": -27.9005,
-                    "percent_change_1h": -0.19962813,
-                    "percent_change_24h": 1.57518351,
-                    "percent_change_7d": 2.85439219,
-                    "percent_change_30d": 4.23523869,
-                    "percent_change_60d": 2.1375099,
-                    "percent_change_90d": 13.05235632,
-                    "market_cap": 6852192639.996872,
-                    "market_cap_dominance": 0.1621,
-                    "fully_diluted_market_cap": 6852192640,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 328,
-            "name": "Monero",
-            "symbol": "XMR",
-            "slug": "monero",
-            "num_market_pairs": 327,
-            "date_added": "2014-05-21T00: 00: 00.000Z",
-            "tags": [
-                "mineable",
-                "pow",
-                "medium-of-exchange",
-                "privacy",
-                "ringct",
-                "boostvc-portfolio",
-                "electric-capital-portfolio",
-                "galaxy-digital-portfolio",
-                "layer-1",
-                "2017-2018-alt-season",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 18446744.07370955,
-            "total_supply": 18446744.07370955,
-            "infinite_supply": True,
-            "platform": None,
-            "cmc_rank": 26,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 10: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 334.29684060653636,
-                    "volume_24h": 246988825.51575747,
-                    "volume_change_24h": 2.2161,
-                    "percent_change_1h": -1.88642668,
-                    "percent_change_24h": 5.79083739,
-                    "percent_change_7d": 6.75392833,
-                    "percent_change_30d": 23.09124219,
-                    "percent_change_60d": 21.68215218,
-                    "percent_change_90d": 2.73572283,
-                    "market_cap": 6166688263.318451,
-                    "market_cap_dominance": 0.1459,
-                    "fully_diluted_market_cap": 6166688263.32,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 10: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 4943,
-            "name": "Dai",
-            "symbol": "DAI",
-            "slug": "multi-collateral-dai",
-            "num_market_pairs": 3611,
-            "date_added": "2019-11-22T00: 00: 00.000Z",
-            "tags": [
-                "defi",
-                "stablecoin",
-                "asset-backed-stablecoin",
-                "usd-stablecoin",
-                "binance-ecosystem",
-                "binance-listing",
-                "xlayer-ecosystem",
-            ],
-            "max_supply": None,
-            "circulating_supply": 5365382702.664872,
-            "total_supply": 5365382702.664872,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x6b175474e89094c44da98b954eedeac495271d0f",
-            },
-            "infinite_supply": True,
-            "cmc_rank": 27,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.9998366599571603,
-                    "volume_24h": 126054330.96241234,
-                    "volume_change_24h": -0.345,
-                    "percent_change_1h": 0.00477094,
-                    "percent_change_24h": 0.01515374,
-                    "percent_change_7d": -0.00749119,
-                    "percent_change_30d": 0.0151881,
-                    "percent_change_60d": -0.03219321,
-                    "percent_change_90d": -0.02445657,
-                    "market_cap": 5364506320.824368,
-                    "market_cap_dominance": 0.1269,
-                    "fully_diluted_market_cap": 5364506320.82,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 7083,
-            "name": "Uniswap",
-            "symbol": "UNI",
-            "slug": "uniswap",
-            "num_market_pairs": 1310,
-            "date_added": "2020-09-17T00: 00: 00.000Z",
-            "tags": [
-                "decentralized-exchange-dex-token",
-                "defi",
-                "dao",
-                "ethereum-ecosystem",
-                "yield-farming",
-                "amm",
-                "coinbase-ventures-portfolio",
-                "three-arrows-capital-portfolio",
-                "governance",
-                "heco-ecosystem",
-                "avalanche-ecosystem",
-                "solana-ecosystem",
-                "blockchain-capital-portfolio",
-                "defiance-capital-portfolio",
-                "alameda-research-portfolio",
-                "a16z-portfolio",
-                "pantera-capital-portfolio",
-                "parafi-capital",
-                "paradigm-portfolio",
-                "polygon-ecosystem",
-                "terra-ecosystem",
-                "near-protocol-ecosystem",
-                "arbitrum-ecosystem",
-                "cmc-crypto-awards-2024",
-                "gnosis-chain-ecosystem",
-                "sora-ecosystem",
-                "hoo-smart-chain-ecosystem",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 630330527.71,
-            "total_supply": 1000000000,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x1f9840a85d5af5bf1d1762f925bdaddc4201f984",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 28,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 8.051363203414935,
-                    "volume_24h": 269096912.0455209,
-                    "volume_change_24h": -28.4218,
-                    "percent_change_1h": -0.36764104,
-                    "percent_change_24h": 3.84545807,
-                    "percent_change_7d": 0.02903234,
-                    "percent_change_30d": -16.15615527,
-                    "percent_change_60d": -26.59161305,
-                    "percent_change_90d": -2.47137611,
-                    "market_cap": 5075020016.793412,
-                    "market_cap_dominance": 0.1201,
-                    "fully_diluted_market_cap": 8051363203.41,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 3897,
-            "name": "OKB",
-            "symbol": "OKB",
-            "slug": "okb",
-            "num_market_pairs": 189,
-            "date_added": "2019-04-30T00: 00: 00.000Z",
-            "tags": [
-                "marketplace",
-                "centralized-exchange",
-                "discount-token",
-                "ethereum-ecosystem",
-                "alameda-research-portfolio",
-                "x1-ecosystem",
-                "okexchain-ecosystem",
-                "x-layer-ecosystem",
-                "xlayer-ecosystem",
-            ],
-            "max_supply": 21000000,
-            "circulating_supply": 21000000,
-            "total_supply": 21000000,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x75231f58b43240c9718dd58b4967c5114342a86c",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 29,
-            "self_reported_circulating_supply": 246638974,
-            "self_reported_market_cap": 55166921243.73809,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 223.67479214269716,
-                    "volume_24h": 228293418.4377053,
-                    "volume_change_24h": -22.5524,
-                    "percent_change_1h": 0.1535977,
-                    "percent_change_24h": 2.74498655,
-                    "percent_change_7d": 17.3588959,
-                    "percent_change_30d": 17.76990175,
-                    "percent_change_60d": 375.44142941,
-                    "percent_change_90d": 359.62962975,
-                    "market_cap": 4697170634.99664,
-                    "market_cap_dominance": 0.1111,
-                    "fully_diluted_market_cap": 4697170635,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 33251,
-            "name": "World Liberty Financial",
-            "symbol": "WLFI",
-            "slug": "world-liberty-financial-wlfi",
-            "num_market_pairs": 334,
-            "date_added": "2024-10-01T02: 34: 47.000Z",
-            "tags": [
-                "defi",
-                "ethereum-ecosystem",
-                "solana-ecosystem",
-                "bnb-chain-ecosystem",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-                "wlfi-ecosystem",
-            ],
-            "max_supply": 100000000000,
-            "circulating_supply": 24613427094,
-            "total_supply": 100000000000,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0xdA5e1988097297dCdc1f90D4dFE7909e847CBeF6",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 30,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.18709039912083453,
-                    "volume_24h": 398630506.9489463,
-                    "volume_change_24h": -4.6548,
-                    "percent_change_1h": 0.5730716,
-                    "percent_change_24h": 0.62510348,
-                    "percent_change_7d": -8.31556241,
-                    "percent_change_30d": -10.47654228,
-                    "percent_change_60d": -18.15818061,
-                    "percent_change_90d": -18.15818061,
-                    "market_cap": 4604935898.748022,
-                    "market_cap_dominance": 0.1089,
-                    "fully_diluted_market_cap": 18709039912.08,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 7278,
-            "name": "Aave",
-            "symbol": "AAVE",
-            "slug": "aave",
-            "num_market_pairs": 1160,
-            "date_added": "2020-10-02T00: 00: 00.000Z",
-            "tags": [
-                "defi",
-                "dao",
-                "ethereum-ecosystem",
-                "yield-farming",
-                "three-arrows-capital-portfolio",
-                "governance",
-                "heco-ecosystem",
-                "avalanche-ecosystem",
-                "solana-ecosystem",
-                "lending-borowing",
-                "blockchain-capital-portfolio",
-                "defiance-capital-portfolio",
-                "framework-ventures-portfolio",
-                "alameda-research-portfolio",
-                "pantera-capital-portfolio",
-                "parafi-capital",
-                "polygon-ecosystem",
-                "fantom-ecosystem",
-                "near-protocol-ecosystem",
-                "arbitrum-ecosystem",
-                "optimism-ecosystem",
-                "standard-crypto-portfolio",
-                "gnosis-chain-ecosystem",
-                "sora-ecosystem",
-                "made-in-america",
-                "world-liberty-financial-portfolio",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 15253576.90641637,
-            "total_supply": 16000000,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x7Fc66500c84A76Ad7e9c93437bFc5Ac33E2DDaE9",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 31,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": 0.09604766,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 283.5524988875545,
-                    "volume_24h": 320314728.30373996,
-                    "volume_change_24h": -32.7373,
-                    "percent_change_1h": -0.54300422,
-                    "percent_change_24h": 2.05403964,
-                    "percent_change_7d": -1.24525601,
-                    "percent_change_30d": -6.73831526,
-                    "percent_change_60d": -7.96761144,
-                    "percent_change_90d": -7.36815359,
-                    "market_cap": 4325189848.787855,
-                    "market_cap_dominance": 0.1023,
-                    "fully_diluted_market_cap": 4536839982.2,
-                    "tvl": 45031702258,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 30171,
-            "name": "Ethena",
-            "symbol": "ENA",
-            "slug": "ethena",
-            "num_market_pairs": 356,
-            "date_added": "2024-03-29T04: 42: 08.000Z",
-            "tags": [
-                "defi",
-                "ethereum-ecosystem",
-                "binance-labs-portfolio",
-                "okx-ventures-portfolio",
-                "cmc-crypto-yearbook-2024-2025",
-                "world-liberty-financial-portfolio",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 15000000000,
-            "circulating_supply": 7156250000,
-            "total_supply": 15000000000,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x57e114B691Db790C35207b2e685D4A43181e6061",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 32,
-            "self_reported_circulating_supply": 1479139274,
-            "self_reported_market_cap": 845346877.3459992,
-            "tvl_ratio": 0.27331648,
-            "last_updated": "2025-10-08T19: 10: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.5715126980976906,
-                    "volume_24h": 402011931.38090765,
-                    "volume_change_24h": -18.6663,
-                    "percent_change_1h": -0.00873621,
-                    "percent_change_24h": 3.30385129,
-                    "percent_change_7d": -1.95567294,
-                    "percent_change_30d": -26.20379833,
-                    "percent_change_60d": -24.58746053,
-                    "percent_change_90d": 88.11560875,
-                    "market_cap": 4089887745.761598,
-                    "market_cap_dominance": 0.0968,
-                    "fully_diluted_market_cap": 8572690471.47,
-                    "tvl": 14963926587.58452,
-                    "last_updated": "2025-10-08T19: 10: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 24478,
-            "name": "Pepe",
-            "symbol": "PEPE",
-            "slug": "pepe",
-            "num_market_pairs": 611,
-            "date_added": "2023-04-17T06: 18: 08.000Z",
-            "tags": [
-                "memes",
-                "ethereum-ecosystem",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 420690000000000,
-            "circulating_supply": 420689899653542.56,
-            "total_supply": 420689899653542.56,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x6982508145454ce325ddbe47a25d4ec3d2311933",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 33,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 9.585644793871063e-06,
-                    "volume_24h": 649235255.6299592,
-                    "volume_change_24h": -11.4469,
-                    "percent_change_1h": -0.58215432,
-                    "percent_change_24h": 0.35667943,
-                    "percent_change_7d": -1.67984486,
-                    "percent_change_30d": -6.51173956,
-                    "percent_change_60d": -22.80990268,
-                    "percent_change_90d": -17.58729389,
-                    "market_cap": 4032583946.44812,
-                    "market_cap_dominance": 0.0954,
-                    "fully_diluted_market_cap": 4032584908.33,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 11092,
-            "name": "Bitget Token",
-            "symbol": "BGB",
-            "slug": "bitget-token-new",
-            "num_market_pairs": 40,
-            "date_added": "2021-07-29T00: 00: 00.000Z",
-            "tags": ["centralized-exchange", "ethereum-ecosystem"],
-            "max_supply": 919992035.98,
-            "circulating_supply": 696538673.3103279,
-            "total_supply": 919992035.9787906,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x54D2252757e1672EEaD234D27B1270728fF90581",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 34,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 5.684152539584152,
-                    "volume_24h": 572513079.0904953,
-                    "volume_change_24h": -12.7759,
-                    "percent_change_1h": 0.23688898,
-                    "percent_change_24h": 2.86026162,
-                    "percent_change_7d": 8.30120793,
-                    "percent_change_30d": 17.27002576,
-                    "percent_change_60d": 26.05898888,
-                    "percent_change_90d": 26.78167158,
-                    "market_cap": 3959232068.815476,
-                    "market_cap_dominance": 0.0937,
-                    "fully_diluted_market_cap": 5229375067.71,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 6535,
-            "name": "NEAR Protocol",
-            "symbol": "NEAR",
-            "slug": "near-protocol",
-            "num_market_pairs": 565,
-            "date_added": "2020-08-11T00: 00: 00.000Z",
-            "tags": [
-                "platform",
-                "ai-big-data",
-                "staking",
-                "coinbase-ventures-portfolio",
-                "three-arrows-capital-portfolio",
-                "arrington-xrp-capital-portfolio",
-                "coinfund-portfolio",
-                "electric-capital-portfolio",
-                "fabric-ventures-portfolio",
-                "kenetic-capital-portfolio",
-                "near-protocol-ecosystem",
-                "cross-chain",
-                "circle-ventures-portfolio",
-                "layer-1",
-                "alleged-sec-securities",
-                "modular-blockchain",
-                "account-abstraction",
-                "data-availability",
-                "cmc-crypto-yearbook-2024-2025",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 1249836992,
-            "total_supply": 1275006918,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 35,
-            "self_reported_circulating_supply": 1209202633,
-            "self_reported_market_cap": 3615627035.8280816,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 10: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 2.9900919309593346,
-                    "volume_24h": 311154066.7794826,
-                    "volume_change_24h": -15.8111,
-                    "percent_change_1h": -0.51091671,
-                    "percent_change_24h": 2.00331609,
-                    "percent_change_7d": 4.99369447,
-                    "percent_change_30d": 16.65569578,
-                    "percent_change_60d": 5.88440737,
-                    "percent_change_90d": 22.81290452,
-                    "market_cap": 3737127504.7936864,
-                    "market_cap_dominance": 0.0884,
-                    "fully_diluted_market_cap": 3812387897.43,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 10: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 21794,
-            "name": "Aptos",
-            "symbol": "APT",
-            "slug": "aptos",
-            "num_market_pairs": 550,
-            "date_added": "2022-10-19T01: 50: 25.000Z",
-            "tags": [
-                "binance-labs-portfolio",
-                "circle-ventures-portfolio",
-                "layer-1",
-                "ftx-bankruptcy-estate",
-                "move-vm",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 704542580.2642982,
-            "total_supply": 1178700175.1650627,
-            "infinite_supply": True,
-            "platform": None,
-            "cmc_rank": 36,
-            "self_reported_circulating_supply": 130000000,
-            "self_reported_market_cap": 680998816.033842,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 5.238452431029554,
-                    "volume_24h": 287486550.86790967,
-                    "volume_change_24h": -24.216,
-                    "percent_change_1h": -0.84984308,
-                    "percent_change_24h": -1.89115891,
-                    "percent_change_7d": 10.24715136,
-                    "percent_change_30d": 18.99363619,
-                    "percent_change_60d": 9.07024469,
-                    "percent_change_90d": 11.03926458,
-                    "market_cap": 3690712792.3493476,
-                    "market_cap_dominance": 0.0873,
-                    "fully_diluted_market_cap": 6174564798.05,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 22974,
-            "name": "Bittensor",
-            "symbol": "TAO",
-            "slug": "bittensor",
-            "num_market_pairs": 207,
-            "date_added": "2023-03-06T05: 20: 00.000Z",
-            "tags": [
-                "ai-big-data",
-                "distributed-computing",
-                "oracles",
-                "dao",
-                "polychain-capital-portfolio",
-                "dcg-portfolio",
-                "open-source",
-                "generative-ai",
-                "layer-1",
-                "depin",
-                "cmc-crypto-yearbook-2024-2025",
-                "binance-ecosystem",
-                "binance-listing",
-                "bittensor-ecosystem",
-                "robotics",
-            ],
-            "max_supply": 21000000,
-            "circulating_supply": 10044979.50105937,
-            "total_supply": 21000000,
-            "platform": {
-                "id": 22974,
-                "name": "Bittensor",
-                "symbol": "TAO",
-                "slug": "bittensor",
-                "token_address": "0",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 37,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 340.07845690622054,
-                    "volume_24h": 127416804.60619694,
-                    "volume_change_24h": -32.7055,
-                    "percent_change_1h": -0.73139213,
-                    "percent_change_24h": 2.22474665,
-                    "percent_change_7d": 6.62118417,
-                    "percent_change_30d": -0.83589783,
-                    "percent_change_60d": -13.03436995,
-                    "percent_change_90d": -6.82436613,
-                    "market_cap": 3416081128.3748875,
-                    "market_cap_dominance": 0.0808,
-                    "fully_diluted_market_cap": 7141647595.03,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 36341,
-            "name": "Aster",
-            "symbol": "ASTER",
-            "slug": "aster",
-            "num_market_pairs": 253,
-            "date_added": "2025-04-25T06: 46: 11.000Z",
-            "tags": [
-                "decentralized-exchange-dex-token",
-                "defi",
-                "derivatives",
-                "dex",
-                "bnb-chain-ecosystem",
-                "binance-ecosystem",
-                "binance-listing",
-                "perp-dex-coins",
-            ],
-            "max_supply": 8000000000,
-            "circulating_supply": 1697700000,
-            "total_supply": 8000000000,
-            "platform": {
-                "id": 1839,
-                "name": "BNB Smart Chain (BEP20)",
-                "symbol": "BNB",
-                "slug": "bnb",
-                "token_address": "0x000Ae314E2A2172a039B26378814C252734f556A",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 38,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 1.992894546266293,
-                    "volume_24h": 1161270080.042258,
-                    "volume_change_24h": -21.7721,
-                    "percent_change_1h": -0.03169942,
-                    "percent_change_24h": -2.73096332,
-                    "percent_change_7d": 18.8060684,
-                    "percent_change_30d": 2261.6081234,
-                    "percent_change_60d": 2261.6081234,
-                    "percent_change_90d": 2261.6081234,
-                    "market_cap": 3383337071.1962857,
-                    "market_cap_dominance": 0.08,
-                    "fully_diluted_market_cap": 15943156370.13,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 1321,
-            "name": "Ethereum Classic",
-            "symbol": "ETC",
-            "slug": "ethereum-classic",
-            "num_market_pairs": 665,
-            "date_added": "2016-07-24T00: 00: 00.000Z",
-            "tags": [
-                "mineable",
-                "pow",
-                "ethash",
-                "platform",
-                "smart-contracts",
-                "dcg-portfolio",
-                "layer-1",
-                "2017-2018-alt-season",
-                "ethereum-classic-ecosystem",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 210700000,
-            "circulating_supply": 153831724.5309259,
-            "total_supply": 210700000,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 39,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 19.725286330761488,
-                    "volume_24h": 121320618.70036207,
-                    "volume_change_24h": -15.1192,
-                    "percent_change_1h": -0.08707524,
-                    "percent_change_24h": 3.15360415,
-                    "percent_change_7d": 2.23044428,
-                    "percent_change_30d": -5.21061917,
-                    "percent_change_60d": -15.86689857,
-                    "percent_change_90d": 10.16550202,
-                    "market_cap": 3034374813.1273394,
-                    "market_cap_dominance": 0.0718,
-                    "fully_diluted_market_cap": 4156117829.89,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 21159,
-            "name": "Ondo",
-            "symbol": "ONDO",
-            "slug": "ondo-finance",
-            "num_market_pairs": 367,
-            "date_added": "2024-01-18T12: 06: 25.000Z",
-            "tags": [
-                "ethereum-ecosystem",
-                "real-world-assets-protocols",
-                "cmc-crypto-yearbook-2024-2025",
-                "made-in-america",
-                "world-liberty-financial-portfolio",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 3159107529,
-            "total_supply": 10000000000,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0xfaba6f8e4a5e8ab82f62fe7c39859fa577269be3",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 40,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": 1.66869294,
-            "last_updated": "2025-10-08T19: 10: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.9241095931912645,
-                    "volume_24h": 175379992.63420594,
-                    "volume_change_24h": -27.356,
-                    "percent_change_1h": -0.62383593,
-                    "percent_change_24h": 1.81880231,
-                    "percent_change_7d": -0.58485225,
-                    "percent_change_30d": -0.85872699,
-                    "percent_change_60d": -12.03686648,
-                    "percent_change_90d": 5.64806487,
-                    "market_cap": 2919361573.471651,
-                    "market_cap_dominance": 0.0691,
-                    "fully_diluted_market_cap": 9241095931.91,
-                    "tvl": 1749489980,
-                    "last_updated": "2025-10-08T19: 10: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 35626,
-            "name": "Story",
-            "symbol": "IP",
-            "slug": "story-protocol",
-            "num_market_pairs": 137,
-            "date_added": "2025-02-06T07: 02: 40.000Z",
-            "tags": [
-                "ai-big-data",
-                "smart-contracts",
-                "layer-1",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 313891855,
-            "total_supply": 1015227459,
-            "infinite_supply": True,
-            "platform": None,
-            "cmc_rank": 41,
-            "self_reported_circulating_supply": 250000000,
-            "self_reported_market_cap": 2321540481.226494,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 9.286161924905976,
-                    "volume_24h": 67042779.03861971,
-                    "volume_change_24h": -20.2626,
-                    "percent_change_1h": 0.27638101,
-                    "percent_change_24h": -2.14292357,
-                    "percent_change_7d": 3.64517718,
-                    "percent_change_30d": 9.43491874,
-                    "percent_change_60d": 42.02845539,
-                    "percent_change_90d": 171.89459108,
-                    "market_cap": 2914850592.4391074,
-                    "market_cap_dominance": 0.069,
-                    "fully_diluted_market_cap": 9427566574.88,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 1437,
-            "name": "Zcash",
-            "symbol": "ZEC",
-            "slug": "zcash",
-            "num_market_pairs": 436,
-            "date_added": "2016-10-29T00: 00: 00.000Z",
-            "tags": [
-                "mineable",
-                "pow",
-                "equihash",
-                "medium-of-exchange",
-                "privacy",
-                "zero-knowledge-proofs",
-                "binance-chain",
-                "boostvc-portfolio",
-                "dcg-portfolio",
-                "electric-capital-portfolio",
-                "fenbushi-capital-portfolio",
-                "hashkey-capital-portfolio",
-                "winklevoss-capital-portfolio",
-                "placeholder-ventures-portfolio",
-                "pantera-capital-portfolio",
-                "layer-1",
-                "standard-crypto-portfolio",
-                "2017-2018-alt-season",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 21000000,
-            "circulating_supply": 16252880.0405448,
-            "total_supply": 16252880.0405448,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 42,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 174.9793719475535,
-                    "volume_24h": 597308746.5309005,
-                    "volume_change_24h": 38.7675,
-                    "percent_change_1h": -2.47783917,
-                    "percent_change_24h": 23.8898295,
-                    "percent_change_7d": 38.4819759,
-                    "percent_change_30d": 239.50184387,
-                    "percent_change_60d": 338.6393377,
-                    "percent_change_90d": 321.798156,
-                    "market_cap": 2843918741.833457,
-                    "market_cap_dominance": 0.0673,
-                    "fully_diluted_market_cap": 3674566810.9,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 13502,
-            "name": "Worldcoin",
-            "symbol": "WLD",
-            "slug": "worldcoin-org",
-            "num_market_pairs": 485,
-            "date_added": "2021-10-28T15: 31: 43.000Z",
-            "tags": [
-                "defi",
-                "privacy",
-                "zero-knowledge-proofs",
-                "identity",
-                "ethereum-ecosystem",
-                "governance",
-                "blockchain-capital-portfolio",
-                "a16z-portfolio",
-                "token",
-                "optimism-ecosystem",
-                "world-chain-mainnet-ecosystem",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 2183832623.939519,
-            "total_supply": 10000000000,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x163f8c2467924be0ae7b5347228cabf260318753",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 43,
-            "self_reported_circulating_supply": 2183832623.94,
-            "self_reported_market_cap": 2762301724.667452,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 1.2648871046187582,
-                    "volume_24h": 222264316.6143244,
-                    "volume_change_24h": -32.5217,
-                    "percent_change_1h": 1.68305709,
-                    "percent_change_24h": 4.88520558,
-                    "percent_change_7d": -4.24577087,
-                    "percent_change_30d": -15.4020185,
-                    "percent_change_60d": 16.60141298,
-                    "percent_change_90d": 27.36382618,
-                    "market_cap": 2762301724.6668434,
-                    "market_cap_dominance": 0.0654,
-                    "fully_diluted_market_cap": 12648871046.19,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 36148,
-            "name": "World Liberty Financial USD",
-            "symbol": "USD1",
-            "slug": "usd1",
-            "num_market_pairs": 592,
-            "date_added": "2025-04-13T05: 37: 56.000Z",
-            "tags": [
-                "stablecoin",
-                "usd-stablecoin",
-                "tron20-ecosystem",
-                "made-in-america",
-                "world-liberty-financial-portfolio",
-                "binance-ecosystem",
-                "binance-listing",
-                "wlfi-ecosystem",
-            ],
-            "max_supply": None,
-            "circulating_supply": 2643121140.1986666,
-            "total_supply": 2643121140.1986666,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x8d0D000Ee44948FC98c9B98A4FA4921476f08B0d",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 44,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.9997149469381339,
-                    "volume_24h": 427735011.2992386,
-                    "volume_change_24h": -9.0026,
-                    "percent_change_1h": -0.00845401,
-                    "percent_change_24h": 0.01707587,
-                    "percent_change_7d": -0.04445127,
-                    "percent_change_30d": 0.07610829,
-                    "percent_change_60d": -0.04656396,
-                    "percent_change_90d": -0.04716421,
-                    "market_cap": 2642367710.42477,
-                    "market_cap_dominance": 0.0625,
-                    "fully_diluted_market_cap": 2642367710.42,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 28321,
-            "name": "Polygon (prev. MATIC)",
-            "symbol": "POL",
-            "slug": "polygon-ecosystem-token",
-            "num_market_pairs": 572,
-            "date_added": "2023-10-30T14: 43: 57.000Z",
-            "tags": [
-                "ethereum-ecosystem",
-                "layer-2",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 10512420827.645971,
-            "total_supply": 10512420837.645971,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x455e53cbb86018ac2b8092fdcd39d8444affc3f6",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 45,
-            "self_reported_circulating_supply": 10496230782.91,
-            "self_reported_market_cap": 2549137238.597112,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.24286215607488607,
-                    "volume_24h": 152541736.14427665,
-                    "volume_change_24h": -26.0926,
-                    "percent_change_1h": -0.17010332,
-                    "percent_change_24h": 2.34373633,
-                    "percent_change_7d": 2.41734271,
-                    "percent_change_30d": -12.16849281,
-                    "percent_change_60d": -2.601468,
-                    "percent_change_90d": 14.40125066,
-                    "market_cap": 2553069187.7686386,
-                    "market_cap_dominance": 0.0604,
-                    "fully_diluted_market_cap": 2553069190.2,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 27772,
-            "name": "PayPal USD",
-            "symbol": "PYUSD",
-            "slug": "paypal-usd",
-            "num_market_pairs": 130,
-            "date_added": "2023-08-21T14: 30: 00.000Z",
-            "tags": [
-                "stablecoin",
-                "asset-backed-stablecoin",
-                "stellar-ecosystem",
-                "usd-stablecoin",
-                "fiat-stablecoin",
-            ],
-            "max_supply": None,
-            "circulating_supply": 2529873301.09393,
-            "total_supply": 2529873301.09393,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x6c3ea9036406852006290770bedfcaba0e23a0e8",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 46,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 10: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.9996632525989759,
-                    "volume_24h": 82528906.97999531,
-                    "volume_change_24h": -41.1966,
-                    "percent_change_1h": -0.02349164,
-                    "percent_change_24h": -0.00484229,
-                    "percent_change_7d": -0.01095173,
-                    "percent_change_30d": 0.03096833,
-                    "percent_change_60d": 0.0109676,
-                    "percent_change_90d": -0.00256484,
-                    "market_cap": 2529021372.834866,
-                    "market_cap_dominance": 0.0598,
-                    "fully_diluted_market_cap": 2529021372.83,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 10: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 8916,
-            "name": "Internet Computer",
-            "symbol": "ICP",
-            "slug": "internet-computer",
-            "num_market_pairs": 363,
-            "date_added": "2021-03-23T00: 00: 00.000Z",
-            "tags": [
-                "platform",
-                "ai-big-data",
-                "smart-contracts",
-                "polychain-capital-portfolio",
-                "electric-capital-portfolio",
-                "fenbushi-capital-portfolio",
-                "hashkey-capital-portfolio",
-                "a16z-portfolio",
-                "multicoin-capital-portfolio",
-                "exnetwork-capital-portfolio",
-                "icp-ecosystem",
-                "internet-computer-ecosystem",
-                "layer-1",
-                "alleged-sec-securities",
-                "depin",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 538582282.4626868,
-            "total_supply": 538582282.4626868,
-            "infinite_supply": True,
-            "platform": None,
-            "cmc_rank": 47,
-            "self_reported_circulating_supply": 538579833.69,
-            "self_reported_market_cap": 2434956592.1684327,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 4.521069003801513,
-                    "volume_24h": 82311482.36503053,
-                    "volume_change_24h": -12.8131,
-                    "percent_change_1h": -0.78085109,
-                    "percent_change_24h": 2.35781766,
-                    "percent_change_7d": 1.94963939,
-                    "percent_change_30d": -7.58906514,
-                    "percent_change_60d": -20.55585225,
-                    "percent_change_90d": -14.05915157,
-                    "market_cap": 2434967663.238724,
-                    "market_cap_dominance": 0.0576,
-                    "fully_diluted_market_cap": 2434967663.24,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 11841,
-            "name": "Arbitrum",
-            "symbol": "ARB",
-            "slug": "arbitrum",
-            "num_market_pairs": 1194,
-            "date_added": "2023-03-23T12: 50: 11.000Z",
-            "tags": [
-                "scaling",
-                "dao",
-                "dapp",
-                "ethereum-ecosystem",
-                "polychain-capital-portfolio",
-                "layer-2",
-                "rollups",
-                "pantera-capital-portfolio",
-                "arbitrum-ecosystem",
-                "osmosis-ecosystem",
-                "modular-blockchain",
-                "egirl-capital-portfolio",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 5403630609,
-            "total_supply": 10000000000,
-            "platform": {
-                "id": 11841,
-                "name": "Arbitrum",
-                "symbol": "ARB",
-                "slug": "arbitrum",
-                "token_address": "0x912CE59144191C1204E64559FE8253a0e49E6548",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 48,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.435598296513372,
-                    "volume_24h": 245190946.98028386,
-                    "volume_change_24h": -24.7512,
-                    "percent_change_1h": -0.44580488,
-                    "percent_change_24h": 2.41873191,
-                    "percent_change_7d": 0.12609099,
-                    "percent_change_30d": -14.52634237,
-                    "percent_change_60d": -7.06241833,
-                    "percent_change_90d": 16.36676952,
-                    "market_cap": 2353812288.267915,
-                    "market_cap_dominance": 0.0557,
-                    "fully_diluted_market_cap": 4355982965.13,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 36507,
-            "name": "Pump.fun",
-            "symbol": "PUMP",
-            "slug": "pump-fun",
-            "num_market_pairs": 275,
-            "date_added": "2025-05-14T18: 51: 49.000Z",
-            "tags": [
-                "launchpad",
-                "solana-ecosystem",
-                "pump-fun-ecosystem",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 1000000000000,
-            "circulating_supply": 354000000000,
-            "total_supply": 1000000000000,
-            "platform": {
-                "id": 5426,
-                "name": "Solana",
-                "symbol": "SOL",
-                "slug": "solana",
-                "token_address": "pumpCmXqMfrsAkQ5r49WcJnRayYRqmXz6ae8H7H9Dfn",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 49,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.006220996162080731,
-                    "volume_24h": 462219067.78977966,
-                    "volume_change_24h": -13.2412,
-                    "percent_change_1h": -0.9607922,
-                    "percent_change_24h": -5.17156338,
-                    "percent_change_7d": -7.74734935,
-                    "percent_change_30d": 30.12424671,
-                    "percent_change_60d": 92.19725625,
-                    "percent_change_90d": -0.78778377,
-                    "market_cap": 2202232641.376579,
-                    "market_cap_dominance": 0.0521,
-                    "fully_diluted_market_cap": 6220996162.08,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 35491,
-            "name": "MemeCore",
-            "symbol": "M",
-            "slug": "memecore",
-            "num_market_pairs": 91,
-            "date_added": "2025-07-03T09: 16: 58.000Z",
-            "tags": [
-                "memes",
-                "bnb-chain-ecosystem",
-                "layer-1",
-                "binance-alpha",
-                "binance-alpha-airdrops",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 10000000000,
-            "circulating_supply": 1039501066,
-            "total_supply": 5264317858.42,
-            "platform": {
-                "id": 1839,
-                "name": "BNB Smart Chain (BEP20)",
-                "symbol": "BNB",
-                "slug": "bnb",
-                "token_address": "0x22b1458e780f8fa71e2f84502cee8b5a3cc731fa",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 50,
-            "self_reported_circulating_supply": 1579304706.25,
-            "self_reported_market_cap": 3288416957.8485785,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 2.082192843999561,
-                    "volume_24h": 16591063.0205636,
-                    "volume_change_24h": 2.2775,
-                    "percent_change_1h": 0.59330502,
-                    "percent_change_24h": -0.44100857,
-                    "percent_change_7d": -7.5917708,
-                    "percent_change_30d": 9.2346669,
-                    "percent_change_60d": 333.48076412,
-                    "percent_change_90d": 408.65272991,
-                    "market_cap": 2164441680.9551153,
-                    "market_cap_dominance": 0.0512,
-                    "fully_diluted_market_cap": 20821928440,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 2087,
-            "name": "KuCoin Token",
-            "symbol": "KCS",
-            "slug": "kucoin-token",
-            "num_market_pairs": 63,
-            "date_added": "2017-10-24T00: 00: 00.000Z",
-            "tags": [
-                "marketplace",
-                "centralized-exchange",
-                "discount-token",
-                "ethereum-ecosystem",
-            ],
-            "max_supply": 200000000,
-            "circulating_supply": 129775851.73556715,
-            "total_supply": 142275851.73556715,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0xf34960d9d60be18cc1d5afc1a6f012a723a28811",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 51,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 15.882688829847046,
-                    "volume_24h": 8220736.65121618,
-                    "volume_change_24h": 10.943,
-                    "percent_change_1h": -0.37966696,
-                    "percent_change_24h": -0.08828245,
-                    "percent_change_7d": 2.77254841,
-                    "percent_change_30d": 10.67891075,
-                    "percent_change_60d": 33.78389157,
-                    "percent_change_90d": 41.06174496,
-                    "market_cap": 2061189470.7443788,
-                    "market_cap_dominance": 0.0488,
-                    "fully_diluted_market_cap": 3176537765.97,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 34466,
-            "name": "Pudgy Penguins",
-            "symbol": "PENGU",
-            "slug": "pudgy-penguins",
-            "num_market_pairs": 419,
-            "date_added": "2024-12-17T14: 00: 00.000Z",
-            "tags": [
-                "collectibles-nfts",
-                "memes",
-                "solana-ecosystem",
-                "animal-memes",
-                "ip-memes",
-                "made-in-america",
-                "binance-hodler-airdrops",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 62860396090.04,
-            "total_supply": 88888888888,
-            "platform": {
-                "id": 5426,
-                "name": "Solana",
-                "symbol": "SOL",
-                "slug": "solana",
-                "token_address": "2zMMhcVQEXDtdE6vsFS7S7D5oUodfJHE8vd1gnBouauv",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 52,
-            "self_reported_circulating_supply": 62860396090,
-            "self_reported_market_cap": 2047367564.2361228,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.032570071007901644,
-                    "volume_24h": 425655711.0730767,
-                    "volume_change_24h": -24.0813,
-                    "percent_change_1h": -0.05900211,
-                    "percent_change_24h": 5.88097141,
-                    "percent_change_7d": 2.74442223,
-                    "percent_change_30d": -3.76836984,
-                    "percent_change_60d": -16.0685074,
-                    "percent_change_90d": 70.58614265,
-                    "market_cap": 2047367564.2374256,
-                    "market_cap_dominance": 0.0484,
-                    "fully_diluted_market_cap": 2895117422.9,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 20396,
-            "name": "Kaspa",
-            "symbol": "KAS",
-            "slug": "kaspa",
-            "num_market_pairs": 203,
-            "date_added": "2022-06-01T00: 03: 58.000Z",
-            "tags": [
-                "mineable",
-                "dag",
-                "pow",
-                "store-of-value",
-                "polychain-capital-portfolio",
-                "layer-1",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 28704026601,
-            "circulating_supply": 26787140260.464794,
-            "total_supply": 26787140260.464794,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 53,
-            "self_reported_circulating_supply": 26786904964.07,
-            "self_reported_market_cap": 2046007775.112076,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.07638089498792196,
-                    "volume_24h": 40023777.73929582,
-                    "volume_change_24h": -50.622,
-                    "percent_change_1h": -0.30422878,
-                    "percent_change_24h": 1.58821819,
-                    "percent_change_7d": -3.48107164,
-                    "percent_change_30d": -7.03549925,
-                    "percent_change_60d": -20.29564325,
-                    "percent_change_90d": -7.92250195,
-                    "market_cap": 2046025747.261298,
-                    "market_cap_dominance": 0.0484,
-                    "fully_diluted_market_cap": 2192439241.54,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 35697,
-            "name": "Pi",
-            "symbol": "PI",
-            "slug": "pi",
-            "num_market_pairs": 64,
-            "date_added": "2025-02-11T07: 16: 10.000Z",
-            "tags": ["layer-1", "mobile-mining"],
-            "max_supply": 100000000000,
-            "circulating_supply": 8246405692.70767,
-            "total_supply": 100000000000,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 54,
-            "self_reported_circulating_supply": 8246405692.71,
-            "self_reported_market_cap": 2002253876.972965,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.24280322258981274,
-                    "volume_24h": 38531112.53939547,
-                    "volume_change_24h": -24.6344,
-                    "percent_change_1h": 0.19911846,
-                    "percent_change_24h": -2.3830344,
-                    "percent_change_7d": -10.55240031,
-                    "percent_change_30d": -29.72446919,
-                    "percent_change_60d": -44.6957033,
-                    "percent_change_90d": -50.45382431,
-                    "market_cap": 2002253876.9723995,
-                    "market_cap_dominance": 0.0474,
-                    "fully_diluted_market_cap": 24280322258.98,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 4030,
-            "name": "Algorand",
-            "symbol": "ALGO",
-            "slug": "algorand",
-            "num_market_pairs": 536,
-            "date_added": "2019-06-20T00: 00: 00.000Z",
-            "tags": [
-                "pos",
-                "platform",
-                "research",
-                "smart-contracts",
-                "algorand-ecosystem",
-                "arrington-xrp-capital-portfolio",
-                "kenetic-capital-portfolio",
-                "usv-portfolio",
-                "multicoin-capital-portfolio",
-                "exnetwork-capital-portfolio",
-                "real-world-assets-protocols",
-                "layer-1",
-                "dwf-labs-portfolio",
-                "alleged-sec-securities",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 10000000000,
-            "circulating_supply": 8804223728.779984,
-            "total_supply": 10000000000,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 55,
-            "self_reported_circulating_supply": 8804205589.58,
-            "self_reported_market_cap": 1985719182.5313253,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.22554211874396415,
-                    "volume_24h": 91219568.745748,
-                    "volume_change_24h": -7.8122,
-                    "percent_change_1h": 0.08680692,
-                    "percent_change_24h": 2.40946489,
-                    "percent_change_7d": 2.42948261,
-                    "percent_change_30d": -4.71130724,
-                    "percent_change_60d": -18.02652868,
-                    "percent_change_90d": 11.83257739,
-                    "market_cap": 1985723273.684922,
-                    "market_cap_dominance": 0.047,
-                    "fully_diluted_market_cap": 2255421187.44,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 3077,
-            "name": "VeChain",
-            "symbol": "VET",
-            "slug": "vechain",
-            "num_market_pairs": 361,
-            "date_added": "2017-08-22T00: 00: 00.000Z",
-            "tags": [
-                "logistics",
-                "data-provenance",
-                "iot",
-                "smart-contracts",
-                "fenbushi-capital-portfolio",
-                "real-world-assets-protocols",
-                "layer-1",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 86712634466,
-            "circulating_supply": 85985041177,
-            "total_supply": 85985041177,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 56,
-            "self_reported_circulating_supply": 85985041177,
-            "self_reported_market_cap": 1963967004.0451756,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 10: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.02284079855241744,
-                    "volume_24h": 37408126.29849401,
-                    "volume_change_24h": -32.046,
-                    "percent_change_1h": -0.73819148,
-                    "percent_change_24h": 1.12517568,
-                    "percent_change_7d": -0.61432086,
-                    "percent_change_30d": -6.72362814,
-                    "percent_change_60d": -9.97995387,
-                    "percent_change_90d": -2.38118048,
-                    "market_cap": 1963967004.0451756,
-                    "market_cap_dominance": 0.0465,
-                    "fully_diluted_market_cap": 1980585815.79,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 10: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 3794,
-            "name": "Cosmos",
-            "symbol": "ATOM",
-            "slug": "cosmos",
-            "num_market_pairs": 916,
-            "date_added": "2019-03-14T00: 00: 00.000Z",
-            "tags": [
-                "platform",
-                "cosmos-ecosystem",
-                "communications-social-media",
-                "content-creation",
-                "defi",
-                "interoperability",
-                "ethereum-ecosystem",
-                "polychain-capital-portfolio",
-                "dragonfly-capital-portfolio",
-                "hashkey-capital-portfolio",
-                "1confirmation-portfolio",
-                "paradigm-portfolio",
-                "exnetwork-capital-portfolio",
-                "polygon-ecosystem",
-                "cronos-ecosystem",
-                "injective-ecosystem",
-                "canto-ecosystem",
-                "osmosis-ecosystem",
-                "alleged-sec-securities",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 471929300,
-            "total_supply": 471929300,
-            "infinite_supply": True,
-            "platform": None,
-            "cmc_rank": 57,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 4.166562533871948,
-                    "volume_24h": 117063621.45253031,
-                    "volume_change_24h": -26.9958,
-                    "percent_change_1h": -0.6108687,
-                    "percent_change_24h": 2.62181782,
-                    "percent_change_7d": -1.01280557,
-                    "percent_change_30d": -8.83297012,
-                    "percent_change_60d": -12.18896759,
-                    "percent_change_90d": -6.20600509,
-                    "market_cap": 1966322940.0164149,
-                    "market_cap_dominance": 0.0465,
-                    "fully_diluted_market_cap": 1966322940.02,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 7950,
-            "name": "Flare",
-            "symbol": "FLR",
-            "slug": "flare",
-            "num_market_pairs": 101,
-            "date_added": "2020-12-11T00: 00: 00.000Z",
-            "tags": ["layer-1", "dwf-labs-portfolio"],
-            "max_supply": None,
-            "circulating_supply": 76019467497.22195,
-            "total_supply": 104076266480.26755,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 58,
-            "self_reported_circulating_supply": 76019467497.22,
-            "self_reported_market_cap": 1784260078.8478954,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.02347109414983925,
-                    "volume_24h": 9017351.49899696,
-                    "volume_change_24h": -28.7532,
-                    "percent_change_1h": 0.78519627,
-                    "percent_change_24h": 0.15149157,
-                    "percent_change_7d": -9.40244451,
-                    "percent_change_30d": 5.72223535,
-                    "percent_change_60d": 2.00119256,
-                    "percent_change_90d": 42.19254492,
-                    "market_cap": 1784260078.8479412,
-                    "market_cap_dominance": 0.0422,
-                    "fully_diluted_market_cap": 2442783849.32,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 23149,
-            "name": "Sei",
-            "symbol": "SEI",
-            "slug": "sei",
-            "num_market_pairs": 314,
-            "date_added": "2023-08-14T07: 35: 00.000Z",
-            "tags": [
-                "coinbase-ventures-portfolio",
-                "multicoin-capital-portfolio",
-                "layer-1",
-                "jump-crypto",
-                "sei-ecosystem",
-                "parallel-evm",
-                "made-in-america",
-                "world-liberty-financial-portfolio",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 6127777777,
-            "total_supply": 10000000000,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 59,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.2903689706556248,
-                    "volume_24h": 192260531.4176975,
-                    "volume_change_24h": 23.5383,
-                    "percent_change_1h": -0.33251324,
-                    "percent_change_24h": 1.33752976,
-                    "percent_change_7d": -2.45923076,
-                    "percent_change_30d": -6.22650574,
-                    "percent_change_60d": -12.7222765,
-                    "percent_change_90d": 1.18570317,
-                    "market_cap": 1779316525.5139027,
-                    "market_cap_dominance": 0.0421,
-                    "fully_diluted_market_cap": 2903689706.56,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 5690,
-            "name": "Render",
-            "symbol": "RENDER",
-            "slug": "render",
-            "num_market_pairs": 607,
-            "date_added": "2020-06-11T00: 00: 00.000Z",
-            "tags": [
-                "art",
-                "media",
-                "vr-ar",
-                "ai-big-data",
-                "distributed-computing",
-                "collectibles-nfts",
-                "defi",
-                "gaming",
-                "scaling",
-                "video",
-                "ethereum-ecosystem",
-                "solana-ecosystem",
-                "metaverse",
-                "alameda-research-portfolio",
-                "multicoin-capital-portfolio",
-                "polygon-ecosystem",
-                "web3",
-                "generative-ai",
-                "depin",
-                "cmc-crypto-yearbook-2024-2025",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 644168762,
-            "circulating_supply": 518584616.1640741,
-            "total_supply": 533344789.44407415,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x6de037ef9ad2725eb40118bb1702ebb27e4aeb24",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 60,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 3.385136249266033,
-                    "volume_24h": 62961007.08512339,
-                    "volume_change_24h": -17.7721,
-                    "percent_change_1h": -1.09468184,
-                    "percent_change_24h": 0.04654758,
-                    "percent_change_7d": -4.29012314,
-                    "percent_change_30d": -8.6065803,
-                    "percent_change_60d": -15.69998276,
-                    "percent_change_90d": -3.59873682,
-                    "market_cap": 1755479582.4887192,
-                    "market_cap_dominance": 0.0415,
-                    "fully_diluted_market_cap": 2180599026.89,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 2280,
-            "name": "Filecoin",
-            "symbol": "FIL",
-            "slug": "filecoin",
-            "num_market_pairs": 637,
-            "date_added": "2017-12-13T00: 00: 00.000Z",
-            "tags": [
-                "mineable",
-                "ai-big-data",
-                "distributed-computing",
-                "filesharing",
-                "storage",
-                "polychain-capital-portfolio",
-                "blockchain-capital-portfolio",
-                "boostvc-portfolio",
-                "dcg-portfolio",
-                "hashkey-capital-portfolio",
-                "a16z-portfolio",
-                "winklevoss-capital-portfolio",
-                "pantera-capital-portfolio",
-                "web3",
-                "filecoin-ecosystem",
-                "layer-1",
-                "alleged-sec-securities",
-                "depin",
-                "2017-2018-alt-season",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 701208267,
-            "total_supply": 1958908316,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 61,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 2.381283751458594,
-                    "volume_24h": 229168262.12882847,
-                    "volume_change_24h": -4.6217,
-                    "percent_change_1h": -0.97982288,
-                    "percent_change_24h": 4.13898273,
-                    "percent_change_7d": 4.21404863,
-                    "percent_change_30d": -2.39899181,
-                    "percent_change_60d": -9.91063635,
-                    "percent_change_90d": -5.49800913,
-                    "market_cap": 1669775852.5955393,
-                    "market_cap_dominance": 0.0395,
-                    "fully_diluted_market_cap": 4664716543.49,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 23095,
-            "name": "Bonk",
-            "symbol": "BONK",
-            "slug": "bonk1",
-            "num_market_pairs": 765,
-            "date_added": "2022-12-30T06: 58: 50.000Z",
-            "tags": [
-                "memes",
-                "ethereum-ecosystem",
-                "solana-ecosystem",
-                "polygon-ecosystem",
-                "doggone-doggerel",
-                "arbitrum-ecosystem",
-                "injective-ecosystem",
-                "aptos-ecosystem",
-                "dwf-labs-portfolio",
-                "base-ecosystem",
-                "cmc-crypto-awards-2024",
-                "move-vm",
-                "animal-memes",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 88872433754423.19,
-            "circulating_supply": 81451646774792.6,
-            "total_supply": 87995324066944.78,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x1151CB3d861920e07a38e03eEAd12C32178567F6",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 62,
-            "self_reported_circulating_supply": 81451646774869.1,
-            "self_reported_market_cap": 1646321318.7266102,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 2.021225332959827e-05,
-                    "volume_24h": 297277574.9029141,
-                    "volume_change_24h": -37.4335,
-                    "percent_change_1h": -0.35766086,
-                    "percent_change_24h": 1.57865042,
-                    "percent_change_7d": -1.42230205,
-                    "percent_change_30d": -12.08294158,
-                    "percent_change_60d": -26.17008534,
-                    "percent_change_90d": -12.16485136,
-                    "market_cap": 1646321318.7250638,
-                    "market_cap_dominance": 0.0389,
-                    "fully_diluted_market_cap": 1796312145.06,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 33038,
-            "name": "Sky",
-            "symbol": "SKY",
-            "slug": "sky",
-            "num_market_pairs": 167,
-            "date_added": "2024-09-18T13: 25: 16.000Z",
-            "tags": [
-                "store-of-value",
-                "defi",
-                "dao",
-                "ethereum-ecosystem",
-                "polychain-capital-portfolio",
-                "governance",
-                "lending-borowing",
-                "dragonfly-capital-portfolio",
-                "electric-capital-portfolio",
-                "a16z-portfolio",
-                "1confirmation-portfolio",
-                "placeholder-ventures-portfolio",
-                "pantera-capital-portfolio",
-                "paradigm-portfolio",
-                "near-protocol-ecosystem",
-                "arbitrum-ecosystem",
-                "spartan-group",
-                "bnb-chain-ecosystem",
-                "bitcoin-ecosystem",
-                "real-world-assets-protocols",
-                "standard-crypto-portfolio",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 23462665147,
-            "circulating_supply": 23407402614.433857,
-            "total_supply": 23462665147.365967,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x56072C95FAA701256059aa122697B133aDEd9279",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 63,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.06832283690197426,
-                    "volume_24h": 18217536.32302976,
-                    "volume_change_24h": -39.4891,
-                    "percent_change_1h": 0.72606008,
-                    "percent_change_24h": 1.95256108,
-                    "percent_change_7d": -6.22276552,
-                    "percent_change_30d": -5.33287743,
-                    "percent_change_60d": -21.3082777,
-                    "percent_change_90d": -17.7607726,
-                    "market_cap": 1599260151.1248102,
-                    "market_cap_dominance": 0.0378,
-                    "fully_diluted_market_cap": 1603035844.12,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 36645,
-            "name": "Plasma",
-            "symbol": "XPL",
-            "slug": "plasma-xpl",
-            "num_market_pairs": 186,
-            "date_added": "2025-09-25T11: 30: 00.000Z",
-            "tags": [
-                "payments",
-                "bitcoin-ecosystem",
-                "layer-1",
-                "binance-hodler-airdrops",
-                "binance-alpha-airdrops",
-                "binance-ecosystem",
-                "binance-listing",
-                "stablecoin-protocol",
-                "plasma-ecosystem",
-            ],
-            "max_supply": None,
-            "circulating_supply": 1800000000,
-            "total_supply": 10000000000,
-            "infinite_supply": True,
-            "platform": None,
-            "cmc_rank": 64,
-            "self_reported_circulating_supply": 1800000000,
-            "self_reported_market_cap": 1579090669.6325376,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.8772725942402987,
-                    "volume_24h": 7659042100.807358,
-                    "volume_change_24h": 18.9547,
-                    "percent_change_1h": -0.7750799,
-                    "percent_change_24h": -2.31830915,
-                    "percent_change_7d": -8.39941718,
-                    "percent_change_30d": 5.51641255,
-                    "percent_change_60d": 5.51641255,
-                    "percent_change_90d": 361.77393246,
-                    "market_cap": 1579090669.6325376,
-                    "market_cap_dominance": 0.0374,
-                    "fully_diluted_market_cap": 8772725942.4,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 35336,
-            "name": "OFFICIAL TRUMP",
-            "symbol": "TRUMP",
-            "slug": "official-trump",
-            "num_market_pairs": 644,
-            "date_added": "2025-01-18T04: 19: 35.000Z",
-            "tags": [
-                "memes",
-                "solana-ecosystem",
-                "political-memes",
-                "celebrity-memes",
-                "made-in-america",
-                "moonshot",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 999999993.45,
-            "circulating_supply": 199999258.335972,
-            "total_supply": 999999285.248748,
-            "platform": {
-                "id": 5426,
-                "name": "Solana",
-                "symbol": "SOL",
-                "slug": "solana",
-                "token_address": "6p6xgHyF7AeE6TZkSmFsko444wqoP15icUSqi2jfGiPN",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 65,
-            "self_reported_circulating_supply": 200000000,
-            "self_reported_market_cap": 1532074592.632437,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 7.660372963162185,
-                    "volume_24h": 464947444.01246756,
-                    "volume_change_24h": 52.8033,
-                    "percent_change_1h": -0.22272688,
-                    "percent_change_24h": 1.55169288,
-                    "percent_change_7d": 1.27903233,
-                    "percent_change_30d": -11.10352626,
-                    "percent_change_60d": -20.24845272,
-                    "percent_change_90d": -19.658057,
-                    "market_cap": 1532068911.2093694,
-                    "market_cap_dominance": 0.0362,
-                    "fully_diluted_market_cap": 7660372912.99,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 7186,
-            "name": "PancakeSwap",
-            "symbol": "CAKE",
-            "slug": "pancakeswap",
-            "num_market_pairs": 1753,
-            "date_added": "2020-09-25T00: 00: 00.000Z",
-            "tags": [
-                "collectibles-nfts",
-                "decentralized-exchange-dex-token",
-                "defi",
-                "privacy",
-                "smart-contracts",
-                "ethereum-ecosystem",
-                "yield-farming",
-                "amm",
-                "dex",
-                "governance",
-                "solana-ecosystem",
-                "arbitrum-ecosystem",
-                "bnb-chain-ecosystem",
-                "aptos-ecosystem",
-                "zksync-era-ecosystem",
-                "base-ecosystem",
-                "linea-ecosystem",
-                "move-vm",
-                "polygon-zkevm-ecosystem",
-                "opbnb-ecosystem",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 450000000,
-            "circulating_supply": 344030179.22196245,
-            "total_supply": 359191327.1227677,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x152649eA73beAb28c5b49B26eb48f7EAD6d4c898",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 66,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": 0.5411608,
-            "last_updated": "2025-10-08T19: 10: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 4.225621351233627,
-                    "volume_24h": 928451898.0640246,
-                    "volume_change_24h": 2.753,
-                    "percent_change_1h": 0.73986771,
-                    "percent_change_24h": 0.45917754,
-                    "percent_change_7d": 63.01084586,
-                    "percent_change_30d": 72.71756503,
-                    "percent_change_60d": 46.38428359,
-                    "percent_change_90d": 74.88550545,
-                    "market_cap": 1453741270.789056,
-                    "market_cap_dominance": 0.0344,
-                    "fully_diluted_market_cap": 1901529608.06,
-                    "tvl": 2686338825,
-                    "last_updated": "2025-10-08T19: 10: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 28081,
-            "name": "SPX6900",
-            "symbol": "SPX",
-            "slug": "spx6900",
-            "num_market_pairs": 440,
-            "date_added": "2023-08-17T10: 00: 00.000Z",
-            "tags": [
-                "memes",
-                "ethereum-ecosystem",
-                "solana-ecosystem",
-                "base-ecosystem",
-                "binance-alpha",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 1000000000,
-            "circulating_supply": 930993090.07,
-            "total_supply": 930993090.07,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0xe0f63a424a4439cbe457d80e4f4b51ad25b2c56c",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 67,
-            "self_reported_circulating_supply": 930993090.07,
-            "self_reported_market_cap": 1430598068.59513,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 1.5366366129393778,
-                    "volume_24h": 66358101.19646671,
-                    "volume_change_24h": -14.3412,
-                    "percent_change_1h": -3.55291959,
-                    "percent_change_24h": 5.95838393,
-                    "percent_change_7d": 38.23416522,
-                    "percent_change_30d": 16.03037148,
-                    "percent_change_60d": -21.93153639,
-                    "percent_change_90d": -0.81356367,
-                    "market_cap": 1430598068.59513,
-                    "market_cap_dominance": 0.0338,
-                    "fully_diluted_market_cap": 1536636612.94,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 29210,
-            "name": "Jupiter",
-            "symbol": "JUP",
-            "slug": "jupiter-ag",
-            "num_market_pairs": 749,
-            "date_added": "2024-01-31T08: 38: 13.000Z",
-            "tags": [
-                "decentralized-exchange-dex-token",
-                "defi",
-                "derivatives",
-                "amm",
-                "solana-ecosystem",
-                "cross-chain",
-                "moonshot",
-                "binance-ecosystem",
-                "binance-listing",
-                "perp-dex-coins",
-            ],
-            "max_supply": 7000000000,
-            "circulating_supply": 3165216666.6400003,
-            "total_supply": 6999011090.290696,
-            "platform": {
-                "id": 5426,
-                "name": "Solana",
-                "symbol": "SOL",
-                "slug": "solana",
-                "token_address": "JUPyiwrYJFskUPiHa7hkeR8VUtAeFoSYbKedZNsDvCN",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 68,
-            "self_reported_circulating_supply": 2951327777.76,
-            "self_reported_market_cap": 1331621828.550418,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.4511941501669099,
-                    "volume_24h": 57874682.61778715,
-                    "volume_change_24h": 4.086,
-                    "percent_change_1h": -0.26897441,
-                    "percent_change_24h": 1.736782,
-                    "percent_change_7d": -2.21173585,
-                    "percent_change_30d": -12.56083074,
-                    "percent_change_60d": -14.84752152,
-                    "percent_change_90d": -2.81541304,
-                    "market_cap": 1428127243.9987743,
-                    "market_cap_dominance": 0.0338,
-                    "fully_diluted_market_cap": 3158359051.17,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 10603,
-            "name": "Immutable",
-            "symbol": "IMX",
-            "slug": "immutable-x",
-            "num_market_pairs": 400,
-            "date_added": "2021-06-24T00: 00: 00.000Z",
-            "tags": [
-                "collectibles-nfts",
-                "privacy",
-                "zero-knowledge-proofs",
-                "gaming",
-                "scaling",
-                "ethereum-ecosystem",
-                "layer-2",
-                "rollups",
-                "arrington-xrp-capital-portfolio",
-                "alameda-research-portfolio",
-                "modular-blockchain",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 2000000000,
-            "circulating_supply": 1964455311.3898141,
-            "total_supply": 2000000000,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0xf57e7e7c23978c3caec3c3548e3d615c346e79ff",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 69,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 10: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.7238757817470948,
-                    "volume_24h": 41272567.52284327,
-                    "volume_change_24h": -28.2262,
-                    "percent_change_1h": -0.01345789,
-                    "percent_change_24h": 2.08263669,
-                    "percent_change_7d": 2.30846991,
-                    "percent_change_30d": 33.48564108,
-                    "percent_change_60d": 23.07507407,
-                    "percent_change_90d": 53.3658271,
-                    "market_cap": 1422021624.2395341,
-                    "market_cap_dominance": 0.0336,
-                    "fully_diluted_market_cap": 1447751563.49,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 10: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 38515,
-            "name": "DoubleZero",
-            "symbol": "2Z",
-            "slug": "doublezero",
-            "num_market_pairs": 120,
-            "date_added": "2025-09-29T01: 04: 27.000Z",
-            "tags": [
-                "hardware",
-                "solana-ecosystem",
-                "dragonfly-capital-portfolio",
-                "multicoin-capital-portfolio",
-                "binance-alpha-airdrops",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 10000000000,
-            "circulating_supply": 3471417500,
-            "total_supply": 9999999990,
-            "platform": {
-                "id": 5426,
-                "name": "Solana",
-                "symbol": "SOL",
-                "slug": "solana",
-                "token_address": "J6pQQ3FAcJQeWPPGppWRb4nM8jU3wLyYbRrLh7feMfvd",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 70,
-            "self_reported_circulating_supply": 3471417490,
-            "self_reported_market_cap": 1414264796.0658803,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.4074026820858935,
-                    "volume_24h": 661068977.2765894,
-                    "volume_change_24h": 97.9793,
-                    "percent_change_1h": -0.34705711,
-                    "percent_change_24h": -8.41952901,
-                    "percent_change_7d": -38.84565261,
-                    "percent_change_30d": -38.84565261,
-                    "percent_change_60d": -38.84565261,
-                    "percent_change_90d": -38.84565261,
-                    "market_cap": 1414264800.1399071,
-                    "market_cap_dominance": 0.0335,
-                    "fully_diluted_market_cap": 4074026820.86,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 4269,
-            "name": "GateToken",
-            "symbol": "GT",
-            "slug": "gatetoken",
-            "num_market_pairs": 37,
-            "date_added": "2019-08-20T00: 00: 00.000Z",
-            "tags": [
-                "marketplace",
-                "centralized-exchange",
-                "discount-token",
-                "ethereum-ecosystem",
-                "solana-ecosystem",
-                "ftx-bankruptcy-estate",
-            ],
-            "max_supply": 300000000,
-            "circulating_supply": 82370850.51594834,
-            "total_supply": 300000000,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0xe66747a101bff2dba3697199dcce5b743b454759",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 71,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 16.9123101088778,
-                    "volume_24h": 20432551.90907884,
-                    "volume_change_24h": 28.6958,
-                    "percent_change_1h": 0.69131404,
-                    "percent_change_24h": 1.19560229,
-                    "percent_change_7d": 4.03184951,
-                    "percent_change_30d": 0.27908147,
-                    "percent_change_60d": -0.10279486,
-                    "percent_change_90d": 5.14221125,
-                    "market_cap": 1393081367.8577354,
-                    "market_cap_dominance": 0.033,
-                    "fully_diluted_market_cap": 5073693032.66,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 3773,
-            "name": "Artificial Superintelligence Alliance",
-            "symbol": "FET",
-            "slug": "artificial-superintelligence-alliance",
-            "num_market_pairs": 510,
-            "date_added": "2019-03-02T00: 00: 00.000Z",
-            "tags": [
-                "cosmos-ecosystem",
-                "ai-big-data",
-                "collectibles-nfts",
-                "iot",
-                "ethereum-ecosystem",
-                "binance-launchpad",
-                "web3",
-                "injective-ecosystem",
-                "osmosis-ecosystem",
-                "generative-ai",
-                "dwf-labs-portfolio",
-                "ai-agents",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 2719493897,
-            "circulating_supply": 2372127529.1917915,
-            "total_supply": 2714493896.672,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 72,
-            "self_reported_circulating_supply": 2389296911,
-            "self_reported_market_cap": 1336199013.880045,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.5592436033078875,
-                    "volume_24h": 96845014.7695071,
-                    "volume_change_24h": -5.5752,
-                    "percent_change_1h": -0.12959214,
-                    "percent_change_24h": -0.03096099,
-                    "percent_change_7d": -5.7973633,
-                    "percent_change_30d": -14.02270263,
-                    "percent_change_60d": -22.44074657,
-                    "percent_change_90d": -22.01188007,
-                    "market_cap": 1326597146.9310536,
-                    "market_cap_dominance": 0.0314,
-                    "fully_diluted_market_cap": 1520859566.13,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 2634,
-            "name": "XDC Network",
-            "symbol": "XDC",
-            "slug": "xdc-network",
-            "num_market_pairs": 156,
-            "date_added": "2018-04-12T00: 00: 00.000Z",
-            "tags": [
-                "pos",
-                "enterprise-solutions",
-                "masternodes",
-                "smart-contracts",
-                "xdc-ecosystem",
-                "real-world-assets-protocols",
-                "layer-1",
-            ],
-            "max_supply": None,
-            "circulating_supply": 17749282607.449997,
-            "total_supply": 38024859731.55,
-            "infinite_supply": False,
-            "platform": None,
-            "cmc_rank": 73,
-            "self_reported_circulating_supply": 17749278012.05,
-            "self_reported_market_cap": 1308651591.501911,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.07372984921490701,
-                    "volume_24h": 44246180.97531091,
-                    "volume_change_24h": 17.3979,
-                    "percent_change_1h": -0.11059805,
-                    "percent_change_24h": 0.36458647,
-                    "percent_change_7d": -1.82808575,
-                    "percent_change_30d": -8.16331468,
-                    "percent_change_60d": -19.81253714,
-                    "percent_change_90d": 0.20772435,
-                    "market_cap": 1308651930.3200598,
-                    "market_cap_dominance": 0.031,
-                    "fully_diluted_market_cap": 2803567174.43,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 11840,
-            "name": "Optimism",
-            "symbol": "OP",
-            "slug": "optimism-ethereum",
-            "num_market_pairs": 719,
-            "date_added": "2022-05-31T16: 19: 46.000Z",
-            "tags": [
-                "layer-2",
-                "optimism-ecosystem",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 4294967296,
-            "circulating_supply": 1778634390,
-            "total_supply": 4294967296,
-            "platform": {
-                "id": 11840,
-                "name": "Optimism",
-                "symbol": "OP",
-                "slug": "optimism-ethereum",
-                "token_address": "0x4200000000000000000000000000000000000042",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 74,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.7350623102839946,
-                    "volume_24h": 170945067.48876688,
-                    "volume_change_24h": -26.8971,
-                    "percent_change_1h": -0.73251971,
-                    "percent_change_24h": 3.4566265,
-                    "percent_change_7d": 4.66494644,
-                    "percent_change_30d": -2.36605627,
-                    "percent_change_60d": -8.39663365,
-                    "percent_change_90d": 19.19103251,
-                    "market_cap": 1307407103.8639634,
-                    "market_cap_dominance": 0.0309,
-                    "fully_diluted_market_cap": 3157068583.19,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 7226,
-            "name": "Injective",
-            "symbol": "INJ",
-            "slug": "injective",
-            "num_market_pairs": 526,
-            "date_added": "2020-09-29T00: 00: 00.000Z",
-            "tags": [
-                "pos",
-                "platform",
-                "ai-big-data",
-                "smart-contracts",
-                "cosmos",
-                "binance-smart-chain",
-                "binance-launchpad",
-                "binance-labs-portfolio",
-                "cms-holdings-portfolio",
-                "pantera-capital-portfolio",
-                "web3",
-                "injective-ecosystem",
-                "real-world-assets-protocols",
-                "layer-1",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 99970935.41,
-            "total_supply": 100000000,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0xe28b3b32b6c345a34ff64674606124dd5aceca30",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 75,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 10: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 12.729265410523046,
-                    "volume_24h": 95094967.56354138,
-                    "volume_change_24h": -28.5841,
-                    "percent_change_1h": -0.48223932,
-                    "percent_change_24h": 2.05548464,
-                    "percent_change_7d": 1.86043867,
-                    "percent_change_30d": -5.89045235,
-                    "percent_change_60d": -13.43246011,
-                    "percent_change_90d": 11.69506274,
-                    "market_cap": 1272556570.1721466,
-                    "market_cap_dominance": 0.0301,
-                    "fully_diluted_market_cap": 1272926541.05,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 10: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 3155,
-            "name": "Quant",
-            "symbol": "QNT",
-            "slug": "quant",
-            "num_market_pairs": 334,
-            "date_added": "2018-08-10T00: 00: 00.000Z",
-            "tags": [
-                "platform",
-                "defi",
-                "interoperability",
-                "ethereum-ecosystem",
-                "real-world-assets-protocols",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": 14881364,
-            "circulating_supply": 12072738,
-            "total_supply": 14881364,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x4a220e6096b25eadb88358cb44068a3248254675",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 76,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 10: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 102.83553227423423,
-                    "volume_24h": 24396047.20028277,
-                    "volume_change_24h": -1.7895,
-                    "percent_change_1h": 0.05524087,
-                    "percent_change_24h": 0.56198279,
-                    "percent_change_7d": -2.21145957,
-                    "percent_change_30d": 2.83555802,
-                    "percent_change_60d": -11.51422563,
-                    "percent_change_90d": -8.51272003,
-                    "market_cap": 1241506438.237374,
-                    "market_cap_dominance": 0.0294,
-                    "fully_diluted_market_cap": 1530332987.91,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 10: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 4705,
-            "name": "PAX Gold",
-            "symbol": "PAXG",
-            "slug": "pax-gold",
-            "num_market_pairs": 286,
-            "date_added": "2019-09-26T00: 00: 00.000Z",
-            "tags": [
-                "ethereum-ecosystem",
-                "tokenized-gold",
-                "real-world-assets-protocols",
-                "binance-ecosystem",
-                "binance-listing",
-                "tokenized-assets",
-                "tokenized-commodities",
-            ],
-            "max_supply": None,
-            "circulating_supply": 299039.893,
-            "total_supply": 299039.893,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0x45804880de22913dafe09f4980848ece6ecbaf78",
-            },
-            "infinite_supply": True,
-            "cmc_rank": 77,
-            "self_reported_circulating_supply": None,
-            "self_reported_market_cap": None,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 4061.1345409875476,
-                    "volume_24h": 370508270.9597441,
-                    "volume_change_24h": 64.8916,
-                    "percent_change_1h": -0.04316132,
-                    "percent_change_24h": 1.55616148,
-                    "percent_change_7d": 4.8501799,
-                    "percent_change_30d": 11.54133692,
-                    "percent_change_60d": 19.97283464,
-                    "percent_change_90d": 21.96545189,
-                    "market_cap": 1214441238.5955203,
-                    "market_cap_dominance": 0.0287,
-                    "fully_diluted_market_cap": 1214441238.6,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 22861,
-            "name": "Celestia",
-            "symbol": "TIA",
-            "slug": "celestia",
-            "num_market_pairs": 314,
-            "date_added": "2023-10-31T16: 51: 41.000Z",
-            "tags": [
-                "platform",
-                "cosmos-ecosystem",
-                "layer-1",
-                "modular-blockchain",
-                "egirl-capital-portfolio",
-                "data-availability",
-                "cmc-crypto-awards-2024",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 808030167.053891,
-            "total_supply": 1148607287.232448,
-            "platform": {
-                "id": 12220,
-                "name": "Osmosis",
-                "symbol": "OSMO",
-                "slug": "osmosis",
-                "token_address": "ibc/D79E7D83AB399BFFF93433E54FAA480C191248FC556924A2A8351AE2638B3877",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 78,
-            "self_reported_circulating_supply": 141043527.75,
-            "self_reported_market_cap": 211363415.5645502,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 10: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 1.4985686967444005,
-                    "volume_24h": 82101405.90975961,
-                    "volume_change_24h": -24.0131,
-                    "percent_change_1h": -0.46069956,
-                    "percent_change_24h": 2.74902949,
-                    "percent_change_7d": 3.01430119,
-                    "percent_change_30d": -13.22966792,
-                    "percent_change_60d": -18.57930252,
-                    "percent_change_90d": -14.41485868,
-                    "market_cap": 1210888714.3721097,
-                    "market_cap_dominance": 0.0286,
-                    "fully_diluted_market_cap": 1721266925.5,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 10: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 36410,
-            "name": "MYX Finance",
-            "symbol": "MYX",
-            "slug": "myx-finance",
-            "num_market_pairs": 124,
-            "date_added": "2025-05-05T03: 08: 48.000Z",
-            "tags": [
-                "defi",
-                "derivatives",
-                "bnb-chain-ecosystem",
-                "binance-alpha",
-                "binance-wallet-ido",
-                "binance-ecosystem",
-                "binance-listing",
-                "perp-dex-coins",
-            ],
-            "max_supply": 1000000000,
-            "circulating_supply": 206105423.7,
-            "total_supply": 1000000000,
-            "platform": {
-                "id": 1839,
-                "name": "BNB Smart Chain (BEP20)",
-                "symbol": "BNB",
-                "slug": "bnb",
-                "token_address": "0xD82544bf0dfe8385eF8FA34D67e6e4940CC63e16",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 79,
-            "self_reported_circulating_supply": 124762450.9,
-            "self_reported_market_cap": 718880484.2320875,
-            "tvl_ratio": 41.25717031,
-            "last_updated": "2025-10-08T19: 10: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 5.761993925626604,
-                    "volume_24h": 102295687.62019576,
-                    "volume_change_24h": -37.5679,
-                    "percent_change_1h": -1.68801956,
-                    "percent_change_24h": 5.12368962,
-                    "percent_change_7d": -65.93583503,
-                    "percent_change_30d": -55.09432551,
-                    "percent_change_60d": 253.28210262,
-                    "percent_change_90d": 4349.48680067,
-                    "market_cap": 1187578199.3980975,
-                    "market_cap_dominance": 0.0281,
-                    "fully_diluted_market_cap": 5761993925.63,
-                    "tvl": 28784771,
-                    "last_updated": "2025-10-08T19: 10: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 4847,
-            "name": "Stacks",
-            "symbol": "STX",
-            "slug": "stacks",
-            "num_market_pairs": 264,
-            "date_added": "2019-10-28T00: 00: 00.000Z",
-            "tags": [
-                "mineable",
-                "platform",
-                "collectibles-nfts",
-                "gaming",
-                "smart-contracts",
-                "layer-2",
-                "metaverse",
-                "arrington-xrp-capital-portfolio",
-                "blockchain-capital-portfolio",
-                "dcg-portfolio",
-                "fabric-ventures-portfolio",
-                "hashkey-capital-portfolio",
-                "huobi-capital-portfolio",
-                "usv-portfolio",
-                "web3",
-                "injective-ecosystem",
-                "bitcoin-ecosystem",
-                "made-in-america",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 1803374018.36152,
-            "total_supply": 1803374018.36152,
-            "infinite_supply": True,
-            "platform": None,
-            "cmc_rank": 80,
-            "self_reported_circulating_supply": 1048765672.09,
-            "self_reported_market_cap": 651529464.6039325,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.6212345445151273,
-                    "volume_24h": 43834389.01874454,
-                    "volume_change_24h": -60.4579,
-                    "percent_change_1h": -0.24868194,
-                    "percent_change_24h": 2.62132173,
-                    "percent_change_7d": 3.02836004,
-                    "percent_change_30d": -3.87974943,
-                    "percent_change_60d": -17.88240428,
-                    "percent_change_90d": -13.81925387,
-                    "market_cap": 1120318236.8872337,
-                    "market_cap_dominance": 0.0265,
-                    "fully_diluted_market_cap": 1120318236.89,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-        {
-            "id": 26081,
-            "name": "First Digital USD",
-            "symbol": "FDUSD",
-            "slug": "first-digital-usd",
-            "num_market_pairs": 595,
-            "date_added": "2023-07-26T04: 26: 40.000Z",
-            "tags": [
-                "stablecoin",
-                "binance-smart-chain",
-                "usd-stablecoin",
-                "fiat-stablecoin",
-                "binance-ecosystem",
-                "binance-listing",
-            ],
-            "max_supply": None,
-            "circulating_supply": 1090277559.743592,
-            "total_supply": 1090277559.743592,
-            "platform": {
-                "id": 1027,
-                "name": "Ethereum",
-                "symbol": "ETH",
-                "slug": "ethereum",
-                "token_address": "0xc5f0f7b66764F6ec8C8Dff7BA683102295E16409",
-            },
-            "infinite_supply": False,
-            "cmc_rank": 81,
-            "self_reported_circulating_supply": 1090277559.74,
-            "self_reported_market_cap": 1088736067.389962,
-            "tvl_ratio": None,
-            "last_updated": "2025-10-08T19: 09: 00.000Z",
-            "quote": {
-                "USD": {
-                    "price": 0.9985861468611665,
-                    "volume_24h": 7458852706.389782,
-                    "volume_change_24h": -10.9475,
-                    "percent_change_1h": 0.07084668,
-                    "percent_change_24h": 0.05606597,
-                    "percent_change_7d": 0.03295625,
-                    "percent_change_30d": 0.068822,
-                    "percent_change_60d": 0.0380136,
-                    "percent_change_90d": -0.01223465,
-                    "market_cap": 1088736067.393549,
-                    "market_cap_dominance": 0.0258,
-                    "fully_diluted_market_cap": 1088736067.39,
-                    "tvl": None,
-                    "last_updated": "2025-10-08T19: 09: 00.000Z",
-                }
-            },
-        },
-    ]
-}
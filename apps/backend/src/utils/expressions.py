@@ -0,0 +1,157 @@
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import jmespath
+from jmespath.parser import ParsedResult
+
+# Upper bound on distinct expressions kept compiled for the whole process.
+# Sources rarely declare more than a few dozen mapping / filter paths each.
+EXPRESSION_CACHE_SIZE = 1024
+
+# Plain paths such as `name`, `quote.USD.price` or `tags[0]`: unquoted
+# JMESPath identifiers joined by dots, optionally indexed with integers.
+_IDENTIFIER = r"[A-Za-z_][A-Za-z0-9_]*"
+_INDEX = r"\[-?[0-9]+\]"
+_SIMPLE_PATH_RE = re.compile(
+    rf"^(?:{_IDENTIFIER}|{_INDEX})(?:\.{_IDENTIFIER}|{_INDEX})*$"
+)
+_STEP_RE = re.compile(rf"({_IDENTIFIER})|\[(-?[0-9]+)\]")
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(expression: str) -> ParsedResult:
+    """
+    Compile a JMESPath expression, reusing the parsed result across calls.
+
+    Raises:
+        jmespath.exceptions.JMESPathError: if the expression is invalid
+            (failures are not cached, so a later fix to a source is picked up)
+    """
+    return jmespath.compile(expression)
+
+
+def _missing(data: Any) -> Any:
+    return None
+
+
+def _parse_simple_path(expression: str) -> Optional[List[Union[str, int]]]:
+    """
+    Split a plain dotted/indexed path into lookup steps.
+
+    Returns:
+        ["quote", "USD", "price"] / ["tags", 0], or None when the expression
+        needs the full JMESPath interpreter.
+    """
+    if not _SIMPLE_PATH_RE.match(expression):
+        return None
+    steps: List[Union[str, int]] = []
+    for name, index in _STEP_RE.findall(expression):
+        steps.append(name if name else int(index))
+    return steps
+
+
+def _lower_simple_path(steps: List[Union[str, int]]) -> Callable[[Any], Any]:
+    """
+    Turn lookup steps into a direct accessor with JMESPath semantics:
+    a field on a non-object, an index on a non-list and an out of range
+    index all resolve to None.
+    """
+    if all(isinstance(step, str) for step in steps):
+        if len(steps) == 1:
+            key = steps[0]
+
+            def get_field(data: Any) -> Any:
+                try:
+                    return data.get(key)
+                except AttributeError:
+                    return None
+
+            return get_field
+
+        keys: Tuple[str, ...] = tuple(steps)  # type: ignore[arg-type]
+
+        def get_fields(data: Any) -> Any:
+            try:
+                for key in keys:
+                    data = data.get(key)
+                return data
+            except AttributeError:
+                return None
+
+        return get_fields
+
+    path = tuple(steps)
+
+    def get_path(data: Any) -> Any:
+        for step in path:
+            if step.__class__ is int:
+                if not isinstance(data, list):
+                    return None
+                try:
+                    data = data[step]
+                except IndexError:
+                    return None
+            else:
+                try:
+                    data = data.get(step)
+                except AttributeError:
+                    return None
+        return data
+
+    return get_path
+
+
+def object_path_steps(expression: str) -> Optional[List[str]]:
+    """
+    Keys of a plain object path such as `result.items`, or None when the
+    expression uses anything else (indexes, filters, functions, ...).
+    """
+    steps = _parse_simple_path(expression)
+    if steps is None or not all(isinstance(step, str) for step in steps):
+        return None
+    return steps  # type: ignore[return-value]
+
+
+def compile_getter(expression: str) -> Callable[[Any], Any]:
+    """
+    Build a value getter for `expression` that never raises.
+
+    Plain paths are lowered to direct dict/list lookups; anything else goes
+    through the cached JMESPath parser. Invalid expressions yield a getter
+    that always returns None, and evaluation errors on a given item are
+    reported as None for that item, matching how filtering and field
+    mapping treat unresolvable paths.
+    """
+    steps = _parse_simple_path(expression)
+    if steps is not None:
+        return _lower_simple_path(steps)
+
+    try:
+        compiled = compile_expression(expression)
+    except jmespath.exceptions.JMESPathError:
+        return _missing
+
+    def getter(data: Any) -> Any:
+        try:
+            return compiled.search(data)
+        except jmespath.exceptions.JMESPathError:
+            return None
+
+    return getter
+
+
+def expression_cache_info() -> Dict[str, int]:
+    """
+    Hit/miss counters of the shared expression cache.
+
+    Returns:
+        {"hits": ..., "misses": ..., "size": ..., "maxsize": ...}
+    """
+    info = compile_expression.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+    }
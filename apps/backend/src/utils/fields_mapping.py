@@ -1,12 +1,36 @@
-import jmespath
-from typing import Dict, Any
+from typing import Dict, Any, Callable, List, Tuple
+from src.utils.expressions import compile_getter
 
+CompiledMapping = List[Tuple[str, Callable[[Any], Any]]]
 
-def extract_fields(item: Dict[str, Any], mapping: Dict[str, str]) -> Dict[str, Any]:
-    result = {}
+
+def _missing(item: Any) -> Any:
+    return None
+
+
+def compile_mapping(mapping: Dict[str, str]) -> CompiledMapping:
+    """
+    Resolve every mapping expression once so items can be mapped without re-parsing.
+    """
+    compiled: CompiledMapping = []
     for target_field, expression in mapping.items():
         try:
-            result[target_field] = jmespath.search(expression, item)
+            getter = compile_getter(expression)
+        except Exception:
+            getter = _missing
+        compiled.append((target_field, getter))
+    return compiled
+
+
+def extract_compiled(item: Dict[str, Any], compiled: CompiledMapping) -> Dict[str, Any]:
+    result = {}
+    for target_field, getter in compiled:
+        try:
+            result[target_field] = getter(item)
         except Exception:
             result[target_field] = None
     return result
+
+
+def extract_fields(item: Dict[str, Any], mapping: Dict[str, str]) -> Dict[str, Any]:
+    return extract_compiled(item, compile_mapping(mapping))
@@ -0,0 +1,133 @@
+"""
+Column-at-a-time evaluation of compiled filter conditions.
+
+Every filtered path is read once into a column (float64 for numeric
+comparisons, object for string equality) and `gt/gte/lt/lte/eq/neq`
+become boolean masks combined with `&`. Operators without a vector form
+(contains, regex, ...) run row-wise, but only on rows that survived the
+masks. Requires NumPy; `columnar_available()` is False without it.
+"""
+
+import math
+import operator
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.utils.filtering.handlers import _to_float
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+# Below this many rows building columns costs more than it saves
+COLUMNAR_MIN_ROWS = 1_000
+
+_NUMERIC_OPS: Dict[str, Callable[[Any, Any], Any]] = {
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+
+def columnar_available() -> bool:
+    return np is not None
+
+
+def _float_or_nan(value: Any) -> float:
+    try:
+        return _to_float(value)
+    except (ValueError, TypeError, OverflowError):
+        return math.nan
+
+
+def _numeric_operand(operand: Any) -> Optional[float]:
+    try:
+        return _to_float(operand)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def _vector_form(condition: Any) -> Optional[Tuple[str, Callable[[Any], Any]]]:
+    """
+    Returns:
+        ("float" | "str", column -> mask) for conditions with a vector form,
+        None for conditions that must run row-wise.
+    """
+    op, operand = condition.op, condition.operand
+
+    if op in _NUMERIC_OPS:
+        right = _numeric_operand(operand)
+        if right is None:
+            return None
+        compare = _NUMERIC_OPS[op]
+        return "float", lambda column: compare(column, right)
+
+    if op in ("eq", "neq"):
+        # A bool operand equals the string "True"/"False" as well as 1.0/0.0,
+        # which neither column kind can express on its own
+        if isinstance(operand, bool):
+            return None
+        right = _numeric_operand(operand)
+        if right is not None:
+            # NaN (non-numeric value) never equals, like the row-wise handler
+            kind, equals = "float", lambda column: column == right
+        else:
+            right_str = str(operand)
+            kind, equals = "str", lambda column: column == right_str
+        if op == "eq":
+            return kind, equals
+        return kind, lambda column: ~equals(column)
+
+    return None
+
+
+def prefilter_columnar(
+    conditions: List[Any], items: List[Dict]
+) -> Tuple[List[Dict], List[Any]]:
+    """
+    Evaluate every condition that has a vector form over whole columns.
+
+    Returns:
+        (surviving items in their original order, conditions that still have
+        to be run row by row on those items)
+
+    Conditions carrying `stats` get their evaluated/passed counts recorded.
+    """
+    n = len(items)
+    mask = np.ones(n, dtype=bool)
+    columns: Dict[Tuple[str, str], Any] = {}
+    row_conditions = []
+
+    for condition in conditions:
+        form = _vector_form(condition)
+        if form is None:
+            row_conditions.append(condition)
+            continue
+
+        kind, to_mask = form
+        column = columns.get((kind, condition.path))
+        if column is None:
+            getter = condition.value
+            if kind == "float":
+                column = np.fromiter(
+                    (_float_or_nan(getter(item)) for item in items),
+                    dtype=np.float64,
+                    count=n,
+                )
+            else:
+                column = np.empty(n, dtype=object)
+                column[:] = [str(getter(item)) for item in items]
+            columns[(kind, condition.path)] = column
+
+        condition_mask = to_mask(column)
+        if condition.stats is not None:
+            evaluated = int(mask.sum())
+            mask &= condition_mask
+            condition.stats.record(evaluated, int(mask.sum()))
+        else:
+            mask &= condition_mask
+        if not mask.any():
+            return [], []
+
+    return [items[i] for i in np.flatnonzero(mask)], row_conditions
@@ -1,7 +1,6 @@
-
-
 import re
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable, List, Tuple
 
 
 def _to_float(val: Any) -> float:
@@ -80,3 +79,114 @@ def _neq(left: Any, right: Any) -> bool:
     """Check inequality."""
     return not _eq(left, right)
 
+
+# ---- Bind phase ----
+# Each `_bind_*` normalises the operand once and returns a predicate that
+# only touches the item value. Results are identical to the two-argument
+# handlers above, which remain for one-off checks via `match_single`.
+
+Predicate = Callable[[Any], bool]
+
+
+def _never(value: Any) -> bool:
+    return False
+
+
+@lru_cache(maxsize=256)
+def _compile_regex(pattern: str) -> re.Pattern:
+    """Compile a user regex once per process (raises re.error if invalid)."""
+    return re.compile(pattern, flags=re.IGNORECASE)
+
+
+def _as_patterns(pattern: Any) -> Tuple[str, ...]:
+    """Normalise a single pattern or list of patterns to a lowercased tuple."""
+    if isinstance(pattern, list):
+        return tuple(_normalize_string(p) for p in pattern)
+    return (_normalize_string(pattern),)
+
+
+def _bind_numeric_compare(op_func, operand: Any) -> Predicate:
+    try:
+        right = _to_float(operand)
+    except (ValueError, TypeError):
+        return _never
+
+    def test(value: Any) -> bool:
+        try:
+            return op_func(_to_float(value), right)
+        except (ValueError, TypeError):
+            return False
+
+    return test
+
+
+def _bind_eq(operand: Any) -> Predicate:
+    right_str = str(operand)
+    try:
+        right = _to_float(operand)
+    except (ValueError, TypeError):
+        return lambda value: str(value) == right_str
+
+    def test(value: Any) -> bool:
+        try:
+            return _to_float(value) == right
+        except (ValueError, TypeError):
+            return str(value) == right_str
+
+    return test
+
+
+def _bind_neq(operand: Any) -> Predicate:
+    eq = _bind_eq(operand)
+    return lambda value: not eq(value)
+
+
+def _bind_contains(pattern: Any) -> Predicate:
+    patterns = _as_patterns(pattern)
+    if not patterns:
+        return _never
+    if len(patterns) == 1:
+        needle = patterns[0]
+        return lambda value: value is not None and needle in _normalize_string(value)
+
+    # One pass over the value for any number of patterns
+    alternation = re.compile("|".join(re.escape(p) for p in patterns))
+    return lambda value: (
+        value is not None and alternation.search(_normalize_string(value)) is not None
+    )
+
+
+def _bind_startswith(pattern: Any) -> Predicate:
+    prefixes = _as_patterns(pattern)
+    return lambda value: (
+        value is not None and _normalize_string(value).startswith(prefixes)
+    )
+
+
+def _bind_endswith(pattern: Any) -> Predicate:
+    suffixes = _as_patterns(pattern)
+    return lambda value: (
+        value is not None and _normalize_string(value).endswith(suffixes)
+    )
+
+
+def _bind_regex(pattern: Any) -> Predicate:
+    raw_patterns = pattern if isinstance(pattern, list) else [pattern]
+    compiled: List[re.Pattern] = []
+    for p in raw_patterns:
+        try:
+            compiled.append(_compile_regex(str(p)))
+        except re.error:
+            # `_regex` stops (and fails) at the first invalid pattern, so only
+            # the patterns before it can ever produce a match.
+            break
+    if not compiled:
+        return _never
+
+    def test(value: Any) -> bool:
+        if value is None:
+            return False
+        text = str(value)
+        return any(p.search(text) is not None for p in compiled)
+
+    return test
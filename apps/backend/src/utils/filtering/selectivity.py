@@ -0,0 +1,84 @@
+"""
+Pass-rate statistics used to order filter conditions.
+
+A condition that is cheap to evaluate and rejects most items should run
+first. Cost is a static estimate per operator; selectivity is learned from
+previous searches and kept per (source, filter key, operator).
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+# Relative evaluation cost per operator (numeric compares are the baseline)
+OPERATOR_COSTS: Dict[str, float] = {
+    "gt": 1.0,
+    "gte": 1.0,
+    "lt": 1.0,
+    "lte": 1.0,
+    "eq": 1.5,
+    "neq": 1.5,
+    "startswith": 2.0,
+    "endswith": 2.0,
+    "contains": 3.0,
+    "regex": 6.0,
+}
+DEFAULT_OPERATOR_COST = 3.0
+
+# Older searches weigh less each time new counts are recorded, so a shift in
+# upstream data is picked up after a handful of requests
+DECAY = 0.8
+# Prior pass rate for conditions without history
+PRIOR_PASS_RATE = 0.5
+PRIOR_WEIGHT = 1.0
+
+# Bound on tracked (source, key, op) triples; oldest entries are dropped first
+MAX_TRACKED = 4096
+
+
+class SelectivityStats:
+    """Exponentially decayed evaluated/passed counts for one condition."""
+
+    __slots__ = ("evaluated", "passed")
+
+    def __init__(self):
+        self.evaluated = 0.0
+        self.passed = 0.0
+
+    def record(self, evaluated: int, passed: int) -> None:
+        if not evaluated:
+            return
+        self.evaluated = self.evaluated * DECAY + evaluated
+        self.passed = self.passed * DECAY + passed
+
+    @property
+    def pass_rate(self) -> float:
+        return (self.passed + PRIOR_PASS_RATE * PRIOR_WEIGHT) / (
+            self.evaluated + PRIOR_WEIGHT
+        )
+
+
+_registry: Dict[Tuple[str, str, str], SelectivityStats] = {}
+
+
+def selectivity_stats(stats_key: str, key: str, op: str) -> SelectivityStats:
+    """Get (or start) the stats for one condition of one source."""
+    entry = (stats_key, key, op)
+    stats = _registry.get(entry)
+    if stats is None:
+        if len(_registry) >= MAX_TRACKED:
+            _registry.pop(next(iter(_registry)))
+        stats = _registry[entry] = SelectivityStats()
+    return stats
+
+
+def condition_rank(op: str, stats: Optional[SelectivityStats]) -> float:
+    """
+    Expected cost of evaluating a condition per item it rejects; lower runs first.
+    """
+    cost = OPERATOR_COSTS.get(op, DEFAULT_OPERATOR_COST)
+    pass_rate = stats.pass_rate if stats is not None else PRIOR_PASS_RATE
+    return cost / max(1.0 - pass_rate, 1e-3)
+
+
+def order_conditions(conditions: List[Any]) -> List[Any]:
+    """Stable sort of compiled conditions by `condition_rank`."""
+    return sorted(conditions, key=lambda c: condition_rank(c.op, c.stats))
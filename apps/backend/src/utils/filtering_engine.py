@@ -1,8 +1,19 @@
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal
 import operator
-import jmespath
+import time
 from functools import lru_cache
 
+from src.utils.expressions import compile_getter
+from src.utils.filtering.columnar import (
+    COLUMNAR_MIN_ROWS,
+    columnar_available,
+    prefilter_columnar,
+)
+from src.utils.filtering.selectivity import (
+    SelectivityStats,
+    order_conditions,
+    selectivity_stats,
+)
 from src.utils.filtering.handlers import (
     _eq,
     _neq,
@@ -11,6 +22,13 @@ from src.utils.filtering.handlers import (
     _endswith,
     _regex,
     _safe_numeric_compare,
+    _bind_eq,
+    _bind_neq,
+    _bind_contains,
+    _bind_startswith,
+    _bind_endswith,
+    _bind_regex,
+    _bind_numeric_compare,
 )
 
 
@@ -42,6 +60,20 @@ OPERATORS_HANDLERS: Dict[str, Any] = {
     "regex": _regex,
 }
 
+# Bind-phase registry: operand -> single-argument predicate over the item value
+OPERATOR_BINDERS: Dict[str, Callable[[Any], Callable[[Any], bool]]] = {
+    "eq": _bind_eq,
+    "neq": _bind_neq,
+    "gt": lambda operand: _bind_numeric_compare(operator.gt, operand),
+    "gte": lambda operand: _bind_numeric_compare(operator.ge, operand),
+    "lt": lambda operand: _bind_numeric_compare(operator.lt, operand),
+    "lte": lambda operand: _bind_numeric_compare(operator.le, operand),
+    "contains": _bind_contains,
+    "startswith": _bind_startswith,
+    "endswith": _bind_endswith,
+    "regex": _bind_regex,
+}
+
 # Which operators are suitable per field type (for FE and validation)
 ALLOWED_OPERATORS_BY_TYPE: Dict[str, List[str]] = {
     "string": ["eq", "neq", "contains", "startswith", "endswith", "regex"],
@@ -92,59 +124,369 @@ def match_single(value: Any, cond: Any, field_type: str | None = None) -> bool:
         return OPERATORS_HANDLERS["eq"](value, cond)
 
 
-def apply_filters(
-    items: List[Dict], filter_descriptors: List[Any], filter_to_apply: Dict[str, Any]
-) -> List[Dict]:
+def _get_attr(obj: Any, name: str, default: Any = None) -> Any:
+    """Get attribute from dict or object safely."""
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def _bind_operator(op: str, operand: Any) -> Callable[[Any], bool]:
     """
-    Apply backend filters to items.
+    Bind an operator to its operand once, returning a single-argument predicate.
+    """
+    return OPERATOR_BINDERS[op](operand)
+
+
+def _stats_for(stats_key: str | None, key: str, op: str) -> SelectivityStats | None:
+    return selectivity_stats(stats_key, key, op) if stats_key is not None else None
+
+
+class FilterCondition:
+    """
+    A single compiled `field <op> operand` check.
+
+    Attributes:
+        key: Filter key as declared in the source backend_filters
+        path: JMESPath expression used to read the value from an item
+        op: Operator id (eq, gt, contains, ...)
+        operand: Operand as sent by the user
+        test: Predicate bound to the operand, called with the extracted value
+        value: Compiled getter for `path`
+        stats: Pass-rate statistics shared by searches of the same source,
+            or None when the plan was compiled without a stats_key
+    """
+
+    __slots__ = ("key", "path", "op", "operand", "test", "value", "stats")
+
+    def __init__(
+        self,
+        key: str,
+        path: str,
+        op: str,
+        operand: Any,
+        test: Callable[[Any], bool],
+        stats: SelectivityStats | None = None,
+        value: Callable[[Any], Any] | None = None,
+    ):
+        self.key = key
+        self.path = path
+        self.op = op
+        self.operand = operand
+        self.test = test
+        self.value = value or compile_getter(path)
+        self.stats = stats
+
+    def __call__(self, item: Any) -> bool:
+        return self.test(self.value(item))
+
+
+class FilterTrace:
+    """
+    Opt-in per-request record of how each condition behaved.
+
+    Only passed to `FilterPlan.apply` when tracing is requested, so the
+    regular filtering loop carries no bookkeeping at all. Counts accumulate
+    over repeated `apply` calls with the same plan (one per upstream page).
+    """
+
+    def __init__(self):
+        self.started = False
+        self.items_in = 0
+        self.items_out = 0
+        self.evaluated: List[int] = []
+        self.passed: List[int] = []
+        self.elapsed_ns: List[int] = []
+        self.conditions: List[FilterCondition] = []
+
+    def start(self, conditions: List[FilterCondition]) -> None:
+        self.started = True
+        self.conditions = list(conditions)
+        self.evaluated = [0] * len(conditions)
+        self.passed = [0] * len(conditions)
+        self.elapsed_ns = [0] * len(conditions)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Returns:
+            {"items_in": 100, "items_out": 7, "conditions": [
+                {"key": "price", "op": "gte", "operand": 1000,
+                 "evaluated": 100, "passed": 12, "failed": 88, "time_ms": 0.08}, ...]}
+        """
+        return {
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "conditions": [
+                {
+                    "key": c.key,
+                    "op": c.op,
+                    "operand": c.operand,
+                    "evaluated": self.evaluated[i],
+                    "passed": self.passed[i],
+                    "failed": self.evaluated[i] - self.passed[i],
+                    "time_ms": round(self.elapsed_ns[i] / 1_000_000, 3),
+                }
+                for i, c in enumerate(self.conditions)
+            ],
+        }
+
+
+FilterEngine = Literal["auto", "row", "columnar"]
+
+
+class FilterPlan:
+    """
+    Reusable, pre-validated form of (filter_descriptors, filter_to_apply).
+
+    Everything that does not depend on the item is resolved once in
+    `compile_filters`, so `apply` only runs the bound predicates.
+    """
+
+    def __init__(
+        self, conditions: List[FilterCondition], matches_nothing: bool = False
+    ):
+        self.conditions = conditions
+        self.matches_nothing = matches_nothing
+        self.records_stats = any(c.stats is not None for c in conditions)
+
+    def matches(self, item: Any) -> bool:
+        if self.matches_nothing:
+            return False
+        for condition in self.conditions:
+            if not condition(item):
+                return False
+        return True
+
+    def iter_matches(self, items: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Lazily yield matching items, row by row, as the caller consumes them.
+        Used for streamed responses; selectivity statistics are not recorded.
+        """
+        if self.matches_nothing:
+            return
+        conditions = self.conditions
+        for item in items:
+            if all(c(item) for c in conditions):
+                yield item
+
+    def apply(
+        self,
+        items: List[Dict],
+        trace: FilterTrace | None = None,
+        engine: FilterEngine = "auto",
+    ) -> List[Dict]:
+        """
+        Args:
+            items: Items to filter
+            trace: Optional FilterTrace (always evaluated row by row)
+            engine: "row", "columnar" or "auto", which picks columnar for
+                result sets of at least COLUMNAR_MIN_ROWS items. Columnar needs
+                NumPy; without it every engine evaluates row by row.
+        """
+        if trace is not None:
+            return self._apply_traced(items, trace)
+        if self.matches_nothing:
+            return []
+        conditions = self.conditions
+        if not conditions:
+            return list(items)
+        if columnar_available() and (
+            engine == "columnar"
+            or (engine == "auto" and len(items) >= COLUMNAR_MIN_ROWS)
+        ):
+            items, conditions = prefilter_columnar(conditions, items)
+            if not conditions:
+                return items
+        if self.records_stats:
+            return self._apply_recorded(conditions, items)
+        return [item for item in items if all(c(item) for c in conditions)]
+
+    @staticmethod
+    def _apply_recorded(
+        conditions: List[FilterCondition], items: List[Dict]
+    ) -> List[Dict]:
+        """Row-wise loop that also feeds the selectivity statistics."""
+        out: List[Dict] = []
+        rejected = [0] * len(conditions)
+        for item in items:
+            for i, condition in enumerate(conditions):
+                if not condition(item):
+                    rejected[i] += 1
+                    break
+            else:
+                out.append(item)
+
+        evaluated = len(items)
+        for condition, failed in zip(conditions, rejected):
+            if condition.stats is not None:
+                condition.stats.record(evaluated, evaluated - failed)
+            evaluated -= failed
+        return out
+
+    def _apply_traced(self, items: List[Dict], trace: FilterTrace) -> List[Dict]:
+        conditions = self.conditions
+        if not trace.started:
+            trace.start(conditions)
+        trace.items_in += len(items)
+        if self.matches_nothing:
+            return []
+
+        out: List[Dict] = []
+        evaluated, passed, elapsed_ns = trace.evaluated, trace.passed, trace.elapsed_ns
+        clock = time.perf_counter_ns
+        for item in items:
+            for i, condition in enumerate(conditions):
+                started = clock()
+                ok = condition(item)
+                elapsed_ns[i] += clock() - started
+                evaluated[i] += 1
+                if not ok:
+                    break
+                passed[i] += 1
+            else:
+                out.append(item)
+
+        trace.items_out += len(out)
+        return out
+
+
+class IndexedFilter:
+    """
+    A backend filter descriptor with everything request-independent resolved:
+    effective path, compiled getter and the operators allowed for its type.
+    """
+
+    __slots__ = ("key", "path", "allowed", "value")
+
+    def __init__(self, key: str, path: str, field_type: str | None):
+        self.key = key
+        self.path = path
+        self.allowed = (
+            ALLOWED_OPERATORS_BY_TYPE.get(field_type, []) if field_type else None
+        )
+        self.value = compile_getter(path)
+
+
+FilterIndex = Dict[str, List[IndexedFilter]]
+
+
+def index_filter_descriptors(filter_descriptors: List[Any]) -> FilterIndex:
+    """
+    Index backend filter descriptors by key (once per source), so compiling
+    a request only looks up the keys the user actually filters on.
+    """
+    index: FilterIndex = {}
+    for desc in filter_descriptors or []:
+        key = _get_attr(desc, "key")
+        path = _get_attr(desc, "path") or key
+        index.setdefault(key, []).append(
+            IndexedFilter(key, path, _get_attr(desc, "type"))
+        )
+    return index
+
+
+def compile_filters(
+    filter_descriptors: List[Any],
+    filter_to_apply: Dict[str, Any],
+    stats_key: str | None = None,
+) -> FilterPlan:
+    """
+    Compile backend filter descriptors and user conditions into a FilterPlan.
 
     Args:
-        items: List of items to filter
         filter_descriptors: List of filter configurations with keys like 'key', 'path', 'type'
         filter_to_apply: User's filter conditions {"price": {"gt":0.1}, "name": {"contains":["bit"]}}
+        stats_key: Identifies the source whose pass-rate statistics are used to
+            order the conditions and updated on every apply (usually the source id)
 
     Returns:
-        Filtered list of items that match all conditions
+        FilterPlan whose conditions only need the item to be evaluated, ordered
+        so that cheap and selective checks run first.
+        Conditions with an operator that is unknown or not allowed for the
+        field type make the plan match nothing, same as `match_single`.
     """
-    out: List[Dict] = []
+    return compile_indexed_filters(
+        index_filter_descriptors(filter_descriptors), filter_to_apply, stats_key
+    )
 
-    def _get_attr(obj: Any, name: str, default: Any = None) -> Any:
-        """Get attribute from dict or object safely."""
-        if isinstance(obj, dict):
-            return obj.get(name, default)
-        return getattr(obj, name, default)
 
-    for item in items:
-        all_conditions_met = True
+def compile_indexed_filters(
+    index: FilterIndex,
+    filter_to_apply: Dict[str, Any],
+    stats_key: str | None = None,
+) -> FilterPlan:
+    """
+    Same as `compile_filters`, starting from a prebuilt `index_filter_descriptors` index.
+    """
+    conditions: List[FilterCondition] = []
 
-        for desc in filter_descriptors or []:
-            key = _get_attr(desc, "key")
-            field_type = _get_attr(desc, "type")
-            path = _get_attr(desc, "path") or key
+    for key, cond in (filter_to_apply or {}).items():
+        # Filters without a backend descriptor are ignored
+        if cond is None or key not in index:
+            continue
 
-            # Skip if user didn't provide filter for this field
-            if key not in (filter_to_apply or {}):
+        for entry in index[key]:
+            if not isinstance(cond, dict):
+                # Primitive condition use simple equality check
+                conditions.append(
+                    FilterCondition(
+                        key,
+                        entry.path,
+                        "eq",
+                        cond,
+                        _bind_operator("eq", cond),
+                        _stats_for(stats_key, key, "eq"),
+                        entry.value,
+                    )
+                )
                 continue
 
-            cond = filter_to_apply[key]
-
-            # Extract value using JMESPath
-            try:
-                val = jmespath.search(path, item)
-            except jmespath.exceptions.JMESPathError:
-                val = None
-            print(
-                f"Filtering item on field '{key}' (path: '{path}') with value: {val} against condition: {cond}"
-            )
-            # Check if value matches condition
-            if not match_single(val, cond, field_type):
-                all_conditions_met = False
-                break
-
-        if all_conditions_met:
-            out.append(item)
-
-    return out
+            for op, operand in cond.items():
+                if (entry.allowed is not None and op not in entry.allowed) or (
+                    op not in OPERATORS_HANDLERS
+                ):
+                    # Unknown or disallowed operator -> fail-safe
+                    return FilterPlan([], matches_nothing=True)
+                conditions.append(
+                    FilterCondition(
+                        key,
+                        entry.path,
+                        op,
+                        operand,
+                        _bind_operator(op, operand),
+                        _stats_for(stats_key, key, op),
+                        entry.value,
+                    )
+                )
+
+    return FilterPlan(order_conditions(conditions))
+
+
+def apply_filters(
+    items: List[Dict],
+    filter_descriptors: List[Any],
+    filter_to_apply: Dict[str, Any],
+    trace: FilterTrace | None = None,
+    engine: FilterEngine = "auto",
+    stats_key: str | None = None,
+) -> List[Dict]:
+    """
+    Apply backend filters to items.
+
+    Args:
+        items: List of items to filter
+        filter_descriptors: List of filter configurations with keys like 'key', 'path', 'type'
+        filter_to_apply: User's filter conditions {"price": {"gt":0.1}, "name": {"contains":["bit"]}}
+        trace: Optional FilterTrace collecting per-condition counts and timings
+        engine: Evaluation engine, see `FilterPlan.apply`
+        stats_key: Source identifier for selectivity-aware ordering, see `compile_filters`
+
+    Returns:
+        Filtered list of items that match all conditions
+    """
+    return compile_filters(filter_descriptors, filter_to_apply, stats_key).apply(
+        items, trace, engine
+    )
 
 
 @lru_cache(maxsize=32)
@@ -0,0 +1,40 @@
+"""
+Canned upstream payloads (JSON files in src/fixtures) for sources in replay
+mode, benchmarks and local development.
+
+Nothing is read at import time: a fixture is parsed on first use and then
+kept in memory for the life of the process.
+"""
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, List
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
+
+# Fixture names are file stems; anything else could escape FIXTURES_DIR
+FIXTURE_NAME_PATTERN = r"^[A-Za-z0-9_-]+$"
+_FIXTURE_NAME_RE = re.compile(FIXTURE_NAME_PATTERN)
+
+
+def fixture_names() -> List[str]:
+    """Names of the bundled fixtures (e.g. "cmc_listings")."""
+    return sorted(path.stem for path in FIXTURES_DIR.glob("*.json"))
+
+
+@lru_cache(maxsize=None)
+def load_fixture(name: str) -> Any:
+    """
+    Parsed payload of fixture `name`. The same object is returned on every
+    call, so callers must not mutate it.
+
+    Raises:
+        ValueError: if `name` is not a valid fixture name
+        FileNotFoundError: if there is no such fixture
+    """
+    if not _FIXTURE_NAME_RE.match(name):
+        raise ValueError(f"Invalid fixture name: {name!r}")
+    with open(FIXTURES_DIR / f"{name}.json", encoding="utf-8") as f:
+        return json.load(f)
@@ -1,6 +1,74 @@
 import httpx
 import asyncio
-from typing import Optional, Dict, Any
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Dict, Any
+from src.core.config import settings
+from src.utils.timing import record_upstream
+from src.utils.transports import build_transport
+
+# Application-lifetime client shared by every outbound request, so TCP/TLS
+# connections to upstream APIs are pooled and kept alive between searches.
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def create_http_client(
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> httpx.AsyncClient:
+    """
+    Build the upstream AsyncClient.
+
+    Args:
+        transport: Defaults to the mode in `settings.upstream_transport`
+            (pooled network passthrough, record or replay; see src.utils.transports)
+    """
+    return httpx.AsyncClient(
+        transport=transport or build_transport(),
+        timeout=settings.http_timeout,
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use (e.g. outside the app)."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = create_http_client()
+    return _shared_client
+
+
+def set_http_client(client: httpx.AsyncClient) -> None:
+    """Install `client` as the shared client (e.g. a stub upstream in benchmarks)."""
+    global _shared_client
+    _shared_client = client
+
+
+async def close_http_client() -> None:
+    """Close the shared client and its connection pool (run at shutdown)."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+def _request_timeout(timeout: Optional[float]) -> Any:
+    """Per-request timeout; None keeps the client's (httpx reads None as "no timeout")."""
+    return httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+
+
+def _retry_delay(exc: Exception, attempt: int, backoff_base: float = 1.0) -> float:
+    """
+    Seconds to wait before retrying after `exc`.
+
+    Raises:
+        exc: for HTTP errors that are not worth retrying (4xx except 429)
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        if status == 429:
+            retry_after = exc.response.headers.get("Retry-After")
+            return float(retry_after) if retry_after else (backoff_base * (2**attempt))
+        if not 500 <= status < 600:
+            raise exc
+    return backoff_base * (2**attempt)
 
 
 async def request_with_retry(
@@ -8,32 +76,89 @@ async def request_with_retry(
     url: str,
     params: Optional[Dict[str, Any]] = None,
     headers: Optional[Dict[str, Any]] = None,
+    data: Optional[Any] = None,
     retries: int = 3,
-    timeout: int = 10,
+    timeout: Optional[float] = None,
+    client: Optional[httpx.AsyncClient] = None,
 ) -> httpx.Response:
+    """
+    Send a request, retrying connection errors, 5xx and 429 with backoff.
+    `timeout` (seconds) defaults to the client's timeout (`settings.http_timeout`).
+    """
+    client = client or get_http_client()
     last_exc = None
-    backoff_base = 1.0
     for attempt in range(retries):
+        record_upstream(attempts=1)
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                resp = await client.request(method, url, params=params, headers=headers)
-                resp.raise_for_status()
-                return resp
-        except httpx.HTTPStatusError as e:
+            resp = await client.request(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                json=data,
+                timeout=_request_timeout(timeout),
+            )
+            resp.raise_for_status()
+            # Wire bytes; responses built in-process (stubs, replay) only have a body
+            record_upstream(
+                bytes_fetched=resp.num_bytes_downloaded or len(resp.content)
+            )
+            return resp
+        except Exception as e:
             last_exc = e
-            status = e.response.status_code
-            if status == 429:
-                retry_after = e.response.headers.get("Retry-After")
-                wait = (
-                    float(retry_after) if retry_after else (backoff_base * (2**attempt))
-                )
-                await asyncio.sleep(wait)
-            else:
-                if 500 <= status < 600:
-                    await asyncio.sleep(backoff_base * (2**attempt))
-                else:
-                    raise
+            await asyncio.sleep(_retry_delay(e, attempt))
+    raise last_exc
+
+
+@asynccontextmanager
+async def stream_with_retry(
+    method: str,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, Any]] = None,
+    data: Optional[Any] = None,
+    retries: int = 3,
+    timeout: Optional[float] = None,
+    client: Optional[httpx.AsyncClient] = None,
+) -> AsyncIterator[httpx.Response]:
+    """
+    Like `request_with_retry`, but yields the response before its body is
+    read (`aiter_bytes()` etc.). Only establishing the response is retried;
+    errors while reading the body propagate to the caller. The response is
+    closed when the context exits.
+
+    Attempts and the body bytes read are added to the current search timings
+    (see `src.utils.timing`), as in `request_with_retry`.
+    """
+    client = client or get_http_client()
+    last_exc = None
+    for attempt in range(retries):
+        record_upstream(attempts=1)
+        request = client.build_request(
+            method,
+            url,
+            params=params,
+            headers=headers,
+            json=data,
+            timeout=_request_timeout(timeout),
+        )
+        try:
+            resp = await client.send(request, stream=True)
         except Exception as e:
             last_exc = e
-            await asyncio.sleep(backoff_base * (2**attempt))
+            await asyncio.sleep(_retry_delay(e, attempt))
+            continue
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            await resp.aclose()
+            last_exc = e
+            await asyncio.sleep(_retry_delay(e, attempt))
+            continue
+        try:
+            yield resp
+        finally:
+            record_upstream(bytes_fetched=resp.num_bytes_downloaded)
+            await resp.aclose()
+        return
     raise last_exc
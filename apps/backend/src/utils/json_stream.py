@@ -0,0 +1,91 @@
+"""
+Incremental parsing of the records array out of a streamed JSON body.
+
+Items are decoded as their bytes arrive, so memory holds roughly one network
+chunk plus the items decoded from it, never the whole payload. Requires
+ijson; `json_stream_available()` is False without it.
+"""
+
+from typing import Any, AsyncIterator, List, Tuple
+
+try:
+    import ijson
+except ImportError:  # optional dependency
+    ijson = None
+
+# Items of a top level array; other prefixes end with ".item"
+TOP_LEVEL_ITEMS = "item"
+
+
+def json_stream_available() -> bool:
+    return ijson is not None
+
+
+async def _prepend(
+    head: List[bytes], chunks: AsyncIterator[bytes]
+) -> AsyncIterator[bytes]:
+    for chunk in head:
+        yield chunk
+    async for chunk in chunks:
+        yield chunk
+
+
+async def peek_array(
+    chunks: AsyncIterator[bytes], prefix: str
+) -> Tuple[bool, AsyncIterator[bytes]]:
+    """
+    Whether the items at `prefix` are those of an array, from the body read
+    up to the start of the value that holds them.
+
+    Only an array can be streamed item by item: an object there is a single
+    record, and the records of a top level object depend on its keys (see
+    `unwrap_records`), so any other value has to be parsed whole.
+
+    Args:
+        prefix: ijson prefix of the items ("item", "data.item", ...)
+
+    Returns:
+        (is an array, the chunks again, including those already read)
+
+    Raises:
+        ijson.JSONError: if the body read so far is not valid JSON
+    """
+    # Path of the value holding the items: "" (top level) for "item"
+    container = prefix[: -len(TOP_LEVEL_ITEMS)].rstrip(".")
+    events = ijson.sendable_list()
+    parser = ijson.parse_coro(events)
+    head: List[bytes] = []
+    async for chunk in chunks:
+        head.append(chunk)
+        parser.send(chunk)
+        for path, event, _ in events:
+            if path == container:
+                return event == "start_array", _prepend(head, chunks)
+        del events[:]
+    return False, _prepend(head, chunks)
+
+
+async def iter_json_items(
+    chunks: AsyncIterator[bytes], prefix: str
+) -> AsyncIterator[List[Any]]:
+    """
+    Batches of the items found at `prefix` as body chunks arrive.
+
+    Args:
+        chunks: Raw body bytes, e.g. `httpx.Response.aiter_bytes()`
+        prefix: ijson prefix of the array items ("item", "data.item", ...)
+
+    Raises:
+        ijson.JSONError: if the body is not valid JSON
+    """
+    items = ijson.sendable_list()
+    # Floats instead of Decimals, like json.loads
+    parser = ijson.items_coro(items, prefix, use_float=True)
+    async for chunk in chunks:
+        parser.send(chunk)
+        if items:
+            yield list(items)
+            del items[:]
+    parser.close()
+    if items:
+        yield list(items)
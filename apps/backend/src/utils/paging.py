@@ -0,0 +1,83 @@
+import base64
+import heapq
+import json
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def _sort_key(
+    getter: Callable[[Any], Any], descending: bool
+) -> Callable[[Any], Tuple[bool, Any]]:
+    """
+    Key that keeps items without a value last in both directions.
+    Missing values compare equal to each other through a 0 placeholder.
+    """
+    if descending:
+        return lambda item: (
+            (False, 0) if (value := getter(item)) is None else (True, value)
+        )
+    return lambda item: (True, 0) if (value := getter(item)) is None else (False, value)
+
+
+def _str_fallback(getter: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    # Mixed value types (e.g. numbers and strings) cannot be ordered natively
+    def get(item: Any) -> Any:
+        value = getter(item)
+        return None if value is None else str(value)
+
+    return get
+
+
+def sort_window(
+    items: List[Dict[str, Any]],
+    getter: Callable[[Any], Any],
+    descending: bool = False,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Ordered items[offset:offset + limit].
+
+    With a limit only the first offset + limit items are selected with a heap
+    (heapq.nsmallest / nlargest, O(n log k)) instead of sorting everything.
+    """
+    for key_getter in (getter, _str_fallback(getter)):
+        key = _sort_key(key_getter, descending)
+        try:
+            if limit is None:
+                ordered = sorted(items, key=key, reverse=descending)
+            else:
+                select = heapq.nlargest if descending else heapq.nsmallest
+                ordered = select(offset + limit, items, key=key)
+            return ordered[offset:]
+        except TypeError:
+            continue
+    return []
+
+
+def window(
+    items: Iterable[Dict[str, Any]], limit: Optional[int] = None, offset: int = 0
+) -> Iterable[Dict[str, Any]]:
+    """Unordered items[offset:offset + limit], lazily for iterators."""
+    if isinstance(items, list):
+        return items[offset : offset + limit if limit is not None else None]
+    return islice(items, offset, offset + limit if limit is not None else None)
+
+
+def encode_cursor(offset: int) -> str:
+    """Opaque cursor pointing at `offset` in a result set."""
+    return base64.urlsafe_b64encode(json.dumps({"o": offset}).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Raises:
+        ValueError: if the cursor was not produced by `encode_cursor`
+    """
+    try:
+        offset = json.loads(base64.urlsafe_b64decode(cursor.encode()))["o"]
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError("Invalid cursor")
+    return offset
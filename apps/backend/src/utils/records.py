@@ -0,0 +1,76 @@
+"""
+Locating the list of records inside an upstream response body.
+
+A source may declare `records_path`, a JMESPath expression such as
+`data` or `result.items`, pointing at its records. Without one the
+common envelope shapes are recognised (see `unwrap_records`).
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+from src.utils.expressions import compile_getter, object_path_steps
+
+RecordsExtractor = Callable[[Any], List[Dict[str, Any]]]
+
+
+def unwrap_records(raw: Any) -> List[Dict[str, Any]]:
+    """
+    Items of an upstream payload. Handles common API response patterns:
+    1. Direct list response
+    2. Data wrapped in 'data' field
+    3. Single object response
+    4. Empty response
+    """
+    if isinstance(raw, list):
+        return raw
+    elif isinstance(raw, dict):
+        if "data" in raw and raw["data"] is not None:
+            data = raw["data"]
+            return data if isinstance(data, list) else [data]
+        elif raw:  # Non-empty dict
+            return [raw]
+
+    return []  # Fallback for null/empty responses
+
+
+def compile_records(records_path: Optional[str]) -> RecordsExtractor:
+    """
+    Build the records extractor of a source.
+
+    Args:
+        records_path: JMESPath to the records; a list is used as is, a single
+            object becomes one record and anything else (missing path, scalar,
+            invalid expression) yields no records. None uses `unwrap_records`.
+    """
+    if not records_path:
+        return unwrap_records
+
+    value_of = compile_getter(records_path)
+
+    def records(raw: Any) -> List[Dict[str, Any]]:
+        value = value_of(raw)
+        if isinstance(value, list):
+            return value
+        if isinstance(value, dict):
+            return [value]
+        return []
+
+    return records
+
+
+def records_prefix(records_path: str) -> Optional[str]:
+    """
+    ijson prefix of the items of the array at `records_path`, so a streamed
+    body can be read straight from that array and the rest of the envelope
+    is skipped without being built. When the value there turns out not to be
+    an array, the body is parsed whole instead (see `peek_array`).
+
+    Returns:
+        "data.item" for "data", "item" for "@", or None when the path is not
+        a plain chain of object keys (it can only be evaluated on a parsed body)
+    """
+    if records_path.strip() == "@":
+        return "item"
+    steps = object_path_steps(records_path)
+    if steps is None:
+        return None
+    return ".".join([*steps, "item"])
@@ -0,0 +1,149 @@
+import json
+import math
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # optional dependency, falls back to the stdlib encoder
+    orjson = None
+
+# Keys of UnifiedSearchItem, in response order
+UNIFIED_ITEM_FIELDS = ("id", "name", "url", "price", "raw")
+
+
+def _finite(value: Any) -> Any:
+    """Copy of `value` with NaN/Infinity floats replaced by None."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(v) for v in value]
+    return value
+
+
+def _stdlib_dumps(content: Any) -> str:
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+        allow_nan=False,
+    )
+
+
+if orjson is not None:
+    # Datetimes and dataclasses go through `default` too, so they become
+    # str() like with the stdlib encoder instead of orjson's own formats
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize JSON-compatible data to bytes (orjson when installed).
+
+    Both encoders decode to the same data: values JSON has no type for
+    (Decimal, datetime, ...) become str(), and NaN/Infinity null. The bytes
+    may differ in float notation (orjson writes 1e16 and 1e-7 where the
+    stdlib writes 1e+16 and 1e-07). Content orjson cannot encode, such as
+    integers beyond 64 bits, is encoded by the stdlib.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(content, default=str, option=_ORJSON_OPTIONS)
+        except TypeError:  # orjson.JSONEncodeError is a TypeError
+            pass
+    try:
+        return _stdlib_dumps(content).encode("utf-8")
+    except ValueError:
+        # Out-of-range floats; rare, so only then is the content copied
+        return _stdlib_dumps(_finite(content)).encode("utf-8")
+
+
+def output_fields(
+    fields: Optional[Sequence[str]] = None, include_raw: bool = True
+) -> Tuple[str, ...]:
+    """
+    Keys returned per item for a field projection (id is always included).
+    """
+    return tuple(
+        field
+        for field in UNIFIED_ITEM_FIELDS
+        if field == "id"
+        or (field == "raw" and include_raw)
+        or (field != "raw" and (fields is None or field in fields))
+    )
+
+
+def _as_str(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return None
+
+
+def _as_float(value: Any) -> Optional[float]:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _as_dict(value: Any) -> Optional[Dict[str, Any]]:
+    return value if isinstance(value, dict) else None
+
+
+# How each UnifiedSearchItem field is brought to its declared type
+_FIELD_TYPES: Dict[str, Callable[[Any], Any]] = {
+    "id": lambda value: _as_str(value) or "",
+    "name": _as_str,
+    "url": _as_str,
+    "price": _as_float,
+    "raw": _as_dict,
+}
+
+
+def to_unified_dict(
+    item: Dict[str, Any], fields: Tuple[str, ...] = UNIFIED_ITEM_FIELDS
+) -> Dict[str, Any]:
+    """
+    Project an internally built search result onto the UnifiedSearchItem keys.
+
+    Mapped values come from upstream data, so instead of a pydantic validation
+    pass each field is brought to the schema's type here: numbers become
+    strings for the string fields, numbers and numeric strings become floats
+    for price, and values that cannot be converted (e.g. an object mapped to
+    name) become null.
+    """
+    return {field: _FIELD_TYPES[field](item.get(field)) for field in fields}
+
+
+def unified_results(
+    items: Iterable[Dict[str, Any]], fields: Tuple[str, ...] = UNIFIED_ITEM_FIELDS
+) -> Dict[str, Any]:
+    return {"results": [to_unified_dict(item, fields) for item in items]}
+
+
+class FastJSONResponse(Response):
+    """
+    JSON response serialized straight to bytes.
+
+    Returning it from a route skips FastAPI's response_model validation and
+    jsonable_encoder pass, so only use it for trusted, JSON-compatible content;
+    search items are brought to the response schema by `to_unified_dict`.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
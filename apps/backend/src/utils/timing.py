@@ -0,0 +1,169 @@
+"""
+Per-stage instrumentation of searches.
+
+A `SearchTimings` is created for each search (see `SearchService.iter_results`)
+and collects monotonic durations of the pipeline stages together with item
+counts. While the upstream is fetched it is also the current timings of the
+context, so `request_with_retry` / `stream_with_retry` can add their attempts
+and downloaded bytes without it being passed down explicitly.
+
+Each finished search is added to `search_metrics`, per source histograms of
+stage durations, and its timings are sent back in the `Server-Timing` header.
+"""
+
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+# Pipeline stages, in order
+STAGES: Tuple[str, ...] = ("fetch", "filter", "map", "decorate")
+COUNTERS: Tuple[str, ...] = (
+    "records",  # records read from the upstream
+    "matched",  # records that passed the backend filters
+    "results",  # mapped items returned
+    "bytes",  # upstream body bytes downloaded
+    "attempts",  # upstream requests sent, retries included
+)
+
+# Upper bounds (ms) of the stage duration histogram buckets; the last bucket is +Inf
+BUCKET_BOUNDS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class SearchTimings:
+    """
+    Stage durations (ns) and counters of one search.
+
+    Stages other than STAGES (e.g. "serialize", added by the router) are
+    reported in the Server-Timing header but not aggregated.
+    """
+
+    __slots__ = ("source_id", "durations_ns", "counters", "upstream_complete")
+
+    def __init__(self, source_id: Optional[str] = None):
+        self.source_id = source_id
+        self.durations_ns: Dict[str, int] = dict.fromkeys(STAGES, 0)
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        # False when a paginated / streamed upstream was not read to the end
+        # (enough items matched, or a page failed): fetch only covers a part
+        self.upstream_complete = True
+
+    def add_time(self, stage: str, elapsed_ns: int) -> None:
+        self.durations_ns[stage] = self.durations_ns.get(stage, 0) + elapsed_ns
+
+    def count(self, counter: str, n: int = 1) -> None:
+        self.counters[counter] += n
+
+    def durations_ms(self) -> Dict[str, float]:
+        return {stage: ns / 1_000_000 for stage, ns in self.durations_ns.items()}
+
+    def server_timing(self, stages: Optional[Tuple[str, ...]] = None) -> str:
+        """
+        `Server-Timing` header value, e.g.
+        fetch;dur=12.4;desc="records=100 bytes=20480 attempts=1",
+        filter;dur=0.8;desc="in=100 out=7", map;dur=0.1;desc="items=7", decorate;dur=0.0
+
+        Args:
+            stages: Stages to include (all recorded stages when None), e.g.
+                only fetch and filter for a response streamed before mapping
+        """
+        c = self.counters
+        descriptions = {
+            "fetch": f"records={c['records']} bytes={c['bytes']} attempts={c['attempts']}",
+            "filter": f"in={c['records']} out={c['matched']}",
+            "map": f"items={c['results']}",
+        }
+        metrics: List[str] = []
+        for stage, ms in self.durations_ms().items():
+            if stages is not None and stage not in stages:
+                continue
+            metric = f"{stage};dur={ms:.3f}"
+            if stage in descriptions:
+                metric += f';desc="{descriptions[stage]}"'
+            metrics.append(metric)
+        return ", ".join(metrics)
+
+
+current_timings: ContextVar[Optional[SearchTimings]] = ContextVar(
+    "current_timings", default=None
+)
+
+
+def record_upstream(attempts: int = 0, bytes_fetched: int = 0) -> None:
+    """Add upstream attempts / downloaded bytes to the current search, if any."""
+    timings = current_timings.get()
+    if timings is not None:
+        timings.counters["attempts"] += attempts
+        timings.counters["bytes"] += bytes_fetched
+
+
+class _Histogram:
+    __slots__ = ("buckets", "count", "sum")
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = 0
+        while index < len(BUCKET_BOUNDS_MS) and value > BUCKET_BOUNDS_MS[index]:
+            index += 1
+        self.buckets[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Cumulative bucket counts keyed by upper bound, like Prometheus."""
+        cumulative: Dict[str, int] = {}
+        running = 0
+        for bound, n in zip([*map(str, BUCKET_BOUNDS_MS), "+Inf"], self.buckets):
+            running += n
+            cumulative[bound] = running
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum, 3),
+            "buckets_ms": cumulative,
+        }
+
+
+class SearchMetrics:
+    """Process-wide histograms of stage durations and counter totals, per source."""
+
+    def __init__(self):
+        self._histograms: Dict[str, Dict[str, _Histogram]] = {}
+        self._totals: Dict[str, Dict[str, int]] = {}
+
+    def observe(self, timings: SearchTimings) -> None:
+        source = str(timings.source_id)
+        histograms = self._histograms.get(source)
+        if histograms is None:
+            histograms = self._histograms[source] = {s: _Histogram() for s in STAGES}
+            self._totals[source] = dict.fromkeys(COUNTERS, 0)
+        durations = timings.durations_ms()
+        for stage in STAGES:
+            histograms[stage].observe(durations[stage])
+        totals = self._totals[source]
+        for counter, n in timings.counters.items():
+            totals[counter] += n
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns:
+            {"<source_id>": {"searches": 12,
+                             "stages": {"fetch": {"count", "sum_ms", "buckets_ms"}, ...},
+                             "totals": {"records": ..., "bytes": ..., ...}}}
+        """
+        return {
+            source: {
+                "searches": histograms["fetch"].count,
+                "stages": {s: h.snapshot() for s, h in histograms.items()},
+                "totals": dict(self._totals[source]),
+            }
+            for source, histograms in self._histograms.items()
+        }
+
+    def clear(self) -> None:
+        self._histograms.clear()
+        self._totals.clear()
+
+
+search_metrics = SearchMetrics()
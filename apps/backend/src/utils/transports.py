@@ -0,0 +1,257 @@
+"""
+Pluggable httpx transports for the shared upstream client.
+
+- passthrough: the pooled network transport (normal operation)
+- record: forwards to the network and saves every response to a gzipped
+  fixture file keyed by the request
+- replay: answers from recorded fixtures only, with optional injected
+  latency and error rate, so the full /search path runs without network
+
+The mode is chosen with `settings.upstream_transport` (see `build_transport`).
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import random
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+import httpx
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Response headers that describe the stored body, not the recorded one
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+# Query params that carry credentials; their values are neither hashed nor saved
+_CREDENTIAL_PARAMS = {
+    "access_token",
+    "api_key",
+    "apikey",
+    "appid",
+    "auth",
+    "key",
+    "password",
+    "secret",
+    "sig",
+    "signature",
+    "token",
+}
+_REDACTED = "[redacted]"
+
+
+def pooled_transport() -> httpx.AsyncHTTPTransport:
+    """
+    Network transport with the HTTP pool settings.
+    HTTP/2 needs the optional `h2` package (`pip install httpx[http2]`).
+    """
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+    return httpx.AsyncHTTPTransport(limits=limits, http2=settings.http2)
+
+
+def redacted_params(request: httpx.Request) -> List[Tuple[str, str]]:
+    """Query params of a request with the values of credential params masked."""
+    return [
+        (name, _REDACTED if name.lower() in _CREDENTIAL_PARAMS else value)
+        for name, value in request.url.params.multi_items()
+    ]
+
+
+def request_key(request: httpx.Request) -> str:
+    """
+    Fixture key of a request: method, URL with sorted query params and body.
+    Headers and the values of credential query params (api_key, token, ...)
+    are left out, so credentials never influence (or leak into) the key.
+    """
+    url = request.url.copy_with(query=None)
+    params = sorted(redacted_params(request))
+    payload = json.dumps([request.method.upper(), str(url), params])
+    digest = hashlib.sha256(payload.encode())
+    digest.update(request.content)
+    return digest.hexdigest()
+
+
+def _is_transient(status_code: int) -> bool:
+    return status_code >= 500 or status_code == 429
+
+
+class FixtureStore:
+    """
+    Recorded responses as `<key>.json.gz` files in one directory.
+    Credential query params are saved redacted, and headers of the request
+    are not saved at all.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}.json.gz"
+
+    def save(self, request: httpx.Request, status_code: int, headers, body: bytes):
+        try:
+            entry: Dict[str, Any] = {"body": body.decode("utf-8")}
+        except UnicodeDecodeError:
+            entry = {"body_base64": base64.b64encode(body).decode("ascii")}
+        entry.update(
+            method=request.method,
+            url=str(request.url.copy_with(query=None)),
+            params=redacted_params(request),
+            status_code=status_code,
+            headers=[
+                [name, value]
+                for name, value in headers.multi_items()
+                if name.lower() not in _DROPPED_HEADERS
+            ],
+        )
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Written aside and renamed over the fixture, so a concurrent load or
+        # an interrupted write never sees a truncated file
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw:
+                with gzip.open(raw, "wt", encoding="utf-8") as f:
+                    json.dump(entry, f)
+            os.replace(tmp_path, self.path(request_key(request)))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self, request: httpx.Request) -> Optional[httpx.Response]:
+        path = self.path(request_key(request))
+        if not path.exists():
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            entry = json.load(f)
+        if "body_base64" in entry:
+            body = base64.b64decode(entry["body_base64"])
+        else:
+            body = entry["body"].encode("utf-8")
+        return httpx.Response(
+            entry["status_code"],
+            headers=entry["headers"],
+            content=body,
+            request=request,
+        )
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """
+    Forwards requests to `inner` and records each response in `store`.
+    Transient failures (5xx, 429) are passed through but not recorded, so
+    they never replace a good recording or get replayed forever.
+    """
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, store: FixtureStore):
+        self.inner = inner
+        self.store = store
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.inner.handle_async_request(request)
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        if not _is_transient(response.status_code):
+            await asyncio.to_thread(
+                self.store.save, request, response.status_code, response.headers, body
+            )
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in _DROPPED_HEADERS
+        ]
+        return httpx.Response(response.status_code, headers=headers, content=body)
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Serves recorded responses without touching the network.
+
+    Args:
+        store: Where the recordings live
+        latency_ms: Delay added to every response
+        jitter_ms: Extra uniform random delay in [0, jitter_ms]
+        error_rate: Fraction (0.0-1.0) of requests answered with `error_status`
+        error_status: Status of injected errors (5xx/429 exercise the retries)
+        seed: Seed of the latency/error randomness, for reproducible runs
+
+    Requests without a recording get a 404, like an unknown endpoint.
+    """
+
+    def __init__(
+        self,
+        store: FixtureStore,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+    ):
+        self.store = store
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        delay_ms = self.latency_ms + self._random.uniform(0, self.jitter_ms)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+        if self.error_rate > 0 and self._random.random() < self.error_rate:
+            return httpx.Response(
+                self.error_status,
+                json={"error": "Injected replay error"},
+                request=request,
+            )
+
+        response = await asyncio.to_thread(self.store.load, request)
+        if response is None:
+            logger.warning(
+                "No recorded response for %s %s", request.method, request.url
+            )
+            return httpx.Response(
+                404, json={"error": "No recorded response"}, request=request
+            )
+        return response
+
+
+def build_transport(mode: Optional[str] = None) -> httpx.AsyncBaseTransport:
+    """
+    Transport for the shared upstream client.
+
+    Args:
+        mode: "passthrough", "record" or "replay"; defaults to
+            `settings.upstream_transport`
+    """
+    mode = mode or settings.upstream_transport
+    if mode == "passthrough":
+        return pooled_transport()
+    store = FixtureStore(settings.upstream_fixtures_dir)
+    if mode == "record":
+        return RecordingTransport(pooled_transport(), store)
+    if mode == "replay":
+        return ReplayTransport(
+            store,
+            latency_ms=settings.upstream_replay_latency_ms,
+            jitter_ms=settings.upstream_replay_jitter_ms,
+            error_rate=settings.upstream_replay_error_rate,
+            error_status=settings.upstream_replay_error_status,
+            seed=settings.upstream_replay_seed,
+        )
+    raise ValueError(f"Unknown upstream transport mode: {mode!r}")
@@ -0,0 +1,31 @@
+import os
+import tempfile
+
+# The app reads its settings at import time: run the tests against a scratch
+# SQLite database and dummy credentials, never a configured environment
+_DB_PATH = os.path.join(tempfile.gettempdir(), "openlense_tests.db")
+if os.path.exists(_DB_PATH):
+    os.remove(_DB_PATH)
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_PATH}"
+os.environ["DB_TYPE"] = "sqlite"
+os.environ["DEBUG"] = "false"
+os.environ.setdefault("CMC_API_KEY", "test")
+
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+
+
+@pytest.fixture
+def upstream():
+    """
+    Installs a stub upstream for the shared HTTP client: call it with an
+    `httpx.MockTransport` request handler.
+    """
+    from src.utils.http import set_http_client
+
+    def install(handler) -> None:
+        set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    yield install
+    set_http_client(None)
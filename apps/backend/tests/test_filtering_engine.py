@@ -0,0 +1,81 @@
+import random
+
+import jmespath
+import pytest
+
+from src.utils.filtering_engine import compile_filters, match_single
+
+DESCRIPTORS = [
+    {"key": "name", "type": "string"},
+    {"key": "symbol", "type": "string"},
+    {"key": "rank", "type": "number"},
+    {"key": "price", "type": "number", "path": "quote.USD.price"},
+    {"key": "active", "type": "boolean"},
+]
+
+CONDITIONS = [
+    {},
+    {"rank": {"gte": 10, "lte": 400}},
+    {"name": {"contains": ["bit", "coin"]}},
+    {"name": {"startswith": "Eth"}, "price": {"lt": 500}},
+    {"symbol": {"regex": "^[A-C]"}, "rank": {"neq": 3}},
+    {"symbol": "BTC"},
+    {"active": {"eq": True}, "price": {"gt": 1.5}},
+    {"price": {"gte": "100"}},  # numeric string operand
+    {"name": {"endswith": "7"}, "symbol": {"eq": None}},
+    {"rank": {"contains": "1"}},  # operator not allowed for numbers
+    {"name": {"bogus": 1}},  # unknown operator
+    {"unknown_field": {"eq": 1}},  # no descriptor
+]
+
+
+def make_items(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    names = ["Bitcoin", "Ethereum", "Dogecoin", "Cardano", "Solana", "Tronix"]
+    items = []
+    for i in range(count):
+        item = {
+            "name": f"{rng.choice(names)} {i}",
+            "symbol": rng.choice(["BTC", "ETH", "ADA", "SOL", None]),
+            "rank": rng.choice([i, None, str(i)]),
+            "active": rng.random() < 0.5,
+        }
+        if rng.random() < 0.9:
+            item["quote"] = {"USD": {"price": rng.choice([rng.uniform(0, 1000), None])}}
+        items.append(item)
+    return items
+
+
+def reference_filter(items, descriptors, conditions):
+    """Row-by-row filtering as the original engine did it, via match_single."""
+    out = []
+    for item in items:
+        for desc in descriptors:
+            if desc["key"] not in conditions:
+                continue
+            value = jmespath.search(desc.get("path") or desc["key"], item)
+            if not match_single(value, conditions[desc["key"]], desc["type"]):
+                break
+        else:
+            out.append(item)
+    return out
+
+
+@pytest.mark.parametrize("conditions", CONDITIONS)
+def test_compiled_plan_matches_reference(conditions):
+    items = make_items(500)
+    plan = compile_filters(DESCRIPTORS, conditions)
+    expected = reference_filter(items, DESCRIPTORS, conditions)
+
+    assert plan.apply(items, engine="row") == expected
+    assert list(plan.iter_matches(items)) == expected
+    assert [item for item in items if plan.matches(item)] == expected
+
+
+@pytest.mark.parametrize("conditions", CONDITIONS)
+def test_columnar_matches_row(conditions):
+    pytest.importorskip("numpy")
+    items = make_items(2_000, seed=1)
+    plan = compile_filters(DESCRIPTORS, conditions)
+
+    assert plan.apply(items, engine="columnar") == plan.apply(items, engine="row")
@@ -0,0 +1,24 @@
+import os
+import statistics
+
+import pytest
+
+from benchmarks.import_time import measure
+
+# Wall-clock budget (ms) of the cold app import; only checked when set, as
+# timings of shared CI machines vary too much for a fixed limit
+BUDGET_MS = os.environ.get("IMPORT_TIME_BUDGET_MS")
+
+
+@pytest.fixture(scope="module")
+def runs():
+    return [measure("src.main") for _ in range(3)]
+
+
+def test_app_import_loads_no_fixtures(runs):
+    assert all(run["fixtures_loaded"] == 0 for run in runs)
+
+
+@pytest.mark.skipif(not BUDGET_MS, reason="set IMPORT_TIME_BUDGET_MS to check")
+def test_app_import_within_budget(runs):
+    assert statistics.median(run["import_ms"] for run in runs) <= float(BUDGET_MS)
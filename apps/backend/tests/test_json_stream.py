@@ -0,0 +1,53 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("ijson")
+
+from src.utils.json_stream import iter_json_items, peek_array  # noqa: E402
+
+
+async def _chunks(body: bytes, size: int = 7):
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+def _stream(payload, prefix: str):
+    """(is_array, streamed items or None, whole body read back)"""
+
+    async def run():
+        is_array, chunks = await peek_array(
+            _chunks(json.dumps(payload).encode()), prefix
+        )
+        if not is_array:
+            return False, None, json.loads(b"".join([c async for c in chunks]))
+        items = []
+        async for batch in iter_json_items(chunks, prefix):
+            items.extend(batch)
+        return True, items, None
+
+    return asyncio.run(run())
+
+
+def test_array_at_prefix_is_streamed():
+    payload = {"meta": {"pages": [1, 2]}, "data": [{"a": i} for i in range(20)]}
+    assert _stream(payload, "data.item") == (True, payload["data"], None)
+
+
+def test_top_level_array_is_streamed():
+    payload = [{"a": i} for i in range(5)]
+    assert _stream(payload, "item") == (True, payload, None)
+
+
+@pytest.mark.parametrize(
+    "payload, prefix",
+    [
+        ({"data": {"a": 1}}, "data.item"),  # single object record
+        ({"data": 5}, "data.item"),
+        ({"other": []}, "data.item"),  # path missing
+        ({"data": [{"a": 1}]}, "item"),  # top level object, unwrapped by keys
+    ],
+)
+def test_non_arrays_are_read_whole(payload, prefix):
+    assert _stream(payload, prefix) == (False, None, payload)
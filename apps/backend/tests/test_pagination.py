@@ -0,0 +1,107 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.services.http_client import UpstreamIncomplete
+from src.services.pagination import iter_pages
+from src.services.request_builder import BuiltRequest
+from src.services.search import SearchService
+from src.types import PaginationDescriptor
+
+ROWS = [{"name": f"n{i}", "v": i} for i in range(250)]
+BASE = BuiltRequest(url="http://upstream/items", method="GET", params={}, headers={})
+
+
+def page_handler(failing_offsets=()):
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        if offset in failing_offsets:
+            return httpx.Response(400, json={"message": "bad page"})
+        size = int(request.url.params["limit"])
+        return httpx.Response(
+            200,
+            json={
+                "error": None,
+                "total": len(ROWS),
+                "data": ROWS[offset : offset + size],
+            },
+        )
+
+    return handler
+
+
+def service(**pagination):
+    return SearchService.from_source(
+        {
+            "id": "paged",
+            "endpoint": "http://upstream/items",
+            "method": "GET",
+            "mapping": {"name": "name"},
+            "backend_filters": [{"key": "v", "type": "number"}],
+            "pagination": {"type": "offset", "page_size": 100, **pagination},
+        }
+    )
+
+
+def search(svc, **kwargs):
+    async def run():
+        results = await svc.iter_results({}, {}, include_raw=False, **kwargs)
+        return [item["name"] for item in results], results.total, results.next_offset
+
+    return asyncio.run(run())
+
+
+def test_all_pages_are_read(upstream):
+    upstream(page_handler())
+    names, total, next_offset = search(service())
+    assert names == [row["name"] for row in ROWS]
+    assert (total, next_offset) == (250, None)
+
+
+def test_failed_page_reports_incomplete(upstream):
+    upstream(page_handler(failing_offsets={100}))
+    names, total, _ = search(service())
+    assert names == [row["name"] for row in ROWS[:100]]
+    assert total is None
+
+
+def test_failed_page_keeps_a_next_page(upstream):
+    upstream(page_handler(failing_offsets={100}))
+    names, total, next_offset = search(service(), limit=150)
+    assert len(names) == 100
+    assert (total, next_offset) == (None, 150)
+
+
+def test_max_pages_reports_incomplete(upstream):
+    upstream(page_handler())
+    names, total, _ = search(service(max_pages=2))
+    assert len(names) == 200
+    assert total is None
+
+
+def test_total_path_within_max_pages_is_complete(upstream):
+    upstream(page_handler())
+    names, total, _ = search(service(max_pages=3, total_path="total"))
+    assert len(names) == 250
+    assert total == 250
+
+
+@pytest.mark.parametrize("pagination_type", ["offset", "cursor"])
+def test_iter_pages_raises_at_the_page_limit(pagination_type):
+    async def fetch_page(req):
+        return {"data": [{"v": 1}] * 10, "next_cursor": "more"}, None
+
+    async def run():
+        pagination = PaginationDescriptor(
+            type=pagination_type, page_size=10, max_pages=3
+        )
+        pages = []
+        with pytest.raises(UpstreamIncomplete):
+            async for items in iter_pages(
+                pagination, BASE, fetch_page, lambda payload: payload["data"]
+            ):
+                pages.append(items)
+        return pages
+
+    assert len(asyncio.run(run())) == 3
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from src.services import response_cache as module
+from src.services.response_cache import ResponseCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def counting_fetch():
+    calls = []
+
+    async def fetch():
+        calls.append(len(calls) + 1)
+        return {"version": len(calls)}
+
+    return fetch, calls
+
+
+def test_fresh_entries_are_served_from_memory(clock):
+    fetch, calls = counting_fetch()
+    cache = ResponseCache()
+
+    async def run():
+        first = await cache.get_or_fetch("k", fetch, ttl=10)
+        clock[0] += 5
+        return first, await cache.get_or_fetch("k", fetch, ttl=10)
+
+    first, second = asyncio.run(run())
+    assert first == second == {"version": 1}
+    assert calls == [1]
+    assert cache.stats()["hits"] == 1
+
+
+def test_stale_entry_is_served_while_refreshed_in_background(clock):
+    fetch, calls = counting_fetch()
+    cache = ResponseCache()
+
+    async def run():
+        await cache.get_or_fetch("k", fetch, ttl=10, stale=30)
+        clock[0] += 15
+        stale = await cache.get_or_fetch("k", fetch, ttl=10, stale=30)
+        # A second stale read does not start another refresh
+        again = await cache.get_or_fetch("k", fetch, ttl=10, stale=30)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        refreshed = await cache.get_or_fetch("k", fetch, ttl=10, stale=30)
+        return stale, again, refreshed
+
+    stale, again, refreshed = asyncio.run(run())
+    assert stale == again == {"version": 1}
+    assert refreshed == {"version": 2}
+    assert calls == [1, 2]
+    assert cache.stats()["stale_hits"] == 2
+
+
+def test_expired_entry_is_fetched_again(clock):
+    fetch, calls = counting_fetch()
+    cache = ResponseCache()
+
+    async def run():
+        await cache.get_or_fetch("k", fetch, ttl=10, stale=30)
+        clock[0] += 41
+        return await cache.get_or_fetch("k", fetch, ttl=10, stale=30)
+
+    assert asyncio.run(run()) == {"version": 2}
+    assert calls == [1, 2]
+
+
+def test_uncacheable_values_are_not_stored(clock):
+    fetch, calls = counting_fetch()
+    cache = ResponseCache()
+
+    async def run():
+        for _ in range(2):
+            await cache.get_or_fetch("k", fetch, ttl=10, cacheable=lambda v: False)
+
+    asyncio.run(run())
+    assert calls == [1, 2]
+    assert cache.stats()["size"] == 0
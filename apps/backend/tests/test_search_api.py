@@ -0,0 +1,137 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.db.database import init_db
+from src.main import app
+from src.utils.paging import decode_cursor
+
+ROWS = [
+    {"name": f"coin {i}", "rank": (i * 37) % 100, "price": i * 1.5 if i % 7 else None}
+    for i in range(100)
+]
+
+SOURCE = {
+    "name": "stub",
+    "endpoint": "http://upstream/listings",
+    "method": "GET",
+    "mapping": {"name": "name", "price": "price"},
+    "backend_filters": [
+        {"key": "rank", "type": "number"},
+        {"key": "name", "type": "string"},
+    ],
+}
+
+
+@pytest.fixture
+def call(upstream):
+    """Runs `scenario(client, source_id)` against the app with a stub upstream."""
+    upstream(lambda request: httpx.Response(200, json={"data": ROWS}))
+
+    def run(scenario):
+        async def main():
+            await init_db()
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://app"
+            ) as client:
+                resp = await client.post("/sources/", json=SOURCE)
+                assert resp.status_code == 201, resp.text
+                return await scenario(client, resp.json()["id"])
+
+        return asyncio.run(main())
+
+    return run
+
+
+def test_sorted_search_pages_through_cursors(call):
+    body = {
+        "filters": {"default_filters": {"rank": {"lt": 50}}},
+        "sort": {"field": "rank", "order": "desc"},
+        "limit": 20,
+        "include_raw": True,
+    }
+
+    async def scenario(client, source_id):
+        pages, cursor = [], None
+        while True:
+            resp = await client.post(
+                f"/search/{source_id}", json={**body, "cursor": cursor}
+            )
+            assert resp.status_code == 200, resp.text
+            pages.append(resp.json())
+            cursor = resp.json()["next_cursor"]
+            if cursor is None:
+                return pages
+
+    pages = call(scenario)
+    expected = sorted(
+        (row for row in ROWS if row["rank"] < 50), key=lambda r: -r["rank"]
+    )
+    ranks = [item["raw"]["rank"] for page in pages for item in page["results"]]
+    assert ranks == [row["rank"] for row in expected]
+    assert [len(page["results"]) for page in pages] == [20, 20, 10]
+    assert all(page["total"] == 50 for page in pages)
+
+
+def test_cursor_points_at_the_next_offset(call):
+    async def scenario(client, source_id):
+        resp = await client.post(
+            f"/search/{source_id}", json={"limit": 30, "offset": 10}
+        )
+        return resp.json()
+
+    page = call(scenario)
+    assert [item["name"] for item in page["results"]] == [
+        row["name"] for row in ROWS[10:40]
+    ]
+    assert decode_cursor(page["next_cursor"]) == 40
+
+
+def test_invalid_cursor_is_rejected(call):
+    async def scenario(client, source_id):
+        return await client.post(f"/search/{source_id}", json={"cursor": "nope"})
+
+    assert call(scenario).status_code == 400
+
+
+@pytest.mark.parametrize(
+    "params, headers",
+    [({"stream": "true"}, {}), ({}, {"accept": "application/x-ndjson"})],
+)
+def test_ndjson_streams_one_item_per_line(call, params, headers):
+    body = {
+        "filters": {"default_filters": {"name": {"contains": "1"}}},
+        "fields": ["name", "price"],
+        "include_raw": False,
+    }
+
+    async def scenario(client, source_id):
+        return await client.post(
+            f"/search/{source_id}", json=body, params=params, headers=headers
+        )
+
+    resp = call(scenario)
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    expected = [row for row in ROWS if "1" in row["name"]]
+    assert [line["name"] for line in lines] == [row["name"] for row in expected]
+    assert [line["price"] for line in lines] == [row["price"] for row in expected]
+    assert all(set(line) == {"id", "name", "price"} for line in lines)
+
+
+def test_ndjson_matches_json_results(call):
+    body = {"filters": {"default_filters": {"rank": {"gte": 90}}}}
+
+    async def scenario(client, source_id):
+        streamed = await client.post(
+            f"/search/{source_id}", json=body, params={"stream": "true"}
+        )
+        buffered = await client.post(f"/search/{source_id}", json=body)
+        return streamed, buffered
+
+    streamed, buffered = call(scenario)
+    lines = [json.loads(line) for line in streamed.text.splitlines()]
+    assert lines == buffered.json()["results"]
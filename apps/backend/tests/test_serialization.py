@@ -0,0 +1,77 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from src.utils import serialization
+from src.utils.serialization import dumps, to_unified_dict
+
+CONTENT = {
+    "supply": 10**24,
+    "at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    "amount": Decimal("1.50"),
+    "id": UUID("12345678-1234-5678-1234-567812345678"),
+    "nan": float("nan"),
+    "nested": [{"inf": float("inf"), "name": "ü"}],
+    1: "non-str key",
+}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+def test_dumps_encodes_upstream_values(encoder):
+    assert json.loads(dumps(CONTENT)) == {
+        "supply": 10**24,
+        "at": "2024-01-02 03:04:05+00:00",
+        "amount": "1.50",
+        "id": "12345678-1234-5678-1234-567812345678",
+        "nan": None,
+        "nested": [{"inf": None, "name": "ü"}],
+        "1": "non-str key",
+    }
+
+
+def test_dumps_same_bytes_with_and_without_orjson(monkeypatch):
+    pytest.importorskip("orjson")
+    content = {k: v for k, v in CONTENT.items() if k != "supply"}
+    with_orjson = dumps(content)
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert dumps(content) == with_orjson
+
+
+def test_to_unified_dict_coerces_to_schema_types():
+    item = {
+        "id": 7,
+        "name": 42,
+        "url": {"not": "a string"},
+        "price": "45000.5",
+        "raw": ["not", "a", "dict"],
+        "extra": "dropped",
+    }
+    assert to_unified_dict(item) == {
+        "id": "7",
+        "name": "42",
+        "url": None,
+        "price": 45000.5,
+        "raw": None,
+    }
+
+
+def test_to_unified_dict_drops_unconvertible_price():
+    assert to_unified_dict({"id": "a", "price": "n/a"}, ("id", "price")) == {
+        "id": "a",
+        "price": None,
+    }
+    assert to_unified_dict({"id": "a", "price": True}, ("id", "price")) == {
+        "id": "a",
+        "price": None,
+    }
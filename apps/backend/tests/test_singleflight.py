@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from src.utils.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_call():
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"calls": calls}
+
+    async def run():
+        flights = SingleFlight()
+        results = await asyncio.gather(*(flights.do("k", fetch) for _ in range(5)))
+        assert flights.in_flight() == 0
+        # Finished calls are not reused
+        results.append(await flights.do("k", fetch))
+        return results
+
+    results = asyncio.run(run())
+    assert calls == 2
+    assert all(result is results[0] for result in results[:5])
+    assert results[5] == {"calls": 2}
+
+
+def test_error_is_shared_by_all_waiters():
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    async def run():
+        flights = SingleFlight()
+        return await asyncio.gather(
+            *(flights.do("k", fail) for _ in range(3)), return_exceptions=True
+        )
+
+    errors = asyncio.run(run())
+    assert all(isinstance(e, RuntimeError) for e in errors)
+
+
+def test_call_survives_until_the_last_waiter_is_cancelled():
+    async def run():
+        flights = SingleFlight()
+        finished = []
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            finished.append(True)
+            return "value"
+
+        first = asyncio.create_task(flights.do("k", fetch))
+        second = asyncio.create_task(flights.do("k", fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        assert await second == "value"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        only = asyncio.create_task(flights.do("other", fetch))
+        await asyncio.sleep(0.01)
+        only.cancel()
+        await asyncio.sleep(0.06)
+        return finished, flights.in_flight()
+
+    finished, in_flight = asyncio.run(run())
+    # The abandoned "other" call was cancelled, not run to completion
+    assert finished == [True]
+    assert in_flight == 0